@@ -0,0 +1,73 @@
+"""
+Benchmark: dict -> DroidCsvModel conversion through Cast.
+
+The rows of tests/data/droid_results.csv are repeated up to --rows and converted with the former
+per-call reflection (mro, fields, list.index per key), with the cached cast plan per row and with
+the bulk Cast.many() into instances and into columns.
+
+    python -m benchmarks.bench_cast --rows 1000000
+"""
+import argparse
+import csv
+import itertools
+import os
+import time
+from dataclasses import fields
+
+from design_pattern.models import DroidCsvModel
+from design_pattern.utils import Cast
+
+CSV_FNAME = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'droid_results.csv')
+
+
+def legacy_from_dict(kls, dto: dict):
+    # the conversion as it was done before the cast plans, kept here for comparison
+    kls = kls.mro()[0]
+    valid_dic = {}
+    fields_ = fields(kls)
+    fields_list_lower = [f.name.lower() for f in fields(kls)]
+    for k, value in dto.items():
+        index = fields_list_lower.index(k.lower())
+        if value is not None and value != '' and value.lower() not in ('null', 'none'):
+            valid_dic[fields_[index].name] = Cast(value, fields_[index].type)
+    return kls(**valid_dic)
+
+
+def read_rows(count: int) -> list[dict]:
+    with open(CSV_FNAME, newline="") as f:
+        rows = list(csv.DictReader(f))
+    return list(itertools.islice(itertools.cycle(rows), count))
+
+
+def run(name: str, rows: list[dict], convert) -> None:
+    start = time.perf_counter()
+    for row in rows:
+        convert(row)
+    report(name, rows, start)
+
+
+def run_many(name: str, rows: list[dict], columns: bool) -> None:
+    start = time.perf_counter()
+    Cast.many(rows, DroidCsvModel, columns=columns)
+    report(name, rows, start)
+
+
+def report(name: str, rows: list[dict], start: float) -> None:
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {len(rows):>9} rows  {elapsed:8.2f}s  {len(rows) / elapsed:>12,.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rows = read_rows(args.rows)
+    run("before", rows, lambda row: legacy_from_dict(DroidCsvModel, row))
+    run("after", rows, DroidCsvModel.from_dict)
+    run_many("many", rows, columns=False)
+    run_many("columns", rows, columns=True)
+
+
+if __name__ == '__main__':
+    main()
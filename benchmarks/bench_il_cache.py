@@ -0,0 +1,44 @@
+"""
+Benchmark: loading IL results from the on-disk cache.
+
+A file with --files <datei> entries (see tests.make_il_results) is written to a temporary directory and parsed
+with parse_il_results, without a cache, on the first use of an IlResultsCache (parse and write the entry)
+and from the cache.
+
+    python -m benchmarks.bench_il_cache --files 20000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from design_pattern.xmlformats import parse_il_results, IlResultsCache
+from tests import make_il_results
+
+
+def timed(name: str, files: int, run) -> None:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {files:>9} files  {elapsed:8.2f}s  {files / elapsed:>12,.0f} files/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "il_results.xml")
+        with open(path, "wb") as f:
+            f.write(make_il_results(args.files))
+        cache = IlResultsCache()
+
+        timed("parse", args.files, lambda: parse_il_results(path))
+        timed("miss", args.files, lambda: parse_il_results(path, cache=cache))
+        timed("hit", args.files, lambda: parse_il_results(path, cache=cache))
+        print(f"xml {os.path.getsize(path):,} bytes, cache entry {os.path.getsize(cache.entry_path(path)):,} bytes")
+
+
+if __name__ == '__main__':
+    main()
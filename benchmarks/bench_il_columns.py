@@ -0,0 +1,64 @@
+"""
+Benchmark: reporting over parsed IL results.
+
+The <datei> of tests/data/il_results.xml is repeated up to --files entries. A report (PUID distribution,
+total file size, Jhove validity) is computed by flattening the Datei dataclasses into row dicts, and from
+the columns of IdentifyResult.to_table(). The columns are also read straight from the streaming parser.
+
+    python -m benchmarks.bench_il_columns --files 100000
+"""
+import argparse
+import time
+from collections import Counter
+from dataclasses import asdict
+
+from design_pattern.xmlformats import parse_il_results, iter_il_results
+from tests import make_il_results
+
+
+def report_rows(dateien) -> tuple:
+    # the former way: one flattened dict per file, aggregated in Python loops
+    rows = []
+    for datei in dateien:
+        d = asdict(datei)
+        rows.append({"puid": d["droid"]["result"]["puid"], "filesize": d["stats"]["filesize"],
+                     "valid": d["jhove"]["valid"]})
+    puids = Counter(r["puid"] for r in rows if r["puid"] is not None)
+    size = sum(r["filesize"] for r in rows if r["filesize"] is not None)
+    valid = Counter(r["valid"] for r in rows if r["valid"] is not None)
+    return puids, size, valid
+
+
+def report_table(table) -> tuple:
+    return table.value_counts("droid.result.puid"), sum(table.values("stats.filesize")), \
+        table.value_counts("jhove.valid")
+
+
+def timed(name: str, files: int, run):
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {files:>9} files  {elapsed:8.2f}s  {files / elapsed:>12,.0f} files/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = make_il_results(args.files)
+    result = parse_il_results(data)
+    dateien = result.datei_liste.dateien
+
+    rows = timed("rows", args.files, lambda: report_rows(dateien))
+    table = timed("to_table", args.files, result.to_table)
+    columns = timed("report", args.files, lambda: report_table(table))
+    assert rows[0] == columns[0] and rows[1] == columns[1] and rows[2] == columns[2]
+
+    timed("parse", args.files, lambda: parse_il_results(data))
+    timed("stream", args.files, lambda: iter_il_results(data).to_table())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: memory held by parsed IL results.
+
+The <datei> of tests/data/il_results.xml is repeated up to --files entries and parsed. The retained size
+per Datei is compared with the former representation: the same values in dataclasses with a per-instance
+__dict__, and a separate string object per value as the parser produced it before interning.
+
+    python -m benchmarks.bench_il_memory --files 100000
+"""
+import argparse
+import dataclasses
+import gc
+import tracemalloc
+
+from design_pattern.xmlformats import parse_il_results
+from tests import make_il_results
+
+_DICT_CLASSES = {}
+
+
+def dict_class(kls):
+    # the same fields without slots
+    if kls not in _DICT_CLASSES:
+        _DICT_CLASSES[kls] = dataclasses.make_dataclass(
+            kls.__name__, [(f.name, f.type, dataclasses.field(default=None)) for f in dataclasses.fields(kls)])
+    return _DICT_CLASSES[kls]
+
+
+def former(value):
+    if dataclasses.is_dataclass(value):
+        return dict_class(type(value))(**{f.name: former(getattr(value, f.name)) for f in dataclasses.fields(value)})
+    if isinstance(value, list):
+        return [former(v) for v in value]
+    if isinstance(value, str):
+        # a new string object, as every parsed value was one before
+        return value.encode("utf-8").decode("utf-8")
+    return value
+
+
+def retained(build) -> tuple[object, int]:
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = make_il_results(args.files)
+    dateien, after = retained(lambda: list(parse_il_results(data).datei_liste.dateien))
+    _, before = retained(lambda: former(dateien))
+
+    for name, size in (("before", before), ("after", after)):
+        print(f"{name:<10} {args.files:>9} files  {size / 2 ** 20:10.1f} MiB  {size / args.files:>10,.0f} bytes/Datei")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: numeric fields of IL results.
+
+Every numeric field of the dataclasses (the child tables of ByteCount, Stats and MediaInfo) is converted
+--rounds times from typical values: plain numbers, numbers with units and empty elements. "before" is
+the former _int with its per-character digit scan for the integer fields, and the plain text the
+MediaInfo fields were before; "after" are the converters of the tables. The times are per converter.
+
+    python -m benchmarks.bench_il_numbers --rounds 20000
+"""
+import argparse
+import time
+import xml.etree.ElementTree as ET
+
+from design_pattern.xmlformats.il_results import _txt, _int, _number, _bit_rate, _frequency, _duration, \
+    ByteCount, Stats, MediaInfo
+
+# converter -> typical texts
+VALUES = {
+    _int: ["26210", "0", "", "1614262010", "26 210 bytes"],
+    _number: ["2 channels", "16 bits", "1 080 pixels", "29.970 (30000/1001) FPS", ""],
+    _bit_rate: ["128 kb/s", "1 411 kb/s", "128000", "5 Mb/s", ""],
+    _frequency: ["44.1 kHz", "48000", "48.0 kHz", ""],
+    _duration: ["205.000", "3 min 25 s", "1 h 2 min", "00:03:25.120", ""],
+}
+NAMES = {_int: "int", _number: "number", _bit_rate: "bit rate", _frequency: "frequency", _duration: "duration"}
+
+
+def former_int(el):
+    # _int as it was before, kept here for comparison
+    t = _txt(el)
+    if t in (None, "", "NaN"):
+        return None
+    try:
+        return int(t)
+    except Exception:
+        digits = "".join(ch for ch in t if ch.isdigit())
+        try:
+            return int(digits) if digits else None
+        except Exception:
+            return None
+
+
+def element(text: str) -> ET.Element:
+    el = ET.Element("value")
+    el.text = text
+    return el
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20_000)
+    args = parser.parse_args()
+
+    calls = {}
+    for cls in (ByteCount, Stats, MediaInfo):
+        for _, convert in cls._CHILDREN.values():
+            if convert in VALUES:
+                elements = [element(t) for t in VALUES[convert]]
+                before, after = calls.setdefault(NAMES[convert], ([], []))
+                before.extend((former_int if convert is _int else _txt, el) for el in elements)
+                after.extend((convert, el) for el in elements)
+
+    for kind, (before, after) in calls.items():
+        for name, values in (("before", before), ("after", after)):
+            start = time.perf_counter()
+            for _ in range(args.rounds):
+                for convert, el in values:
+                    convert(el)
+            elapsed = time.perf_counter() - start
+            count = len(values) * args.rounds
+            print(f"{kind:<10} {name:<8} {count:>10} values  {elapsed:8.2f}s  {count / elapsed:>12,.0f} values/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: parsing many IL results files in parallel.
+
+--docs files with --files <datei> entries each (see tests.make_il_results) are written to a temporary directory
+and parsed one after the other with parse_il_results, then with parse_il_results_many for 1, 2, 4, ...
+workers up to the number of CPUs. The pickle size of one result as dataclasses and as the packed tuples
+the workers send back is printed first.
+
+    python -m benchmarks.bench_il_parallel --docs 200 --files 500 --chunksize 4
+"""
+import argparse
+import os
+import pickle
+import tempfile
+import time
+
+from design_pattern.xmlformats import parse_il_results, parse_il_results_many
+from design_pattern.xmlformats.il_results import _pack
+from tests import make_il_results
+
+
+def timed(name: str, docs: int, run) -> float:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {docs:>6} docs  {elapsed:8.2f}s  {docs / elapsed:>10,.1f} docs/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--chunksize", type=int, default=1)
+    args = parser.parse_args()
+
+    data = make_il_results(args.files)
+    result = parse_il_results(data)
+    print(f"pickled      {len(pickle.dumps(result, -1)):>10,} bytes as dataclasses, "
+          f"{len(pickle.dumps(_pack(result), -1)):>10,} bytes packed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.docs):
+            paths.append(os.path.join(tmp, f"il_results{i}.xml"))
+            with open(paths[-1], "wb") as f:
+                f.write(data)
+
+        serial = timed("serial", args.docs, lambda: [parse_il_results(p) for p in paths])
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            elapsed = timed(f"{workers} workers", args.docs, lambda: list(
+                parse_il_results_many(paths, workers=workers, chunksize=args.chunksize)))
+            print(f"{'':<12} speedup {serial / elapsed:5.2f}x")
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: IL results XML -> dataclasses.
+
+The <datei> of tests/data/il_results.xml is repeated up to --files entries. Every element type with a
+child table is converted with the former per-field el.find() lookups and with the single pass over its
+children. The <datei-liste> is converted with the former two passes, with the single pass and lazily
+(only the first entry accessed), then the whole document is parsed with parse_il_results, with the
+stdlib parser and with lxml, and with both restricted to a few fields.
+
+    python -m benchmarks.bench_il_results --files 50000
+"""
+import argparse
+import time
+import xml.etree.ElementTree as ET
+
+from design_pattern.xmlformats import parse_il_results
+from design_pattern.xmlformats.il_results import _from_children, _attr, _int_from_attr, ByteCount, Stats, \
+    FileInfo, SimpleMagic, DroidResult, Jhove, MediaInfo, ExtractedTag, LibDimagIdentify, Datei, DateiListe
+from tests import make_il_results
+
+# element tag -> dataclass with a child table
+TABLES = {
+    "byte-count": ByteCount,
+    "stats": Stats,
+    "file": FileInfo,
+    "simplemagic": SimpleMagic,
+    "droid-result": DroidResult,
+    "jhove": Jhove,
+    "mediainfo": MediaInfo,
+    "extracted-tag": ExtractedTag,
+    "libDimagIdentify": LibDimagIdentify,
+}
+
+# the fields a typical report reads
+FIELDS = {"droid", "stats.md5", "jhove.valid"}
+
+
+def find_per_field(el: ET.Element, table: dict) -> dict:
+    # the lookups as they were done before the child tables, kept here for comparison
+    return {name: convert(el.find(tag)) for tag, (name, convert) in table.items()}
+
+
+def two_pass_liste(el: ET.Element) -> DateiListe:
+    # DateiListe.from_element as it was before, with the second pass over all entries
+    files = [Datei.from_element(d) for d in el.findall("datei")]
+    for i, d_el in enumerate(el.findall("datei")):
+        if i < len(files):
+            files[i].errors = _int_from_attr(d_el, "errors")
+            files[i].filename = files[i].filename or _attr(d_el, "filename")
+            files[i].status = files[i].status or _attr(d_el, "status")
+    return DateiListe(dateien=files)
+
+
+def run_liste(name: str, el: ET.Element, convert) -> None:
+    start = time.perf_counter()
+    convert(el)
+    elapsed = time.perf_counter() - start
+    files = len(el.findall("datei"))
+    print(f"{name:<10} {files:>9} files     {elapsed:8.2f}s  {files / elapsed:>12,.0f} files/s")
+
+
+def run(name: str, elements: list[tuple[ET.Element, dict]], convert) -> None:
+    start = time.perf_counter()
+    for el, table in elements:
+        convert(el, table)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {len(elements):>9} elements  {elapsed:8.2f}s  {len(elements) / elapsed:>12,.0f} elements/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=50_000)
+    args = parser.parse_args()
+
+    data = make_il_results(args.files)
+    root = ET.fromstring(data)
+    elements = [(el, TABLES[el.tag]._CHILDREN) for el in root.iter() if el.tag in TABLES]
+
+    run("before", elements, find_per_field)
+    run("after", elements, _from_children)
+
+    liste = root.find("datei-liste")
+    run_liste("two-pass", liste, two_pass_liste)
+    run_liste("one-pass", liste, DateiListe.from_element)
+    run_liste("lazy", liste, lambda el: DateiListe.from_element(el, lazy=True).dateien[0])
+
+    del root, elements, liste
+    for name, use_lxml, fields in (("stdlib", False, None), ("lxml", True, None),
+                                   ("stdlib-sel", False, FIELDS), ("lxml-sel", True, FIELDS)):
+        start = time.perf_counter()
+        result = parse_il_results(data, use_lxml=use_lxml, fields=fields)
+        elapsed = time.perf_counter() - start
+        files = len(result.datei_liste.dateien)
+        print(f"{name:<10} {files:>9} files     {elapsed:8.2f}s  {files / elapsed:>12,.0f} files/s")
+        del result
+
+
+if __name__ == '__main__':
+    main()
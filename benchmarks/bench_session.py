@@ -0,0 +1,42 @@
+"""
+Benchmark: job status requests per second against a local stand-in IngestList server, once with a new
+RemoteSession per request (the former behaviour) and once with the identifier's pooled session.
+
+    python -m benchmarks.bench_session --requests 2000
+"""
+import argparse
+import time
+
+from benchmarks.ingestlist_server import IngestListServer
+from design_pattern.identify import IngestListIdentifier, IngestListIdentifierConfig
+from design_pattern.utils import RemoteSession
+
+
+def report(name: str, count: int, start: float) -> None:
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {count:>7} requests  {elapsed:7.2f}s  {count / elapsed:>9,.0f} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    with IngestListServer() as server:
+        header = {'Accept': 'application/json', 'Authorization': 'Bearer token'}
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            with RemoteSession(base_url=server.base_url) as s:
+                s.get('api/job/1', headers=header)
+        report("no reuse", args.requests, start)
+
+        cfg = IngestListIdentifierConfig(base_url=server.base_url, username="user", password="pass")
+        with IngestListIdentifier(cfg) as identifier:
+            start = time.perf_counter()
+            for _ in range(args.requests):
+                identifier.check_task_status("1")
+            report("pooled", args.requests, start)
+
+
+if __name__ == '__main__':
+    main()
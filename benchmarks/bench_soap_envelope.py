@@ -0,0 +1,65 @@
+"""
+Benchmark: building callas extExecute SOAP envelopes.
+
+The former SoapEnvelope.to_xml (stdlib element -> bytes -> lxml, XPath over userID, serialisation and
+replace on the XML declaration) against the current one, where the payload writes its lxml elements
+straight into the envelope, and the ExtExecuteRequestTemplate that only escapes the input path into the
+pre-serialised envelope.
+
+    python -m benchmarks.bench_soap_envelope --envelopes 50000
+"""
+import argparse
+import time
+import xml.etree.ElementTree as ET
+
+from lxml import etree as LET
+
+from design_pattern.models.callas_soap import ExtExecuteRequestBuilder
+from design_pattern.models.callas_soap.envelope import NSMAP
+
+
+def former_to_xml(envelope, pretty: bool = False) -> str:
+    # SoapEnvelope.to_xml as it was before, kept here for comparison
+    env = LET.Element(f"{{{NSMAP['SOAP-ENV']}}}Envelope", nsmap=NSMAP)
+    body = LET.SubElement(env, f"{{{NSMAP['SOAP-ENV']}}}Body")
+    lxml_payload = LET.fromstring(ET.tostring(envelope.payload.to_element(), encoding="utf-8"))
+    for uid in lxml_payload.xpath(".//userID"):
+        if uid.text is None:
+            uid.text = ""
+    body.append(lxml_payload)
+    xml = LET.tostring(env, pretty_print=pretty, xml_declaration=True, encoding="UTF-8").decode("utf-8")
+    if xml.startswith("<?xml version='1.0'"):
+        xml = xml.replace("version='1.0'", 'version="1.0"', 1)
+        xml = xml.replace("encoding='UTF-8'", 'encoding="UTF-8"', 1)
+    return xml
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--envelopes", type=int, default=50_000)
+    args = parser.parse_args()
+
+    envelopes = [
+        ExtExecuteRequestBuilder()
+        .with_user(None)
+        .add_args("--noprogress", "--nosummary", "--nohits", "--outputfolder=/mnt/ingest/output",
+                  f"/mnt/ingest/file{i}.pdf")
+        .build_envelope()
+        for i in range(args.envelopes)
+    ]
+    assert former_to_xml(envelopes[0]) == envelopes[0].to_xml()
+    template = ExtExecuteRequestBuilder().with_user(None).add_args(
+        "--noprogress", "--nosummary", "--nohits", "--outputfolder=/mnt/ingest/output").build_template()
+    assert template.build_xml("/mnt/ingest/file0.pdf") == envelopes[0].to_xml()
+
+    for name, to_xml in (("before", former_to_xml), ("after", lambda env: env.to_xml()),
+                         ("template", lambda env: template.build_bytes(env.payload.args[-1]))):
+        start = time.perf_counter()
+        for env in envelopes:
+            to_xml(env)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<8} {args.envelopes:>9} envelopes  {elapsed:8.2f}s  {args.envelopes / elapsed:>12,.0f} envelopes/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Minimal local stand-in for the IngestList API, used by the benchmarks.
+
+Every job is created as Running and reported as Completed after `polls_until_done` status requests.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class IngestListHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, payload: dict, status: int = 200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _drain(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        while length > 0:
+            length -= len(self.rfile.read(min(length, 1 << 16)))
+
+    def do_POST(self):
+        self._drain()
+        server: IngestListServer = self.server
+        if self.path.endswith("/api/login"):
+            self._send({"token": "token"})
+        elif self.path.endswith("/api/create"):
+            self._send(server.create_job())
+        else:
+            self._send({"error": "not found"}, 404)
+
+    def do_GET(self):
+        self._drain()
+        server: IngestListServer = self.server
+        if "/api/job/" in self.path:
+            self._send(server.job_status(int(self.path.rsplit("/", 1)[-1])))
+        else:
+            self._send({"error": "not found"}, 404)
+
+
+class IngestListServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, polls_until_done: int = 0):
+        super().__init__(("127.0.0.1", 0), IngestListHandler)
+        self.polls_until_done = polls_until_done
+        self.status_requests = 0
+        self.__lock = threading.Lock()
+        self.__polls: dict[int, int] = {}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+    def create_job(self) -> dict:
+        with self.__lock:
+            job_id = len(self.__polls) + 1
+            self.__polls[job_id] = 0
+        return {"id": job_id, "status": "Running", "type": "Identify"}
+
+    def job_status(self, job_id: int) -> dict:
+        with self.__lock:
+            self.status_requests += 1
+            self.__polls[job_id] = self.__polls.get(job_id, 0) + 1
+            done = self.__polls[job_id] > self.polls_until_done
+        return {"id": job_id, "status": "Completed" if done else "Running", "output": "<identify/>"}
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        self.server_close()
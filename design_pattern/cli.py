@@ -7,10 +7,12 @@ def main():
     parser = argparse.ArgumentParser(exit_on_error=False)
     parser.add_argument("-i", "--input", help="input csv file (with path)", type=str, required=True)
     parser.add_argument("-o", "--output", help="output xml file (with path)", type=str, required=True)
+    parser.add_argument("-s", "--streaming", help="write rows incrementally instead of building the whole document",
+                        action="store_true")
 
     try:
         args = parser.parse_args()
-        xmlbuidler: DroidCsvXmlBuilder = DroidCsvXmlBuilder(args.input, args.out)
+        xmlbuidler: DroidCsvXmlBuilder = DroidCsvXmlBuilder(args.input, args.output, streaming=args.streaming)
         xmlbuidler.build()
         return 0
     except Exception as e:
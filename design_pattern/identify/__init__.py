@@ -2,13 +2,17 @@ from design_pattern.identify.borg_identifier import BorgIdentifier
 from design_pattern.identify.ingestlist_identifier import IngestListIdentifier
 from design_pattern.identify.ingestlist_identifier_async import IngestListIdentifierAsync
 from design_pattern.identify.ingestlist import IngestListIdentifierConfig, IngestListJobType, IngestListTaskResponse, \
-  IngestListTaskState
+  IngestListTaskState, IngestListPollMetrics, IngestListBatchResult, FixedPollStrategy, ExponentialPollStrategy
 
 __all__ = [
   "IngestListIdentifierConfig",
   "IngestListJobType",
   "IngestListTaskResponse",
   "IngestListTaskState",
+  "IngestListPollMetrics",
+  "IngestListBatchResult",
+  "FixedPollStrategy",
+  "ExponentialPollStrategy",
   "BorgIdentifier",
   "IngestListIdentifier",
   "IngestListIdentifierAsync"
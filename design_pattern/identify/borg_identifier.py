@@ -2,14 +2,22 @@ import json
 from typing import Optional
 
 from design_pattern.models.abstract_identifier import AbstractIdentifier
+from design_pattern.models.abstract_result_cache import AbstractResultCache
 from design_pattern.utils.remote_session import RemoteSession
+from design_pattern.utils.multipart_stream import MultipartFileStream
+from design_pattern.utils.result_cache import file_digest, result_cache_key
 
 
 class BorgIdentifier(AbstractIdentifier):
-    def __init__(self, base_url : str, proxies: Optional[str] = None):
+    def __init__(self, base_url : str, proxies: Optional[str] = None, chunk_size: int = 1024 * 1024,
+                 result_cache: Optional[AbstractResultCache] = None, cache_version: str = ''):
         self.__base_url = base_url
         self.__response = None
         self.__proxies = proxies
+        self.__chunk_size = chunk_size
+        # results by content hash and cache_version (the version of the Borg tools)
+        self.__result_cache = result_cache
+        self.__cache_version = cache_version
 
     def __identify(self, file_name : str):
         with RemoteSession(base_url=self.__base_url) as s:
@@ -19,15 +27,11 @@ class BorgIdentifier(AbstractIdentifier):
                 'Accept': 'application/json'
             }
 
-            data = None
             with open(file_name, 'rb') as f:
-                data = f.read()
+                body = MultipartFileStream(f, filename=file_name, chunk_size=self.__chunk_size)
 
-                payload = {
-                    'file':(file_name, data, "multipart/form-data")
-                }
-
-                resp = s.post('/api/analyze-file', proxies=self.__proxies, files=payload)
+                resp = s.post('/api/analyze-file', proxies=self.__proxies,
+                              headers={'Content-Type': body.content_type}, data=body)
                 if resp.status_code == 200 and resp.content:
                     self.__response = json.loads(resp.content)
                 else:
@@ -35,6 +39,14 @@ class BorgIdentifier(AbstractIdentifier):
 
     def identify(self, file_name: str = None) -> dict[str]:
         if self.__base_url and file_name:
-            self.__identify(file_name)
+            if self.__result_cache is None:
+                self.__identify(file_name)
+            else:
+                key = result_cache_key(file_digest(file_name, chunk_size=self.__chunk_size), 'borg',
+                                       self.__cache_version)
+                self.__response = self.__result_cache.get(key)
+                if self.__response is None:
+                    self.__identify(file_name)
+                    self.__result_cache.put(key, self.__response)
 
         return self.__response
\ No newline at end of file
@@ -1,11 +1,16 @@
 from design_pattern.identify.ingestlist.models import IngestListTaskResponse, IngestListIdentifierConfig, IngestListJobType, \
-    IngestListTaskState
+    IngestListTaskState, IngestListPollMetrics, IngestListBatchResult
+from design_pattern.identify.ingestlist.poll_strategy import FixedPollStrategy, ExponentialPollStrategy
 
 __all__ = [
     "IngestListIdentifierConfig",
     "IngestListJobType",
     "IngestListTaskState",
-    "IngestListTaskResponse"
+    "IngestListTaskResponse",
+    "IngestListPollMetrics",
+    "IngestListBatchResult",
+    "FixedPollStrategy",
+    "ExponentialPollStrategy"
 ]
 
 
@@ -2,12 +2,16 @@ from design_pattern.identify.ingestlist.models.task_response import IngestListTa
 from design_pattern.identify.ingestlist.models.job_type import IngestListJobType
 from design_pattern.identify.ingestlist.models.config import IngestListIdentifierConfig
 from design_pattern.identify.ingestlist.models.task_state import IngestListTaskState
+from design_pattern.identify.ingestlist.models.poll_metrics import IngestListPollMetrics
+from design_pattern.identify.ingestlist.models.batch_result import IngestListBatchResult
 
 __all__ = [
     "IngestListTaskResponse",
     "IngestListJobType",
     "IngestListIdentifierConfig",
-    "IngestListTaskState"
+    "IngestListTaskState",
+    "IngestListPollMetrics",
+    "IngestListBatchResult"
 ]
 
 
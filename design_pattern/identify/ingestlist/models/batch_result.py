@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+
+from design_pattern.identify.ingestlist.models.task_response import IngestListTaskResponse
+
+
+@dataclass
+class IngestListBatchResult:
+    file_path: str = field(default='')
+    response: IngestListTaskResponse | None = field(default=None)
+    error: Exception | None = field(default=None)
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
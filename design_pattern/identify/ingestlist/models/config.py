@@ -1,9 +1,32 @@
 from dataclasses import dataclass
 
+from design_pattern.models.abstract_result_cache import AbstractResultCache
+
 
 @dataclass
 class IngestListIdentifierConfig:
     proxies: str | None = None
     base_url: str | None = None
     username: str | None = None
-    password: str | None = None
\ No newline at end of file
+    password: str | None = None
+
+    # connection pool of the long-lived session
+    pool_connections: int = 1
+    pool_maxsize: int = 10
+    keep_alive: bool = True
+
+    # connection limits of the shared async client (see httpx.Limits), http2 needs the h2 package
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    http2: bool = False
+
+    # uploads are streamed from disk, at most this many bytes of a file are held in memory
+    upload_chunk_size: int = 1024 * 1024
+
+    # identify results of LOCAL files by content hash, job type and cache_version (the version of the
+    # server's tools, change it to stop reusing older results). None: no cache
+    result_cache: AbstractResultCache | None = None
+    cache_version: str = ''
+    # a pending job is remembered until it is polled to completion, at most this many (oldest are dropped)
+    cache_max_pending_jobs: int = 1024
@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field, asdict
+
+
+@dataclass
+class IngestListPollMetrics:
+    job_id: str = field(default='')
+    polls: int = field(default=0)
+    total_wait: float = field(default=0.0)
+    retry_after_hints: int = field(default=0)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
@@ -0,0 +1,171 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+from design_pattern.identify.ingestlist.models import IngestListTaskResponse, IngestListTaskState, \
+    IngestListPollMetrics
+from design_pattern.identify.ingestlist.poll_strategy import FixedPollStrategy
+from design_pattern.models.abstract_poll_strategy import AbstractPollStrategy
+
+
+@dataclass
+class _PendingJob:
+    future: asyncio.Future
+    timeout: float
+    started: float
+    due: float
+    metrics: IngestListPollMetrics
+    watchers: int = field(default=1)
+
+
+class IngestListPollScheduler:
+    """
+    Polls the status of all outstanding jobs from a single task.
+
+    `fetch_status` returns the job's IngestListTaskResponse and the server's Retry-After hint in seconds
+    (or None). The `strategy` decides how long each job waits until its next poll, jobs that are due at the
+    same time are polled together with at most `max_inflight` status requests at a time. The future of a
+    job is resolved once it is Completed, and fails once it is Failed, its status request fails or it did
+    not finish within its timeout.
+    """
+
+    def __init__(self,
+                 fetch_status: Callable[[str], Awaitable[tuple[IngestListTaskResponse, float | None]]],
+                 strategy: AbstractPollStrategy | None = None,
+                 max_inflight: int = 10,
+                 max_metrics: int = 10000):
+        self.strategy = strategy or FixedPollStrategy()
+        self.max_inflight = max_inflight
+        self.__fetch_status = fetch_status
+        self.__jobs: dict[str, _PendingJob] = {}
+        self.__metrics: OrderedDict[str, IngestListPollMetrics] = OrderedDict()
+        self.__max_metrics = max_metrics
+        self.__task: asyncio.Task | None = None
+        self.__wakeup = asyncio.Event()
+
+    @property
+    def pending(self) -> int:
+        return len(self.__jobs)
+
+    @property
+    def metrics(self) -> dict[str, IngestListPollMetrics]:
+        """
+        Poll metrics of the most recently finished jobs (at most `max_metrics`), by job id.
+        """
+        return dict(self.__metrics)
+
+    def watch(self, job_id: str, timeout: float) -> asyncio.Future:
+        """
+        Adds a job to the polled set and returns the future resolved with its final IngestListTaskResponse.
+        Watching a job twice returns the same future.
+        """
+        job = self.__jobs.get(job_id)
+        if job is not None:
+            job.watchers += 1
+            return job.future
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # new jobs are polled after the strategy's first interval, or join an earlier tick of other jobs
+        due = min([j.due for j in self.__jobs.values() if j.due > now] + [now + self.strategy.next_interval(0)])
+        self.__jobs[job_id] = _PendingJob(future=loop.create_future(), timeout=timeout, started=now, due=due,
+                                          metrics=IngestListPollMetrics(job_id=job_id))
+        self.__wakeup.set()
+        if self.__task is None or self.__task.done():
+            self.__task = loop.create_task(self.__run())
+        return self.__jobs[job_id].future
+
+    def unwatch(self, job_id: str):
+        """
+        Drops one watcher of a job, the job is no longer polled once nobody waits for it.
+        """
+        job = self.__jobs.get(job_id)
+        if job is None:
+            return
+        job.watchers -= 1
+        if job.watchers <= 0:
+            del self.__jobs[job_id]
+            job.future.cancel()
+
+    async def aclose(self):
+        """
+        Stops polling and cancels the futures of all outstanding jobs.
+        """
+        for job in self.__jobs.values():
+            job.future.cancel()
+        self.__jobs.clear()
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+
+    async def __run(self):
+        loop = asyncio.get_running_loop()
+        while self.__jobs:
+            now = loop.time()
+            next_due = min(job.due for job in self.__jobs.values())
+            if next_due > now:
+                self.__wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.__wakeup.wait(), next_due - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            due = [job_id for job_id, job in self.__jobs.items() if job.due <= now]
+            workers = max(1, min(self.max_inflight, len(due)))
+            due_iter = iter(due)
+            await asyncio.gather(*(self.__poll_worker(due_iter, now) for _ in range(workers)))
+
+    async def __poll_worker(self, due, tick: float):
+        # the workers share one iterator, so no more than max_inflight requests run at a time
+        for job_id in due:
+            await self.__poll(job_id, tick)
+
+    async def __poll(self, job_id: str, tick: float):
+        job = self.__jobs.get(job_id)
+        if job is None:
+            return
+
+        job.metrics.polls += 1
+        try:
+            response, retry_after = await self.__fetch_status(job_id)
+        except Exception as e:
+            self.__finish(job_id, exception=e)
+            return
+
+        now = asyncio.get_running_loop().time()
+        status = getattr(response, 'status', None)
+        if status == IngestListTaskState.Completed:
+            self.__finish(job_id, result=response)
+        elif status == IngestListTaskState.Failed:
+            self.__finish(job_id, exception=Exception(f'Task {job_id} failed: {response}'))
+        elif now - job.started > job.timeout:
+            self.__finish(job_id, exception=TimeoutError(f'Task {job_id} did not complete within {job.timeout}s'))
+        else:
+            if retry_after is not None:
+                job.metrics.retry_after_hints += 1
+            interval = self.strategy.next_interval(job.metrics.polls, retry_after)
+            # relative to the tick, so jobs with the same interval stay on one cadence.
+            # One last poll at the deadline instead of sleeping past it.
+            job.due = min(tick + interval, job.started + job.timeout)
+
+    def __finish(self, job_id: str, result: IngestListTaskResponse = None, exception: BaseException = None):
+        job = self.__jobs.pop(job_id, None)
+        if job is None or job.future.done():
+            return
+
+        job.metrics.total_wait = asyncio.get_running_loop().time() - job.started
+        self.__metrics[job_id] = job.metrics
+        self.__metrics.move_to_end(job_id)
+        while len(self.__metrics) > self.__max_metrics:
+            self.__metrics.popitem(last=False)
+
+        if exception is not None:
+            job.future.set_exception(exception)
+        else:
+            job.future.set_result(result)
@@ -0,0 +1,67 @@
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+from design_pattern.models.abstract_poll_strategy import AbstractPollStrategy
+
+
+class FixedPollStrategy(AbstractPollStrategy):
+    """
+    Polls right away and then every `interval` seconds, a Retry-After hint of the server is preferred.
+    """
+
+    def __init__(self, interval: float = 2.0):
+        self.interval = interval
+
+    def next_interval(self, polls: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return retry_after
+        return self.interval if polls else 0.0
+
+
+class ExponentialPollStrategy(AbstractPollStrategy):
+    """
+    Starts with a short interval for small jobs and grows it by `factor` per poll up to `max_interval`,
+    so long running jobs are polled less often. Each interval is spread by +/- `jitter` (a fraction),
+    a Retry-After hint of the server is used as it is.
+    """
+
+    def __init__(self,
+                 initial: float = 0.1,
+                 factor: float = 2.0,
+                 max_interval: float = 10.0,
+                 jitter: float = 0.1,
+                 rng: random.Random | None = None):
+        self.initial = initial
+        self.factor = factor
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.__rng = rng or random.Random()
+
+    def next_interval(self, polls: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return retry_after
+        interval = min(self.max_interval, self.initial * self.factor ** max(polls - 1, 0))
+        if self.jitter:
+            interval *= self.__rng.uniform(1 - self.jitter, 1 + self.jitter)
+        return min(self.max_interval, interval)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Seconds of a Retry-After header, given either as delay in seconds or as HTTP date.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -1,9 +1,11 @@
 import json
+from collections import OrderedDict
+from contextlib import nullcontext
 
 from design_pattern.identify.ingestlist import IngestListIdentifierConfig, IngestListJobType
-from design_pattern.identify.ingestlist.models import IngestListTaskResponse
+from design_pattern.identify.ingestlist.models import IngestListTaskResponse, IngestListTaskState
 from design_pattern.models.abstract_identifier import AbstractIdentifier
-from design_pattern.utils import RemoteSession
+from design_pattern.utils import RemoteSession, MultipartFileStream, file_digest, result_cache_key
 
 
 class IngestListIdentifier(AbstractIdentifier):
@@ -12,12 +14,46 @@ class IngestListIdentifier(AbstractIdentifier):
         self.__proxies = cfg.proxies
         self.__username = cfg.username
         self.__password = cfg.password
+        self.__pool_connections = cfg.pool_connections
+        self.__pool_maxsize = cfg.pool_maxsize
+        self.__keep_alive = cfg.keep_alive
+        self.__upload_chunk_size = cfg.upload_chunk_size
+        self.__session: RemoteSession | None = None
+        self.__result_cache = cfg.result_cache
+        self.__cache_version = cfg.cache_version
+        # cache keys of jobs that were not finished yet, by job id; bounded, the oldest are dropped
+        self.__cached_jobs: OrderedDict[str, str] = OrderedDict()
+        self.__max_pending_jobs = cfg.cache_max_pending_jobs
 
         self.token: str | None = None
         self.__login()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Closes the pooled session and all its connections. A later request opens a new one.
+        """
+        if self.__session is not None:
+            self.__session.close()
+            self.__session = None
+
+    def __remote_session(self) -> nullcontext:
+        # one session for the whole lifetime, so connections (and TLS handshakes) are reused between requests.
+        # It is handed out as a context that does not close it on exit.
+        if self.__session is None:
+            self.__session = RemoteSession(base_url=self.__base_url,
+                                           pool_connections=self.__pool_connections,
+                                           pool_maxsize=self.__pool_maxsize,
+                                           keep_alive=self.__keep_alive)
+        return nullcontext(self.__session)
+
     def __login(self):
-        with RemoteSession(base_url=self.__base_url) as s:
+        with self.__remote_session() as s:
             payload = {
                 'email': self.__username,
                 'password': self.__password
@@ -41,27 +77,21 @@ class IngestListIdentifier(AbstractIdentifier):
         }
 
     def __identify(self, file_path: str, job_type: IngestListJobType = IngestListJobType.LOCAL):
-        with RemoteSession(base_url=self.__base_url) as s:
+        with self.__remote_session() as s:
             match job_type:
                 # Remote means we want to upload a file and identify it.
                 case IngestListJobType.LOCAL:
 
                     with open(file_path, 'rb') as f:
-                        data = f.read()
-
-                        files = {
-                            'file': (file_path, data, "multipart/form-data")
-                        }
-
-                        payload = {
-                            'type': 'Identify'
-                        }
+                        # streamed from disk in chunks instead of reading the whole file into memory
+                        body = MultipartFileStream(f, filename=file_path,
+                                                   fields={'type': 'Identify'},
+                                                   chunk_size=self.__upload_chunk_size)
 
                         resp = s.post('/api/create',
                                       proxies=self.__proxies,
-                                      headers=self.__header(),
-                                      files=files,
-                                      data=payload)
+                                      headers={**self.__header(), 'Content-Type': body.content_type},
+                                      data=body)
 
                         if 200 <= resp.status_code < 400 and resp.content:
                             self.__response = json.loads(resp.content)
@@ -86,26 +116,19 @@ class IngestListIdentifier(AbstractIdentifier):
                         raise Exception(f'{resp.status_code}: {resp.content}')
 
     def __validate(self, file_path: str, job_type: IngestListJobType = IngestListJobType.LOCAL):
-        with RemoteSession(base_url=self.__base_url) as s:
+        with self.__remote_session() as s:
             match job_type:
                 # Remote means we want to upload a file and identify it.
                 case IngestListJobType.LOCAL:
                     with open(file_path, 'rb') as f:
-                        data = f.read()
-
-                        files = {
-                            'file': (file_path, data, "multipart/form-data")
-                        }
-
-                        payload = {
-                            'type': 'Validate'
-                        }
+                        body = MultipartFileStream(f, filename=file_path,
+                                                   fields={'type': 'Validate'},
+                                                   chunk_size=self.__upload_chunk_size)
 
                         resp = s.post('/api/create',
                                       proxies=self.__proxies,
-                                      headers=self.__header(),
-                                      files=files,
-                                      data=payload)
+                                      headers={**self.__header(), 'Content-Type': body.content_type},
+                                      data=body)
 
                         if 200 <= resp.status_code < 400 and resp.content:
                             self.__response = json.loads(resp.content)
@@ -129,7 +152,7 @@ class IngestListIdentifier(AbstractIdentifier):
                         raise Exception(f'{resp.status_code}: {resp.content}')
 
     def __check_task_status(self, job_id: str):
-        with RemoteSession(base_url=self.__base_url) as s:
+        with self.__remote_session() as s:
             payload = {
                 'jobId': job_id
             }
@@ -144,17 +167,49 @@ class IngestListIdentifier(AbstractIdentifier):
             else:
                 raise Exception(f'{resp.status_code}: {resp.content}')
 
+    def __cache_key(self, file_path: str, job_type: IngestListJobType) -> str | None:
+        # only LOCAL files can be hashed, a REMOTE path is a file on the server
+        if self.__result_cache is None or job_type != IngestListJobType.LOCAL:
+            return None
+        digest = file_digest(file_path, chunk_size=self.__upload_chunk_size)
+        return result_cache_key(digest, f'identify-{job_type.name}', self.__cache_version)
+
+    def __cache_response(self, key: str | None, response: IngestListTaskResponse):
+        # only a completed job's JSON is stored (parsed again on a hit), a pending one once it completes
+        if key is None or response.status == IngestListTaskState.Failed:
+            return
+        if response.status == IngestListTaskState.Completed:
+            self.__result_cache.put(key, self.__response)
+        else:
+            self.__cached_jobs[str(response.id)] = key
+            while len(self.__cached_jobs) > self.__max_pending_jobs:
+                self.__cached_jobs.popitem(last=False)
+
+    def __update_cached_job(self, response: IngestListTaskResponse):
+        # a pending job that completed since is stored now, a failed one is forgotten
+        if response.status not in (IngestListTaskState.Completed, IngestListTaskState.Failed):
+            return
+        key = self.__cached_jobs.pop(str(response.id), None)
+        if key is not None and response.status == IngestListTaskState.Completed:
+            self.__result_cache.put(key, self.__response)
+
     def identify(self, file_path: str, job_type: IngestListJobType = IngestListJobType.LOCAL) -> IngestListTaskResponse:
 
         if self.__base_url and file_path:
+            key = self.__cache_key(file_path, job_type)
+            if key is not None and (cached := self.__result_cache.get(key)) is not None:
+                return IngestListTaskResponse.from_dict(cached)
+
             if self.token is None:
                 self.__login()
 
             self.__identify(file_path, job_type)
             try:
-                return IngestListTaskResponse.from_dict(self.__response)
+                response = IngestListTaskResponse.from_dict(self.__response)
             except Exception:
                 return None
+            self.__cache_response(key, response)
+            return response
         return None
 
     def validate(self, file_path: str, job_type: IngestListJobType = IngestListJobType.LOCAL) -> IngestListTaskResponse:
@@ -177,7 +232,9 @@ class IngestListIdentifier(AbstractIdentifier):
 
             self.__check_task_status(job_id)
             try:
-                return IngestListTaskResponse.from_dict(self.__response)
+                response = IngestListTaskResponse.from_dict(self.__response)
             except Exception:
                 return None
+            self.__update_cached_job(response)
+            return response
         return None
@@ -1,10 +1,20 @@
 import asyncio
+from collections import OrderedDict
+from contextlib import aclosing, nullcontext
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+
+import httpx
 
 from design_pattern.identify.ingestlist.models import IngestListTaskState
 from design_pattern.identify.ingestlist import IngestListIdentifierConfig, IngestListJobType
-from design_pattern.identify.ingestlist.models import IngestListTaskResponse
+from design_pattern.identify.ingestlist.models import IngestListTaskResponse, IngestListPollMetrics, \
+  IngestListBatchResult
+from design_pattern.identify.ingestlist.poll_scheduler import IngestListPollScheduler
+from design_pattern.identify.ingestlist.poll_strategy import ExponentialPollStrategy, parse_retry_after
+from design_pattern.models.abstract_poll_strategy import AbstractPollStrategy
 from design_pattern.models.abstract_identifier import AbstractIdentifier
-from design_pattern.utils import RemoteSessionAsync
+from design_pattern.utils import RemoteSessionAsync, AsyncMultipartFileStream, file_digest, result_cache_key, \
+  bounded_map
 
 class IngestListIdentifierAsync(AbstractIdentifier):
   def __init__(self, cfg: IngestListIdentifierConfig):
@@ -12,26 +22,67 @@ class IngestListIdentifierAsync(AbstractIdentifier):
     self.__proxies = cfg.proxies
     self.__username = cfg.username
     self.__password = cfg.password
+    self.__limits = httpx.Limits(
+      max_connections=cfg.max_connections,
+      max_keepalive_connections=cfg.max_keepalive_connections,
+      keepalive_expiry=cfg.keepalive_expiry
+    )
+    self.__http2 = cfg.http2
+    self.__upload_chunk_size = cfg.upload_chunk_size
+    self.__session: RemoteSessionAsync | None = None
+    self.__result_cache = cfg.result_cache
+    self.__cache_version = cfg.cache_version
+    # Cache-Keys noch nicht fertiger Jobs, nach Job-ID; begrenzt, die ältesten fallen heraus
+    self.__cached_jobs: OrderedDict[str, str] = OrderedDict()
+    self.__max_pending_jobs = cfg.cache_max_pending_jobs
 
     self.token: str | None = None
 
     # Polling Konfiguration
-    self.poll_interval: float = 2.0  # Sekunden zwischen Status-Checks
+    self.poll_interval: float = 2.0  # Max Sekunden zwischen Status-Checks
     self.max_poll_time: float = 300.0  # Max 5 Minuten warten
+    self.max_inflight_polls: int = 10  # Max gleichzeitige Status-Requests aller Jobs
+    # Wartezeit zwischen Status-Checks; None = exponentiell ab 0.1s bis poll_interval
+    self.poll_strategy: AbstractPollStrategy | None = None
+
+    self.__scheduler: IngestListPollScheduler | None = None
 
   async def __aenter__(self):
     await self.__login()
     return self
 
   async def __aexit__(self, exc_type, exc_val, exc_tb):
-    pass
+    await self.aclose()
 
   async def initialize(self):
     await self.__login()
     return self
 
+  async def aclose(self):
+    """
+    Schließt den gemeinsamen Client und alle seine Verbindungen. Ein späterer Request öffnet einen neuen.
+    """
+    if self.__scheduler is not None:
+      # der Scheduler bleibt für poll_metrics erhalten und startet beim nächsten Job neu
+      await self.__scheduler.aclose()
+    if self.__session is not None:
+      session, self.__session = self.__session, None
+      await session.aclose()
+
+  def __remote_session(self) -> nullcontext:
+    # Ein Client für alle Requests, damit gather() über viele Dateien einen Connection-Pool teilt.
+    # Wird als Kontext ausgegeben, der den Client beim Verlassen nicht schließt.
+    if self.__session is None:
+      self.__session = RemoteSessionAsync(
+        base_url=self.__base_url,
+        proxies=self.__proxies,
+        limits=self.__limits,
+        http2=self.__http2
+      )
+    return nullcontext(self.__session)
+
   async def __login(self):
-    async with RemoteSessionAsync(base_url=self.__base_url, proxies=self.__proxies) as s:
+    async with self.__remote_session() as s:
       payload = {
         'email': self.__username,
         'password': self.__password
@@ -58,31 +109,24 @@ class IngestListIdentifierAsync(AbstractIdentifier):
       'Authorization': 'Bearer ' + self.token,
     }
 
-  async def __identify(self, file_path: str, job_type: IngestListJobType = IngestListJobType.LOCAL):
-    async with RemoteSessionAsync(base_url=self.__base_url, proxies=self.__proxies) as s:
+  async def __identify(self, file_path: str, job_type: IngestListJobType = IngestListJobType.LOCAL) -> dict:
+    async with self.__remote_session() as s:
       match job_type:
         case IngestListJobType.LOCAL:
           with open(file_path, 'rb') as f:
-            data = f.read()
-
-            files = {
-              'file': (file_path, data, "multipart/form-data")
-            }
-
-            payload = {
-              'type': 'Identify'
-            }
+            # in Blöcken von der Platte gestreamt, statt die ganze Datei in den Speicher zu lesen
+            body = AsyncMultipartFileStream(f, filename=file_path, fields={'type': 'Identify'},
+                                            chunk_size=self.__upload_chunk_size)
 
             resp = await s.post(
               '/api/create',
               proxies=self.__proxies,
-              headers=self.__header(),
-              files=files,
-              data=payload
+              headers={**self.__header(), 'Content-Type': body.content_type, 'Content-Length': str(len(body))},
+              content=body
             )
 
             if 200 <= resp.status_code < 400 and resp.content:
-              self.__response = resp.json()
+              return resp.json()
             else:
               raise Exception(f'{resp.status_code}: {resp.content}')
 
@@ -99,34 +143,26 @@ class IngestListIdentifierAsync(AbstractIdentifier):
           )
 
           if 200 <= resp.status_code < 400 and resp.content:
-            self.__response = resp.json()
+            return resp.json()
           else:
             raise Exception(f'{resp.status_code}: {resp.content}')
 
-  async def __validate(self, file_path: str, job_type: IngestListJobType = IngestListJobType.LOCAL):
-    async with RemoteSessionAsync(base_url=self.__base_url, proxies=self.__proxies) as s:
+  async def __validate(self, file_path: str, job_type: IngestListJobType = IngestListJobType.LOCAL) -> dict:
+    async with self.__remote_session() as s:
       match job_type:
         case IngestListJobType.LOCAL:
           with open(file_path, 'rb') as f:
-            data = f.read()
-
-            files = {
-              'file': (file_path, data, "multipart/form-data")
-            }
-
-            payload = {
-              'type': 'Validate'
-            }
+            body = AsyncMultipartFileStream(f, filename=file_path, fields={'type': 'Validate'},
+                                            chunk_size=self.__upload_chunk_size)
 
             resp = await s.post(
               '/api/create',
-              headers=self.__header(),
-              files=files,
-              data=payload
+              headers={**self.__header(), 'Content-Type': body.content_type, 'Content-Length': str(len(body))},
+              content=body
             )
 
             if 200 <= resp.status_code < 400 and resp.content:
-              self.__response = resp.json()
+              return resp.json()
             else:
               raise Exception(f'{resp.status_code}: {resp.content}')
 
@@ -144,12 +180,12 @@ class IngestListIdentifierAsync(AbstractIdentifier):
           )
 
           if 200 <= resp.status_code < 400 and resp.content:
-            self.__response = resp.json()
+            return resp.json()
           else:
             raise Exception(f'{resp.status_code}: {resp.content}')
 
   async def __check_task_status(self, job_id: str):
-    async with RemoteSessionAsync(base_url=self.__base_url, proxies=self.__proxies) as s:
+    async with self.__remote_session() as s:
       resp = await s.get(
         f'api/job/{job_id}',
         headers=self.__header()
@@ -159,35 +195,78 @@ class IngestListIdentifierAsync(AbstractIdentifier):
         self.__response = resp.json()
       else:
         raise Exception(f'{resp.status_code}: {resp.content}')
+      return resp
+
+  async def __fetch_status(self, job_id: str) -> tuple[IngestListTaskResponse, float | None]:
+    resp = await self.__check_task_status(job_id)
+    response = IngestListTaskResponse.from_dict(self.__response)
+    self.__update_cached_job(response)
+    return response, parse_retry_after(resp.headers.get('Retry-After'))
+
+  async def __cache_key(self, file_path: str, job_type: IngestListJobType) -> str | None:
+    # Nur LOCAL Dateien können gehasht werden, ein REMOTE Pfad liegt auf dem Server
+    if self.__result_cache is None or job_type != IngestListJobType.LOCAL:
+      return None
+    digest = await asyncio.to_thread(file_digest, file_path, chunk_size=self.__upload_chunk_size)
+    return result_cache_key(digest, f'identify-{job_type.name}', self.__cache_version)
+
+  def __cache_response(self, key: str | None, data: dict, response: IngestListTaskResponse):
+    # Gespeichert wird nur das JSON eines fertigen Jobs (bei einem Treffer neu geparst),
+    # ein laufender erst, wenn er fertig ist
+    if key is None or response.status == IngestListTaskState.Failed:
+      return
+    if response.status == IngestListTaskState.Completed:
+      self.__result_cache.put(key, data)
+    else:
+      self.__cached_jobs[str(response.id)] = key
+      while len(self.__cached_jobs) > self.__max_pending_jobs:
+        self.__cached_jobs.popitem(last=False)
+
+  def __update_cached_job(self, response: IngestListTaskResponse):
+    # Ein inzwischen fertiger Job wird jetzt gespeichert, ein fehlgeschlagener vergessen
+    if response.status not in (IngestListTaskState.Completed, IngestListTaskState.Failed):
+      return
+    key = self.__cached_jobs.pop(str(response.id), None)
+    if key is not None and response.status == IngestListTaskState.Completed:
+      self.__result_cache.put(key, self.__response)
+
+  def __poll_scheduler(self) -> IngestListPollScheduler:
+    # Ein Scheduler fragt alle offenen Jobs gemeinsam ab, statt einer Poll-Schleife pro Job
+    if self.__scheduler is None:
+      self.__scheduler = IngestListPollScheduler(self.__fetch_status)
+    self.__scheduler.strategy = self.poll_strategy or ExponentialPollStrategy(
+      initial=min(0.1, self.poll_interval),
+      max_interval=self.poll_interval
+    )
+    self.__scheduler.max_inflight = self.max_inflight_polls
+    return self.__scheduler
+
+  @property
+  def poll_metrics(self) -> dict[str, IngestListPollMetrics]:
+    """
+    Anzahl Status-Checks und Gesamtwartezeit der zuletzt abgeschlossenen Jobs, nach Job-ID
+    """
+    return self.__scheduler.metrics if self.__scheduler is not None else {}
 
   async def __wait_for_completion(self, job_id: str) -> IngestListTaskResponse:
     """
     Wartet bis der Task abgeschlossen ist (Status = Completed oder Failed)
     """
-    start_time = asyncio.get_event_loop().time()
-
-    while True:
-      await self.__check_task_status(job_id)
-
-      try:
-        response = IngestListTaskResponse.from_dict(self.__response)
-        status = getattr(response, 'status', None)
-
-        if status == IngestListTaskState.Completed:
-          return response
-        elif status == IngestListTaskState.Failed:
-          raise Exception(f'Task {job_id} failed: {response}')
-
-        # Timeout Check
-        elapsed = asyncio.get_event_loop().time() - start_time
-        if elapsed > self.max_poll_time:
-          raise TimeoutError(f'Task {job_id} did not complete within {self.max_poll_time}s')
-
-        # Warte vor nächstem Check
-        await asyncio.sleep(self.poll_interval)
-
-      except Exception as e:
-        raise Exception(f'Error checking task status: {e}')
+    # Die Antwort liefert die ID als int, der Scheduler und poll_metrics führen sie als str
+    job_id = str(job_id)
+    scheduler = self.__poll_scheduler()
+    future = scheduler.watch(job_id, self.max_poll_time)
+    try:
+      # shield: ein abgebrochener Aufrufer darf den gemeinsamen Future nicht abbrechen
+      return await asyncio.shield(future)
+    except asyncio.CancelledError:
+      scheduler.unwatch(job_id)
+      raise
+    except Exception as e:
+      raise Exception(f'Error checking task status: {e}')
+    finally:
+      # nach Timeout, Fehler oder Abbruch wird der Job nicht mehr gespeichert
+      self.__cached_jobs.pop(job_id, None)
 
   async def identify(
       self,
@@ -204,26 +283,8 @@ class IngestListIdentifierAsync(AbstractIdentifier):
         wait_for_completion: Wenn True, wartet bis Task fertig ist
     """
     if self.__base_url and file_path:
-      if self.token is None:
-        await self.__login()
-
-      await self.__identify(file_path, job_type)
-
       try:
-        initial_response = IngestListTaskResponse.from_dict(self.__response)
-
-        if not wait_for_completion:
-          return initial_response
-
-        # Hole Job-ID (anpassen je nach deinem Model)
-        job_id = getattr(initial_response, 'job_id', None) or getattr(initial_response, 'id', None)
-
-        if not job_id:
-          raise Exception('No job_id in response')
-
-        # Warte auf Completion
-        return await self.__wait_for_completion(job_id)
-
+        return await self.__identify_file(file_path, job_type, wait_for_completion)
       except Exception as e:
         raise Exception(f'Error in identify: {e}')
     return None
@@ -235,27 +296,118 @@ class IngestListIdentifierAsync(AbstractIdentifier):
       wait_for_completion: bool = True
   ) -> IngestListTaskResponse | None:
     if self.__base_url and file_path:
-      if self.token is None:
-        await self.__login()
+      try:
+        return await self.__validate_file(file_path, job_type, wait_for_completion)
+      except Exception:
+        return None
+    return None
 
-      await self.__validate(file_path, job_type)
+  async def __identify_file(
+      self,
+      file_path: str,
+      job_type: IngestListJobType,
+      wait_for_completion: bool
+  ) -> IngestListTaskResponse:
+    # Identify einer Datei mit Result-Cache; Fehler werfen, identify und identify_many behandeln sie
+    key = await self.__cache_key(file_path, job_type)
+    cached = self.__result_cache.get(key) if key is not None else None
+    if cached is not None:
+      return IngestListTaskResponse.from_dict(cached)
+
+    if self.token is None:
+      await self.__login()
+
+    data = await self.__identify(file_path, job_type)
+    initial_response = IngestListTaskResponse.from_dict(data)
+    self.__cache_response(key, data, initial_response)
+
+    if not wait_for_completion:
+      return initial_response
+    return await self.__wait_for_job(initial_response)
+
+  async def __validate_file(
+      self,
+      file_path: str,
+      job_type: IngestListJobType,
+      wait_for_completion: bool
+  ) -> IngestListTaskResponse:
+    if self.token is None:
+      await self.__login()
 
-      try:
-        initial_response = IngestListTaskResponse.from_dict(self.__response)
+    initial_response = IngestListTaskResponse.from_dict(await self.__validate(file_path, job_type))
 
-        if not wait_for_completion:
-          return initial_response
+    if not wait_for_completion:
+      return initial_response
+    return await self.__wait_for_job(initial_response)
 
-        job_id = getattr(initial_response, 'job_id', None) or getattr(initial_response, 'id', None)
+  async def __wait_for_job(self, initial_response: IngestListTaskResponse) -> IngestListTaskResponse:
+    # Hole Job-ID (anpassen je nach deinem Model)
+    job_id = getattr(initial_response, 'job_id', None) or getattr(initial_response, 'id', None)
 
-        if not job_id:
-          raise Exception('No job_id in response')
+    if not job_id:
+      raise Exception('No job_id in response')
 
-        return await self.__wait_for_completion(job_id)
+    # Warte auf Completion
+    return await self.__wait_for_completion(job_id)
 
-      except Exception:
-        return None
-    return None
+  def identify_many(
+      self,
+      file_paths: Iterable[str] | AsyncIterable[str],
+      job_type: IngestListJobType = IngestListJobType.LOCAL,
+      max_concurrency: int = 10,
+      wait_for_completion: bool = True
+  ) -> AsyncIterator[IngestListBatchResult]:
+    """
+    Startet Identify-Tasks für viele Dateien mit begrenzter Parallelität
+
+    Args:
+        file_paths: Pfade, auch als async Iterator (z.B. beim Durchlaufen eines Verzeichnisses)
+        job_type: LOCAL oder REMOTE
+        max_concurrency: Max gleichzeitig laufende Dateien
+        wait_for_completion: Wenn True, wartet bis jeder Task fertig ist
+
+    Returns:
+        Async Generator mit einem IngestListBatchResult je Datei, in der Reihenfolge der Fertigstellung.
+        Fehler einer Datei stehen im Ergebnis und brechen den Batch nicht ab.
+    """
+    return self.__run_many(self.__identify_file, file_paths, job_type, max_concurrency, wait_for_completion)
+
+  def validate_many(
+      self,
+      file_paths: Iterable[str] | AsyncIterable[str],
+      job_type: IngestListJobType = IngestListJobType.LOCAL,
+      max_concurrency: int = 10,
+      wait_for_completion: bool = True
+  ) -> AsyncIterator[IngestListBatchResult]:
+    """
+    Startet Validate-Tasks für viele Dateien mit begrenzter Parallelität, siehe identify_many
+    """
+    return self.__run_many(self.__validate_file, file_paths, job_type, max_concurrency, wait_for_completion)
+
+  async def __run_many(
+      self,
+      start: Callable[[str, IngestListJobType, bool], Awaitable[IngestListTaskResponse]],
+      file_paths: Iterable[str] | AsyncIterable[str],
+      job_type: IngestListJobType,
+      max_concurrency: int,
+      wait_for_completion: bool
+  ) -> AsyncIterator[IngestListBatchResult]:
+    if not self.__base_url:
+      return
+    if self.token is None:
+      await self.__login()
+
+    async def run(file_path: str) -> IngestListBatchResult:
+      try:
+        response = await start(file_path, job_type, wait_for_completion)
+        return IngestListBatchResult(file_path=file_path, response=response)
+      except Exception as e:
+        return IngestListBatchResult(file_path=file_path, error=e)
+
+    # Ein neuer Pfad wird erst gelesen, wenn ein Worker frei ist: nie mehr als max_concurrency offene Dateien
+    async with aclosing(bounded_map(run, file_paths, max_concurrency)) as results:
+      async for result in results:
+        yield result
 
   async def check_task_status(self, job_id: str) -> IngestListTaskResponse | None:
     if self.__base_url and job_id:
@@ -264,7 +416,9 @@ class IngestListIdentifierAsync(AbstractIdentifier):
 
       await self.__check_task_status(job_id)
       try:
-        return IngestListTaskResponse.from_dict(self.__response)
+        response = IngestListTaskResponse.from_dict(self.__response)
       except Exception:
         return None
+      self.__update_cached_job(response)
+      return response
     return None
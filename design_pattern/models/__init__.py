@@ -1,2 +1,4 @@
 from design_pattern.models.droid_csv_model import DroidCsvModel
-from design_pattern.models.abstract_builder import AbstractBuilder
\ No newline at end of file
+from design_pattern.models.abstract_builder import AbstractBuilder
+from design_pattern.models.abstract_poll_strategy import AbstractPollStrategy
+from design_pattern.models.abstract_result_cache import AbstractResultCache
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractPollStrategy(ABC):
+    @abstractmethod
+    def next_interval(self, polls: int, retry_after: float | None = None) -> float:
+        """
+        Seconds to wait before the next status request of a job.
+
+        :param polls: Number of status requests done for the job so far, 0 before the first one.
+        :param retry_after: Seconds from the server's Retry-After header of the last response, if any.
+        """
+        pass
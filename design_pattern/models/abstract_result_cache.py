@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractResultCache(ABC):
+    """
+    Stores identify results (as JSON serializable dicts) by a key derived from the file content.
+
+    `get` counts hits and misses, backends implement `_load`, `_store`, `delete`, `clear` and `__len__`.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> dict | None:
+        value = self._load(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key: str, value: dict):
+        self._store(key, value)
+
+    def stats(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self)}
+
+    @abstractmethod
+    def _load(self, key: str) -> dict | None:
+        """
+        The stored value, or None if there is none or it expired.
+        """
+        pass
+
+    @abstractmethod
+    def _store(self, key: str, value: dict):
+        pass
+
+    @abstractmethod
+    def delete(self, key: str):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
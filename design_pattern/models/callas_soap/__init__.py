@@ -1,14 +1,19 @@
 # Öffentliche API: nur das hier ist "sichtbar" beim from soapclient import *
 from .payloads import ExtExecuteArgsPayload, ExtExecuteResultPayload
 from .envelope import SoapEnvelope
-from .builders import ExtExecuteRequestBuilder
-from .readers import ExtExecuteResultReader
+from .builders import ExtExecuteRequestBuilder, ExtExecuteRequestTemplate
+from .readers import ExtExecuteResultReader, ExtExecuteResultStreamReader
+from .client import AsyncCallasClient, CallasBatchResult
 
 __all__ = [
     "SoapEnvelope",
     "ExtExecuteArgsPayload",
     "ExtExecuteResultPayload",
     "ExtExecuteRequestBuilder",
+    "ExtExecuteRequestTemplate",
     "ExtExecuteResultReader",
+    "ExtExecuteResultStreamReader",
+    "AsyncCallasClient",
+    "CallasBatchResult",
 ]
 
@@ -23,21 +23,25 @@ def _text(node: ET.Element | None) -> str:
 def _parse_console_out(console_out: str) -> dict[str, str | list[str]]:
     result: dict[str, str | list[str]] = {}
     for raw in console_out.splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        parts = [p for p in line.split("\t") if p != ""]
-        if not parts:
-            continue
-        key, *vals = parts
-        value = vals[0] if vals else ""
-        if key in result:
-            cur = result[key]
-            result[key] = (cur + [value]) if isinstance(cur, list) else [cur, value]
-        else:
-            result[key] = value
+        _add_console_line(result, raw)
     return result
 
+def _add_console_line(result: dict[str, str | list[str]], raw: str) -> None:
+    # eine Zeile "Schlüssel\tWert" in result übernehmen; wiederholte Schlüssel werden zur Liste
+    line = raw.strip()
+    if not line:
+        return
+    parts = [p for p in line.split("\t") if p != ""]
+    if not parts:
+        return
+    key, *vals = parts
+    value = vals[0] if vals else ""
+    if key in result:
+        cur = result[key]
+        result[key] = (cur + [value]) if isinstance(cur, list) else [cur, value]
+    else:
+        result[key] = value
+
 def _parse_hhmmss_like(s: str) -> timedelta | None:
     if not s:
         return None
@@ -1,10 +1,16 @@
 from __future__ import annotations
+import re
 from dataclasses import dataclass, field
 from typing import List
 from .payloads import ExtExecuteArgsPayload, ExtExecuteResultPayload
 from .envelope import SoapEnvelope
 
-__all__ = ["ExtExecuteRequestBuilder"]
+__all__ = ["ExtExecuteRequestBuilder", "ExtExecuteRequestTemplate"]
+
+# in XML 1.0 nicht erlaubte Zeichen, lxml lehnt sie mit ValueError ab
+_INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+# Platzhalter für die variablen Argumente beim einmaligen Rendern der Vorlage
+_PLACEHOLDER = "<args>@@ARGS@@</args>"
 
 @dataclass
 class ExtExecuteRequestBuilder:
@@ -34,3 +40,52 @@ class ExtExecuteRequestBuilder:
     def build_xml(self, pretty: bool = True) -> str:
         env = self.build_envelope()
         return env.to_xml(pretty=pretty)
+
+    def build_template(self) -> "ExtExecuteRequestTemplate":
+        """Vorlage mit User und bisherigen Argumenten; variable Argumente werden je Request angehängt."""
+        return ExtExecuteRequestTemplate(self._user_id, list(self._args))
+
+
+def _escape_arg(arg: str) -> str:
+    # wie lxml Text serialisiert: &, <, > und \r werden escaped, Anführungszeichen nicht
+    if _INVALID_XML_CHARS.search(arg):
+        raise ValueError(f"Argument enthält in XML nicht erlaubte Zeichen: {arg!r}")
+    if "&" in arg:
+        arg = arg.replace("&", "&amp;")
+    if "<" in arg:
+        arg = arg.replace("<", "&lt;")
+    if ">" in arg:
+        arg = arg.replace(">", "&gt;")
+    if "\r" in arg:
+        arg = arg.replace("\r", "&#13;")
+    return f"<args>{arg}</args>" if arg else "<args/>"
+
+
+class ExtExecuteRequestTemplate:
+    """
+    Einmal gerenderter extExecute-Request (pretty=False) mit festem User und festen Argumenten.
+
+    build_xml(*args) ergibt dasselbe wie ExtExecuteRequestBuilder().with_user(user).add_args(*fixed, *args)
+    .build_xml(pretty=False), setzt aber nur die escapten variablen Argumente zwischen den
+    vorserialisierten Anfang und Rest des Envelopes, ohne einen Baum aufzubauen.
+    """
+
+    def __init__(self, user_id: str | None = None, args: List[str] | None = None):
+        self.user_id = user_id
+        self.args = list(args or [])
+        xml = ExtExecuteRequestBuilder(user_id, self.args + [_PLACEHOLDER]).build_xml(pretty=False)
+        # der Platzhalter steht escaped im Envelope, genau einmal
+        prefix, suffix = xml.split(_escape_arg(_PLACEHOLDER))
+        self.prefix, self.suffix = prefix, suffix
+        self.prefix_bytes, self.suffix_bytes = prefix.encode("utf-8"), suffix.encode("utf-8")
+
+    def build_xml(self, *args: str) -> str:
+        if not args and not self.args:
+            raise ValueError("args darf nicht leer sein.")
+        return self.prefix + "".join(map(_escape_arg, args)) + self.suffix
+
+    def build_bytes(self, *args: str) -> bytes:
+        """Der Request UTF-8-codiert, so wie er gesendet wird."""
+        if not args and not self.args:
+            raise ValueError("args darf nicht leer sein.")
+        return b"".join((self.prefix_bytes, "".join(map(_escape_arg, args)).encode("utf-8"), self.suffix_bytes))
@@ -0,0 +1,151 @@
+from __future__ import annotations
+import asyncio
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, List, Optional, Sequence
+
+import httpx
+
+from design_pattern.utils.bounded_map import bounded_map
+from design_pattern.utils.remote_session_async import RemoteSessionAsync
+from .builders import ExtExecuteRequestTemplate
+from .envelope import SoapEnvelope
+from .payloads import ExtExecuteResultPayload
+from .readers import ExtExecuteResultStreamReader
+
+__all__ = ["AsyncCallasClient", "CallasBatchResult"]
+
+HEADERS = {
+    "Content-Type": "text/xml; charset=utf-8",
+    "SOAPAction": "",
+}
+
+
+@dataclass
+class CallasBatchResult:
+    args: List[str] = field(default_factory=list)
+    result: Optional[ExtExecuteResultPayload] = None
+    error: Optional[Exception] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+class AsyncCallasClient:
+    """
+    Asynchroner Client für den callas pdfaPilot SOAP-Server (extExecute).
+
+    Alle Requests teilen sich einen Verbindungspool (RemoteSessionAsync). Höchstens max_concurrency
+    extExecute-Aufrufe laufen gleichzeitig, der Server hat nur eine feste Anzahl Lizenz-Slots.
+    fixed_args (z.B. "--noprogress", "--outputfolder=...") stehen vor den Argumenten jedes Aufrufs,
+    der Request wird aus einer vorgerenderten Vorlage erzeugt (ExtExecuteRequestTemplate).
+
+    Ein extExecute wird per Default nicht wiederholt (max_retries=0): nach einem Timeout könnte der
+    Job auf dem Server noch laufen und einen zweiten Slot belegen.
+    """
+
+    def __init__(
+            self,
+            endpoint_url: str,
+            max_concurrency: int = 4,
+            fixed_args: Sequence[str] = (),
+            user_id: str | None = None,
+            timeout: float | None = 300.0,
+            proxies: dict | None = None,
+            max_retries: int = 0,
+    ):
+        self.endpoint_url = endpoint_url
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.__template = ExtExecuteRequestTemplate(user_id, list(fixed_args))
+        self.__proxies = proxies
+        self.__max_retries = max_retries
+        self.__session: RemoteSessionAsync | None = None
+        self.__slots: asyncio.Semaphore | None = None
+
+    async def __aenter__(self) -> "AsyncCallasClient":
+        return await self.initialize()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def initialize(self) -> "AsyncCallasClient":
+        if self.__session is None:
+            # nie mehr Verbindungen als Slots, alle bleiben für den nächsten Aufruf offen
+            self.__session = RemoteSessionAsync(
+                base_url=self.endpoint_url,
+                proxies=self.__proxies,
+                max_retries=self.__max_retries,
+                limits=httpx.Limits(max_connections=self.max_concurrency,
+                                    max_keepalive_connections=self.max_concurrency),
+            )
+            self.__slots = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def aclose(self):
+        if self.__session is not None:
+            await self.__session.aclose()
+            self.__session = None
+            self.__slots = None
+
+    async def execute(self, *args: str) -> ExtExecuteResultPayload:
+        """
+        Ein extExecute mit fixed_args + args. Ein SOAP Fault wird als SoapFault geworfen,
+        andere HTTP-Fehler als httpx.HTTPStatusError.
+        """
+        await self.initialize()
+        request = self.__template.build_bytes(*args)
+        async with self.__slots:
+            response = await self.__session.post(self.endpoint_url, content=request, headers=HEADERS,
+                                                 timeout=self.timeout)
+        # ein Fault kommt laut SOAP 1.1 mit Status 500, from_xml wirft dann SoapFault
+        if response.status_code == 500 and response.content.lstrip().startswith(b"<"):
+            SoapEnvelope.from_xml(response.content, ExtExecuteResultPayload)
+        response.raise_for_status()
+        return SoapEnvelope.from_xml(response.content, ExtExecuteResultPayload).payload
+
+    async def execute_streaming(self, *args: str, sink: Callable[[str], None] | None = None
+                                ) -> ExtExecuteResultStreamReader:
+        """
+        Wie execute, aber die Antwort wird beim Empfang gelesen (ExtExecuteResultStreamReader):
+        consoleOut geht zeilenweise an sink bzw. in reader.console_map und liegt nie ganz im
+        Speicher. Ein Fault wird geworfen, sobald er gelesen ist. Ohne Wiederholungen.
+        """
+        await self.initialize()
+        request = self.__template.build_bytes(*args)
+        reader = ExtExecuteResultStreamReader(sink)
+        async with self.__slots:
+            async with self.__session.stream("POST", self.endpoint_url, content=request, headers=HEADERS,
+                                             timeout=self.timeout) as response:
+                # ein Fault kommt mit Status 500 als XML und wird vom Reader geworfen
+                if response.status_code != 500 or "xml" not in response.headers.get("Content-Type", ""):
+                    response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    reader.feed(chunk)
+                response.raise_for_status()
+        reader.close()
+        return reader
+
+    async def execute_many(
+            self,
+            arg_lists: Iterable[Sequence[str]] | AsyncIterable[Sequence[str]],
+    ) -> AsyncIterator[CallasBatchResult]:
+        """
+        Führt extExecute für jede Argumentliste aus, höchstens max_concurrency gleichzeitig.
+
+        Die Ergebnisse kommen in der Reihenfolge ihrer Fertigstellung; ein Fehler wird pro Aufruf
+        im CallasBatchResult geliefert und bricht die anderen nicht ab. Argumentlisten werden erst
+        gelesen, wenn ein Slot frei wird.
+        """
+        await self.initialize()
+
+        async def run(args: Sequence[str]) -> CallasBatchResult:
+            try:
+                return CallasBatchResult(args=list(args), result=await self.execute(*args))
+            except Exception as e:
+                return CallasBatchResult(args=list(args), error=e)
+
+        async with aclosing(bounded_map(run, arg_lists, self.max_concurrency)) as results:
+            async for result in results:
+                yield result
@@ -16,6 +16,8 @@ NSMAP = {
     "ns": "http://callassoftware.com/cws.xsd",
 }
 
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
 NS = {
     "soap": SOAP_NS,
     "ns": "http://callassoftware.com/cws.xsd",  # anpassen, falls abweichend
@@ -27,6 +29,14 @@ class SoapFault(Exception):
     message: str
     detail_xml: Optional[str] = None
 
+    @classmethod
+    def from_element(cls, fault: LET._Element) -> "SoapFault":
+        code = (fault.findtext("faultcode") or "").strip()
+        msg = (fault.findtext("faultstring") or "").strip()
+        detail_el = fault.find("detail")
+        detail_xml = LET.tostring(detail_el, encoding="unicode") if detail_el is not None else None
+        return cls(code=code, message=msg, detail_xml=detail_xml)
+
     def __str__(self) -> str:
         base = f"SOAP Fault: {self.code} - {self.message}"
         return f"{base}\n{self.detail_xml}" if self.detail_xml else base
@@ -40,29 +50,24 @@ class SoapEnvelope(Generic[T]):
         env = LET.Element(f"{{{NSMAP['SOAP-ENV']}}}Envelope", nsmap=NSMAP)
         body = LET.SubElement(env, f"{{{NSMAP['SOAP-ENV']}}}Body")
 
-        et_elem: ET.Element = self.payload.to_element()
-        lxml_payload = LET.fromstring(ET.tostring(et_elem, encoding="utf-8"))
-
-        # userID erzwingen als <userID></userID>
-        for uid in lxml_payload.xpath(".//userID"):
-            if uid.text is None:
-                uid.text = ""  # verhindert Selbstschließung
-
-        body.append(lxml_payload)
+        if hasattr(self.payload, "write_lxml"):
+            # Payload baut seine Elemente direkt in den Body (ein Durchlauf)
+            self.payload.write_lxml(body)  # type: ignore[attr-defined]
+        else:
+            # Payloads mit nur to_element(): stdlib-Element über Bytes nach lxml übernehmen
+            et_elem: ET.Element = self.payload.to_element()
+            lxml_payload = LET.fromstring(ET.tostring(et_elem, encoding="utf-8"))
 
-        xml_bytes = LET.tostring(
-            env, pretty_print=pretty,
-            xml_declaration=True, encoding="UTF-8"
-        )
-        xml = xml_bytes.decode("utf-8")
+            # userID erzwingen als <userID></userID>
+            for uid in lxml_payload.iter("userID"):
+                if uid.text is None:
+                    uid.text = ""  # verhindert Selbstschließung
 
-        # optional: XML-Deklaration mit doppelten Anführungszeichen normieren
-        # (semantisch egal; nur falls deine Gegenstelle das exakt so erwartet)
-        if xml.startswith("<?xml version='1.0'"):
-            xml = xml.replace("version='1.0'", 'version="1.0"', 1)
-            xml = xml.replace("encoding='UTF-8'", 'encoding="UTF-8"', 1)
+            body.append(lxml_payload)
 
-        return xml
+        # XML-Deklaration mit doppelten Anführungszeichen selbst schreiben, lxml würde einfache verwenden
+        # (semantisch egal; nur falls die Gegenstelle das exakt so erwartet)
+        return XML_DECLARATION + LET.tostring(env, pretty_print=pretty, encoding="unicode")
 
     @classmethod
     def from_xml(cls, data: Union[str, bytes], payload_cls: Type[T]) -> "SoapEnvelope[T]":
@@ -72,11 +77,7 @@ class SoapEnvelope(Generic[T]):
         # Fault prüfen
         fault = root.find(".//soap:Fault", namespaces=NS)
         if fault is not None:
-            code = (fault.findtext("faultcode") or "").strip()
-            msg = (fault.findtext("faultstring") or "").strip()
-            detail_el = fault.find("detail")
-            detail_xml = LET.tostring(detail_el, encoding="unicode") if detail_el is not None else None
-            raise SoapFault(code=code, message=msg, detail_xml=detail_xml)
+            raise SoapFault.from_element(fault)
 
         # Header optional
         header_el = root.find("./soap:Header", namespaces=NS)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import cached_property
 from typing import List, Optional
 from lxml import etree as LET
 import xml.etree.ElementTree as ET
@@ -34,16 +36,106 @@ class ExtExecuteArgsPayload:
 
         return root
 
+    def write_lxml(self, parent: LET._Element) -> LET._Element:
+        # baut das Payload direkt als lxml-Kind von parent (SOAP-Body): keine Serialisierung und
+        # kein erneutes Parsen, die ns-Präfixe kommen aus der nsmap des Envelopes
+        root = LET.SubElement(parent, _qn("ns", "extExecute"))
+        args_el = LET.SubElement(root, "args")
+
+        uid = LET.SubElement(args_el, "userID")
+        # leerer String -> lxml schreibt <userID></userID>
+        uid.text = "" if self.user_id in (None, "") else str(self.user_id)
+
+        for a in self.args:
+            arg_el = LET.SubElement(args_el, "args")
+            if a:
+                # wie to_element: leere Argumente bleiben <args/>
+                arg_el.text = a
+
+        return root
 
     @staticmethod
     def expected_tag() -> str:
         return _qn("ns", "extExecute")
 
+# Schlüssel der consoleOut-Zeilen je Eigenschaft, ohne Beachtung der Groß-/Kleinschreibung
+CONSOLE_KEYS = {
+    "process_id": "processid",
+    "pages": "pages",
+    "input_path": "input",
+    "output_path": "output",
+    "pdfa": "pdfa",
+    "duration": "duration",
+}
+
+
+def _first(value: str | list[str] | None) -> Optional[str]:
+    # wiederholte Schlüssel: der erste Wert zählt
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value.strip()) if value is not None else None
+    except ValueError:
+        return None
+
+
 @dataclass
 class ExtExecuteResultPayload:
+    """
+    Ergebnis eines extExecute. console_map und die typisierten Eigenschaften werden beim ersten
+    Zugriff aus console_out berechnet und danach nur noch gelesen; console_out gilt als unveränderlich.
+    """
     console_out: Optional[str] = None
     return_code: Optional[int] = None
 
+    @property
+    def success(self) -> bool:
+        return self.return_code == 0
+
+    @cached_property
+    def console_map(self) -> dict[str, str | list[str]]:
+        # einmal zerlegen: "Schlüssel\tWert" je Zeile, wiederholte Schlüssel als Liste
+        return _parse_console_out(self.console_out) if self.console_out else {}
+
+    @cached_property
+    def _console_index(self) -> dict[str, str | list[str]]:
+        # Schlüssel in Kleinschreibung -> Wert, der erste von gleichnamigen Schlüsseln gewinnt
+        index: dict[str, str | list[str]] = {}
+        for key, value in self.console_map.items():
+            index.setdefault(key.lower(), value)
+        return index
+
+    def _console_value(self, name: str) -> Optional[str]:
+        return _first(self._console_index.get(CONSOLE_KEYS[name]))
+
+    @cached_property
+    def process_id(self) -> Optional[int]:
+        return _to_int(self._console_value("process_id"))
+
+    @cached_property
+    def pages(self) -> Optional[int]:
+        return _to_int(self._console_value("pages"))
+
+    @cached_property
+    def input_path(self) -> Optional[str]:
+        return self._console_value("input_path")
+
+    @cached_property
+    def output_path(self) -> Optional[str]:
+        return self._console_value("output_path")
+
+    @cached_property
+    def pdfa(self) -> Optional[str]:
+        return self._console_value("pdfa")
+
+    @cached_property
+    def duration(self) -> Optional[timedelta]:
+        return _parse_hhmmss_like(self._console_value("duration") or "")
+
     @classmethod
     def from_xml_element(cls, el: LET._Element) -> "ExtExecuteResultPayload":
         # el entspricht <ns:extExecuteResult>
@@ -1,10 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterable, Optional
 import xml.etree.ElementTree as ET
+from lxml import etree as LET
 from .payloads import ExtExecuteResultPayload
-from .envelope import SoapEnvelope
+from .envelope import SoapEnvelope, SoapFault, SOAP_NS
+from ._utils import _add_console_line
 
-__all__ = ["ExtExecuteResultReader"]
+__all__ = ["ExtExecuteResultReader", "ExtExecuteResultStreamReader"]
 
 @dataclass
 class ExtExecuteResultReader:
@@ -55,3 +58,129 @@ class ExtExecuteResultReader:
     @property
     def duration(self):
         return self._payload.duration
+
+
+_BODY = f"{{{SOAP_NS}}}Body"
+_FAULT = f"{{{SOAP_NS}}}Fault"
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+class _ExtExecuteResultTarget:
+    # lxml Parser-Target: bekommt Start/Ende der Elemente und den Text in Stücken
+
+    def __init__(self, sink: Callable[[str], None]):
+        self.sink = sink
+        self.stack: list[str] = []
+        self.in_console = False
+        self.in_return_code = False
+        self.partial = ""
+        self.return_code: list[str] | None = None
+        self.has_body = False
+        self.fault: LET.TreeBuilder | None = None
+        self.fault_depth = 0
+
+    def start(self, tag: str, attrib, nsmap):
+        self.stack.append(tag)
+        if self.fault is not None:
+            self.fault.start(tag, attrib, nsmap)
+        elif tag == _FAULT:
+            # der Fault ist klein und wird als Baum gesammelt, wie bei SoapEnvelope.from_xml
+            self.fault = LET.TreeBuilder()
+            self.fault.start(tag, attrib, nsmap)
+            self.fault_depth = len(self.stack)
+        elif len(self.stack) == 2 and tag == _BODY:
+            self.has_body = True
+        elif len(self.stack) == 4 and self.stack[1] == _BODY:
+            # Envelope/Body/extExecuteResult/<Feld>, qualifiziert oder unqualifiziert
+            name = _local(tag)
+            if name == "consoleOut":
+                self.in_console = True
+            elif name == "returnCode" and self.return_code is None:
+                self.return_code = []
+                self.in_return_code = True
+
+    def data(self, data: str):
+        if self.fault is not None:
+            self.fault.data(data)
+        elif self.in_console:
+            lines = (self.partial + data).split("\n")
+            self.partial = lines.pop()
+            for line in lines:
+                self.sink(line.rstrip("\r"))
+        elif self.in_return_code and len(self.stack) == 4:
+            self.return_code.append(data)
+
+    def end(self, tag: str):
+        depth = len(self.stack)
+        self.stack.pop()
+        if self.fault is not None:
+            self.fault.end(tag)
+            if depth == self.fault_depth:
+                # sofort werfen, der Rest der Antwort wird nicht mehr gelesen
+                raise SoapFault.from_element(self.fault.close())
+        elif self.in_console and depth == 4:
+            self.in_console = False
+            if self.partial:
+                self.sink(self.partial.rstrip("\r"))
+                self.partial = ""
+        elif self.in_return_code and depth == 4:
+            self.in_return_code = False
+
+    def close(self) -> ExtExecuteResultPayload:
+        if not self.has_body:
+            raise ValueError("SOAP Body fehlt")
+        rc: Optional[int] = None
+        if self.return_code is not None:
+            try:
+                rc = int("".join(self.return_code).strip())
+            except ValueError:
+                rc = None
+        return ExtExecuteResultPayload(console_out=None, return_code=rc)
+
+
+class ExtExecuteResultStreamReader:
+    """
+    Liest eine extExecute-Antwort inkrementell, ohne sie ganz im Speicher zu halten.
+
+    Die Antwort wird stückweise mit feed() übergeben (z.B. aus response.aiter_bytes()). Der Text von
+    consoleOut wird nie als Ganzes zusammengesetzt: jede Zeile geht an sink, ohne sink wird sie wie bei
+    _parse_console_out in console_map übernommen. Ein SOAP Fault wird als SoapFault geworfen, sobald
+    sein Element vollständig ist. close() liefert das Payload, console_out ist darin None; ohne sink
+    trägt es console_map, so dass auch pages, duration usw. verfügbar sind.
+    """
+
+    def __init__(self, sink: Optional[Callable[[str], None]] = None):
+        self.console_map: dict[str, str | list[str]] = {}
+        self.__own_map = sink is None
+        self.__parser = LET.XMLParser(
+            target=_ExtExecuteResultTarget(sink or (lambda line: _add_console_line(self.console_map, line))),
+            huge_tree=True,
+        )
+        self.payload: ExtExecuteResultPayload | None = None
+
+    def feed(self, data: bytes | str):
+        self.__parser.feed(data)
+
+    def close(self) -> ExtExecuteResultPayload:
+        self.payload = self.__parser.close()
+        if self.__own_map:
+            # schon zerlegt: die typisierten Eigenschaften des Payloads lesen diese Map
+            self.payload.console_map = self.console_map
+        return self.payload
+
+    @classmethod
+    def read(cls, source: bytes | BinaryIO | Iterable[bytes], sink: Optional[Callable[[str], None]] = None,
+             chunk_size: int = 1 << 16) -> "ExtExecuteResultStreamReader":
+        """Liest eine ganze Antwort aus Bytes, einer Binärdatei oder einem Iterable von Chunks."""
+        reader = cls(sink)
+        if isinstance(source, (bytes, bytearray)):
+            source = [source]
+        elif hasattr(source, "read"):
+            source = iter(lambda: source.read(chunk_size), b"")
+        for chunk in source:
+            reader.feed(chunk)
+        reader.close()
+        return reader
@@ -1,9 +1,19 @@
 from design_pattern.utils.cast import Cast
 from design_pattern.utils.remote_session import RemoteSession
 from design_pattern.utils.remote_session_async import RemoteSessionAsync
+from design_pattern.utils.multipart_stream import MultipartFileStream, AsyncMultipartFileStream
+from design_pattern.utils.result_cache import MemoryResultCache, SqliteResultCache, file_digest, result_cache_key
+from design_pattern.utils.bounded_map import bounded_map
 
 __all__ = [
   "Cast",
   "RemoteSession",
-  "RemoteSessionAsync"
+  "RemoteSessionAsync",
+  "MultipartFileStream",
+  "AsyncMultipartFileStream",
+  "MemoryResultCache",
+  "SqliteResultCache",
+  "file_digest",
+  "result_cache_key",
+  "bounded_map"
 ]
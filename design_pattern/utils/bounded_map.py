@@ -0,0 +1,70 @@
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+async def bounded_map(
+        run: Callable[[T], Awaitable[R]],
+        items: Iterable[T] | AsyncIterable[T],
+        max_concurrency: int,
+) -> AsyncIterator[R]:
+    """
+    Awaits run(item) for every item with at most `max_concurrency` running at once and yields the results
+    in the order they complete.
+
+    A fixed number of workers share the items: the next item is only read when a worker is free, and the
+    result queue is bounded, so a slow consumer also stops the reading. `run` should turn per-item failures
+    into results; an exception from `run` or from reading the items is raised after the other workers
+    finished. Closing the generator early cancels the running calls.
+    """
+    done = object()
+    workers_count = max(1, max_concurrency)
+    results: asyncio.Queue = asyncio.Queue(maxsize=workers_count)
+    next_item = _item_source(items, done)
+
+    async def worker():
+        try:
+            while (item := await next_item()) is not done:
+                await results.put(await run(item))
+        except asyncio.CancelledError:
+            # the consumer stopped and no longer reads the queue
+            raise
+        except BaseException:
+            await results.put(done)
+            raise
+        await results.put(done)
+
+    workers = [asyncio.create_task(worker()) for _ in range(workers_count)]
+    try:
+        finished = 0
+        while finished < len(workers):
+            result = await results.get()
+            if result is done:
+                finished += 1
+            else:
+                yield result
+        # raise errors of run or of reading the items
+        await asyncio.gather(*workers)
+    finally:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _item_source(items: Iterable[T] | AsyncIterable[T], done: object) -> Callable[[], Awaitable]:
+    # one source for all workers; an async iterator must not be advanced concurrently
+    if isinstance(items, AsyncIterable):
+        iterator = aiter(items)
+        lock = asyncio.Lock()
+
+        async def next_item():
+            async with lock:
+                return await anext(iterator, done)
+    else:
+        iterator = iter(items)
+
+        async def next_item():
+            return next(iterator, done)
+    return next_item
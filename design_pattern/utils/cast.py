@@ -1,6 +1,8 @@
+import itertools
 import json
-from dataclasses import dataclass, is_dataclass, fields
+from dataclasses import dataclass, is_dataclass, fields, MISSING
 from enum import EnumMeta, Enum
+from typing import Iterable
 
 
 class Cast:
@@ -10,6 +12,14 @@ class Cast:
     """
     encoding = 'utf-8'
 
+    # every spelling of the strings __is_none treats as empty, for a single set lookup in bulk casts
+    __none_strings = frozenset(
+        [''] + [''.join(chars) for word in ('null', 'none') for chars in itertools.product(*zip(word, word.upper()))]
+    )
+
+    # compiled conversion plans per dataclass: lower case key -> (field name, converter)
+    __plans: dict[type, dict[str, tuple[str, callable]]] = {}
+
     def __new__(cls, value: any, _type: type) -> any:
         """
         Cast a value to the give class. This is useful to cast dict to dataclasses and some non-trivial types.
@@ -89,15 +99,146 @@ class Cast:
         :return: A new dictionary that try to keep the same data type from dataclass.
         """
         valid_dic = {}
-        fields_ = fields(kls)
-        fields_list_lower = [f.name.lower() for f in fields(kls)]
+        plan = cls.plan(kls)
         for k, value in dto.items():
-            index = fields_list_lower.index(k.lower())  # Compare all in lower case. Avoid Caps sensitive.
-            safe_key = fields_[index].name
+            safe_key, converter = plan[k.lower()]  # Compare all in lower case. Avoid Caps sensitive.
             if not cls.__is_none(value):
-                valid_dic[safe_key] = Cast(value, fields_[index].type)
+                valid_dic[safe_key] = converter(value)
         return valid_dic
 
+    @classmethod
+    def many(cls, rows: Iterable[dict], kls: dataclass, columns: bool = False) -> list | dict[str, list]:
+        """
+        Cast many dictionaries sharing the same keys (e.g. csv.DictReader rows) to a dataclass at once.
+
+        The key -> field mapping is resolved once from the keys of the first row, afterwards every column is
+        converted with a single converter.
+
+        Examples:
+                Cast.many(csv.DictReader(f), DroidCsvModel) will cast rows -> [DroidCsvModel, ...]
+
+                Cast.many(csv.DictReader(f), DroidCsvModel, columns=True) will cast rows -> {'puid': [...], ...}
+
+        :param rows: The dictionaries to be cast.
+        :param kls: Expect a dataclass type.
+        :param columns: If True a dictionary of field name -> list of values is returned instead of instances.
+                        Empty values are filled with the field's default.
+        :return: A list of dataclass instances or a dictionary of columns.
+        :raises ValueError: If a key is not a field or a row has no value for a field without default.
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        plan = cls.plan(kls)
+        types = {f.name: f.type for f in fields(kls)}
+        none_strings = cls.__none_strings
+        converted = {}
+        if rows:
+            for key in rows[0].keys():
+                try:
+                    safe_key, converter = plan[key.lower()]
+                except KeyError:
+                    raise ValueError(f"{key} is not a field of {kls}")
+                _type = types[safe_key]
+                values = [row.get(key) for row in rows]
+                converted[safe_key] = [
+                    None if v is None or (type(v) is str and v in none_strings)
+                    else v if type(v) is _type else converter(v)
+                    for v in values
+                ]
+
+        # fill empty values with the field defaults, one column at a time
+        cols = {}
+        for f in fields(kls):
+            col = converted.get(f.name) or [None] * len(rows)
+            if f.default is not MISSING and f.default is not None:
+                col = [f.default if v is None else v for v in col]
+            elif f.default_factory is not MISSING:
+                col = [f.default_factory() if v is None else v for v in col]
+            elif f.init and f.default is MISSING:
+                # a required field, the single cast rejects a row without it as well
+                for row, v in zip(rows, col):
+                    if v is None:
+                        raise ValueError(f"{row} can't be cast to {kls}, {f.name} is missing")
+            cols[f.name] = col
+
+        if columns:
+            return cols
+        init_fields = [f for f in fields(kls) if f.init]
+        if not init_fields:
+            return [kls() for _ in rows]
+        names = [f.name for f in init_fields]
+        init_cols = [cols[n] for n in names]
+        if any(getattr(f, 'kw_only', False) for f in init_fields):
+            return [kls(**dict(zip(names, values))) for values in zip(*init_cols)]
+        # columns are in field order, so every row can be passed positionally to __init__
+        return [kls(*values) for values in zip(*init_cols)]
+
+    @classmethod
+    def plan(cls, kls: dataclass) -> dict[str, tuple[str, callable]]:
+        """
+        Returns the conversion plan of a dataclass. The plan is compiled on first use and cached afterwards,
+        so the field reflection is done only once per dataclass.
+
+        :param kls: Expect a dataclass type.
+        :return: A dictionary mapping the lower case field name to (field name, converter).
+        """
+        plan = cls.__plans.get(kls)
+        if plan is None:
+            plan = {f.name.lower(): (f.name, cls.__converter(f.type)) for f in fields(kls)}
+            cls.__plans[kls] = plan
+        return plan
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Drops all compiled conversion plans, e.g. after a dataclass was redefined.
+        """
+        cls.__plans.clear()
+
+    @classmethod
+    def __converter(cls, _type: type) -> callable:
+        # the branch of Cast(value, _type) for this type is resolved here, once per field
+        if not isinstance(_type, type):
+            # e.g. a string or generic annotation, left to Cast
+            return lambda value: Cast(value, _type)
+        none_strings = cls.__none_strings
+        if _type == bool:
+            def cast(value):
+                return json.loads(value.lower()) if isinstance(value, (str, bytes)) else bool(value)
+        elif _type == str:
+            def cast(value):
+                return str(value, Cast.encoding)
+        elif issubclass(_type, (int, float)):
+            empty = _type(0)
+
+            def cast(value):
+                return empty if value is None or (type(value) is str and value in none_strings) else _type(value)
+        elif issubclass(_type, Enum):
+            def cast(value):
+                return cls.cast_to_enum(value, _type)
+        elif issubclass(_type, (list, dict)):
+            def cast(value):
+                return json.loads(value) if isinstance(value, (str, bytes)) else _type(value)
+        elif issubclass(_type, tuple):
+            def cast(value):
+                return cls.cast_str_tuple(value) if isinstance(value, (str, bytes)) else _type(value)
+        elif is_dataclass(_type):
+            # the nested dataclass uses its own cached plan
+            def cast(value):
+                return cls.dataclass_from_dict(_type, json.loads(value) if type(value) is str else value)
+        else:
+            return lambda value: Cast(value, _type)
+
+        def convert(value):
+            # values that already have the declared type are taken as they are.
+            if type(value) is _type:
+                return value
+            try:
+                return cast(value)
+            except Exception as e:
+                print(e)
+                raise ValueError(f"{value} can't be cats to {_type}")
+        return convert
+
     @staticmethod
     def cast_to_enum(value, enum_kls: EnumMeta):
         try:
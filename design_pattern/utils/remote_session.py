@@ -7,14 +7,18 @@ import urllib.parse
 
 class RemoteSession(requests.Session):
 
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, pool_connections: int = 10, pool_maxsize: int = 10, keep_alive: bool = True):
         super().__init__()
 
         self._base_url = base_url
         retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504]
                         )
 
-        self.mount(self._base_url, HTTPAdapter(max_retries=retries))
+        self.mount(self._base_url, HTTPAdapter(max_retries=retries,
+                                               pool_connections=pool_connections,
+                                               pool_maxsize=pool_maxsize))
+        if not keep_alive:
+            self.headers['Connection'] = 'close'
 
     def post(self, url, data=None, json=None, **kwargs) -> Response:
         url = urllib.parse.urljoin(self._base_url, url)
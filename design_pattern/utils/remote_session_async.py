@@ -13,12 +13,16 @@ class RemoteSessionAsync(httpx.AsyncClient):
             proxies: dict = None,
             max_retries: int = 5,
             backoff_factor: float = 0.5,
-            status_forcelist: list[int] = None
+            status_forcelist: list[int] = None,
+            limits: httpx.Limits = None,
+            http2: bool = False
     ):
         super().__init__(
             base_url=base_url,
             proxy=proxies,
-            timeout=httpx.Timeout(10.0)
+            timeout=httpx.Timeout(10.0),
+            limits=limits or httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=http2
         )
         self._max_retries = max_retries
         self._backoff_factor = backoff_factor
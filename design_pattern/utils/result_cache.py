@@ -0,0 +1,134 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from design_pattern.models.abstract_result_cache import AbstractResultCache
+
+
+def file_digest(file_path: str, algorithm: str = 'md5', chunk_size: int = 1024 * 1024) -> str:
+    """
+    Hex digest of a file's content, read in chunks of `chunk_size` bytes. The default MD5 is the
+    `Stats.md5` reported in the ingest list results.
+    """
+    h = hashlib.new(algorithm)
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def result_cache_key(digest: str, job_type: str, version: str = '') -> str:
+    """
+    Cache key of a result: the content digest, the kind of job and the version of the identifying tools.
+    """
+    return f'{digest}:{job_type}:{version}'
+
+
+class MemoryResultCache(AbstractResultCache):
+    """
+    In-memory LRU cache, holds at most `max_entries` results for at most `ttl` seconds (None: no expiry).
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None, clock: Callable[[], float] = time.monotonic):
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.__clock = clock
+        self.__entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def _load(self, key: str) -> dict | None:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            stored, value = entry
+            if self.ttl is not None and self.__clock() - stored > self.ttl:
+                del self.__entries[key]
+                return None
+            self.__entries.move_to_end(key)
+            return value
+
+    def _store(self, key: str, value: dict):
+        with self.__lock:
+            self.__entries[key] = (self.__clock(), value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+class SqliteResultCache(AbstractResultCache):
+    """
+    On-disk cache in a SQLite database, so results survive restarts and can be shared between processes.
+    Holds at most `max_entries` results (the least recently used are evicted) for at most `ttl` seconds.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100000, ttl: float | None = None,
+                 clock: Callable[[], float] = time.time):
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__db.execute('PRAGMA journal_mode=WAL')
+        self.__db.execute('CREATE TABLE IF NOT EXISTS results ('
+                          'key TEXT PRIMARY KEY, value TEXT NOT NULL, stored REAL NOT NULL, used REAL NOT NULL)')
+        self.__db.execute('CREATE INDEX IF NOT EXISTS results_used ON results (used)')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.__db.close()
+
+    def _load(self, key: str) -> dict | None:
+        now = self.__clock()
+        with self.__lock:
+            row = self.__db.execute('SELECT value, stored FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if self.ttl is not None and now - row[1] > self.ttl:
+                self.__db.execute('DELETE FROM results WHERE key = ?', (key,))
+                return None
+            self.__db.execute('UPDATE results SET used = ? WHERE key = ?', (now, key))
+        return json.loads(row[0])
+
+    def _store(self, key: str, value: dict):
+        now = self.__clock()
+        with self.__lock:
+            self.__db.execute('INSERT OR REPLACE INTO results (key, value, stored, used) VALUES (?, ?, ?, ?)',
+                              (key, json.dumps(value), now, now))
+            self.__db.execute('DELETE FROM results WHERE key IN '
+                              '(SELECT key FROM results ORDER BY used DESC LIMIT -1 OFFSET ?)',
+                              (self.max_entries,))
+
+    def delete(self, key: str):
+        with self.__lock:
+            self.__db.execute('DELETE FROM results WHERE key = ?', (key,))
+
+    def clear(self):
+        with self.__lock:
+            self.__db.execute('DELETE FROM results')
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__db.execute('SELECT COUNT(*) FROM results').fetchone()[0]
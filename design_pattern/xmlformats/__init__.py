@@ -2,6 +2,7 @@ from design_pattern.xmlformats.droid_csv_xml_builder import DroidCsvXmlBuilder
 from design_pattern.xmlformats.il_results import (
     IdentifyResult,
     DateiListe,
+    LazyDateien,
     Datei,
     Stats,
     ByteCount,
@@ -16,6 +17,11 @@ from design_pattern.xmlformats.il_results import (
     XPictoolMetaex,
     LibDimagIdentify,
     parse_il_results,
+    iter_il_results,
+    parse_il_results_many,
+    IlResultsCache,
+    IdentifyResultReader,
+    IlResultTable,
 )
 
 __all__ = [
@@ -23,6 +29,7 @@ __all__ = [
     # IL results
     "IdentifyResult",
     "DateiListe",
+    "LazyDateien",
     "Datei",
     "Stats",
     "ByteCount",
@@ -37,5 +44,10 @@ __all__ = [
     "XPictoolMetaex",
     "LibDimagIdentify",
     "parse_il_results",
+    "iter_il_results",
+    "parse_il_results_many",
+    "IlResultsCache",
+    "IdentifyResultReader",
+    "IlResultTable",
 ]
 
@@ -1,22 +1,32 @@
 import csv
-from dataclasses import asdict
+from dataclasses import asdict, fields
+from typing import Iterator
 from design_pattern.models import DroidCsvModel, AbstractBuilder
-from xml.dom.minidom import Document
+from design_pattern.utils import Cast
+from xml.dom.minidom import Document, Text
 
 class DroidCsvXmlBuilder(AbstractBuilder):
-    def __init__(self, csv_file: str, xml_file: str):
+    # (attribute, xml tag) pairs in field order, resolved once for the streaming writer
+    __TAGS = [(f.name, f.name.upper()) for f in fields(DroidCsvModel)]
+
+    def __init__(self, csv_file: str, xml_file: str, streaming: bool = False):
         # store params in class
         self.__csvFile = csv_file
         self.__xmlFile = xml_file
+        self.__streaming = streaming
         self.__data = []
         self.__xmlDoc = None
 
 
     def __read_csv_file (self ):
+        with open(self.__csvFile, newline="") as f:
+            self.__data.extend(Cast.many(csv.DictReader(f), DroidCsvModel))
+
+    def __iter_csv_file(self) -> Iterator[DroidCsvModel]:
         with open(self.__csvFile, newline="") as f:
             reader = csv.DictReader(f)
             for row in reader:
-                self.__data.append( DroidCsvModel.from_dict(row) )
+                yield DroidCsvModel.from_dict(row)
 
     def __add_entry__(self, parent , obj : DroidCsvModel ):
 
@@ -30,6 +40,10 @@ class DroidCsvXmlBuilder(AbstractBuilder):
 
 
     def build(self):
+        if self.__streaming:
+            self.__build_streaming()
+            return
+
         # build steps
         # 1. read data
         self.__read_csv_file()
@@ -47,6 +61,41 @@ class DroidCsvXmlBuilder(AbstractBuilder):
         ## 3. finally write file to disk
         self.__write_xml_file()
 
+    def __build_streaming(self):
+        """
+        Reads, converts and writes one csv row at a time, so memory stays flat for any input size.
+        The output is byte-identical to the DOM based build: text is escaped by a minidom Text node,
+        indentation and self-closing tags follow Document.writexml(addindent="\t", newl="\n").
+        """
+        text = Text()
+        with open(self.__xmlFile, "w") as f:
+            f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+            rows = self.__iter_csv_file()
+            row = next(rows, None)
+            if row is None:
+                f.write("<DroidData/>\n")
+                return
+
+            f.write("<DroidData>\n")
+            while row is not None:
+                self.__write_row(f, text, row)
+                row = next(rows, None)
+            f.write("</DroidData>\n")
+
+    @classmethod
+    def __write_row(cls, f, text: Text, obj: DroidCsvModel):
+        f.write("\t<row>\n")
+        for key, tag in cls.__TAGS:
+            value = getattr(obj, key)
+            if value:
+                f.write(f"\t\t<{tag}>")
+                text.data = value
+                text.writexml(f)
+                f.write(f"</{tag}>\n")
+            else:
+                f.write(f"\t\t<{tag}/>\n")
+        f.write("\t</row>\n")
+
     def __write_xml_file(self):
         if self.__xmlDoc:
             with open(self.__xmlFile, "w") as f:
@@ -55,4 +104,4 @@ class DroidCsvXmlBuilder(AbstractBuilder):
 
     ## just for unit testing
     def get_data(self):
-        return self.__data
\ No newline at end of file
+        return self.__data
@@ -1,44 +1,196 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Iterable
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields, is_dataclass
+from collections.abc import Sequence
+from operator import attrgetter
+from functools import lru_cache, partial
+from typing import IO, Callable, FrozenSet, List, Optional, Iterable, Iterator, Tuple, Union, get_type_hints
+import hashlib
+import io
+import marshal
 import os
+import re
+import struct
+import sys
 import xml.etree.ElementTree as ET
 
+try:
+    from lxml import etree as LET
+except ImportError:  # lxml is optional here, the stdlib parser gives the same result
+    LET = None
+
 
 # ============ Helpers ============
 
 def _txt(el: Optional[ET.Element]) -> Optional[str]:
     if el is None:
         return None
-    t = el.text if el.text is not None else None
-    return t.strip() if isinstance(t, str) else t
+    # read .text once, it is a conversion from C on every access with lxml
+    t = el.text
+    return t.strip() if t is not None else None
+
+
+# a number with an optional unit: "128 kb/s", "1 920 pixels", "-3", "29.970 (30000/1001) FPS"
+_NUMBER_UNIT = re.compile(r"\s*([-+]?\d+(?:[ \u00a0]\d{3})*(?:\.\d+)?)\s*(?:\([^)]*\)\s*)?([^\d\s][^\d]*?)?\s*")
+# the parts of "1 h 2 min 3 s 40 ms"
+_DURATION_PART = re.compile(r"\s*(\d+(?:\.\d+)?)\s*([a-z]+)")
+
+_BIT_RATE_UNITS = {None: 1, "b/s": 1, "bps": 1, "bit/s": 1, "kb/s": 1000, "kbps": 1000, "kbit/s": 1000,
+                   "mb/s": 1000_000, "mbps": 1000_000, "mbit/s": 1000_000, "gb/s": 1000_000_000, "gbps": 1000_000_000}
+_FREQUENCY_UNITS = {None: 1, "hz": 1, "khz": 1000, "mhz": 1000_000}
+_DURATION_UNITS = {None: 1, "ms": 0.001, "s": 1, "sec": 1, "min": 60, "mn": 60, "h": 3600}
+
+
+def _number_unit(t: Optional[str]) -> Optional[tuple[Union[int, float], Optional[str]]]:
+    """``(value, unit)`` of a numeric text, None if it does not start with a number.
+
+    The value is an int unless the text has a decimal point; digit groups separated by blanks
+    ("1 920") are joined. The unit is the rest of the text, None if there is none.
+    """
+    if not t:
+        return None
+    if t.isdecimal():
+        return int(t), None
+    m = _NUMBER_UNIT.fullmatch(t)
+    if m is None:
+        return None
+    number, unit = m.groups()
+    if " " in number or "\u00a0" in number:
+        number = number.replace(" ", "").replace("\u00a0", "")
+    return (float(number) if "." in number else int(number)), unit
 
 
 def _int(el: Optional[ET.Element]) -> Optional[int]:
     t = _txt(el)
-    if t in (None, "", "NaN"):
+    if not t:
         return None
-    try:
+    if t.isdecimal():
         return int(t)
-    except Exception:
-        # some values may include units or be malformed; best effort: extract leading digits
-        digits = "".join(ch for ch in t if ch.isdigit())
+    # a sign, a unit or digit groups ("26 210 bytes"); the unit is ignored
+    value = _number_unit(t)
+    return int(value[0]) if value is not None else None
+
+
+def _number(el: Optional[ET.Element]) -> Optional[Union[int, float]]:
+    """A count or a rate with its unit ignored ("2 channels", "25.000 FPS")."""
+    value = _number_unit(_txt(el))
+    return value[0] if value is not None else None
+
+
+def _scaled(units: dict, to: type = int) -> Callable[[Optional[ET.Element]], Optional[Union[int, float]]]:
+    """A converter to the base unit of ``units`` (unit in lower case -> factor, None for no unit).
+    Values in other units are None."""
+    def convert(el: Optional[ET.Element]):
+        value = _number_unit(_txt(el))
+        if value is None:
+            return None
+        factor = units.get(value[1].lower() if value[1] is not None else None)
+        return to(value[0] * factor) if factor is not None else None
+    return convert
+
+
+_bit_rate = _scaled(_BIT_RATE_UNITS)
+_frequency = _scaled(_FREQUENCY_UNITS, to=float)
+
+
+def _duration(el: Optional[ET.Element]) -> Optional[float]:
+    """Seconds from "205.000", "3 min 25 s", "1 h 2 min" or "00:03:25.120"."""
+    t = _txt(el)
+    if not t:
+        return None
+    value = _number_unit(t)
+    if value is not None and value[1] is None:
+        return float(value[0])
+    if ":" in t:
         try:
-            return int(digits) if digits else None
-        except Exception:
+            seconds = 0.0
+            for part in t.split(":"):
+                seconds = seconds * 60 + float(part)
+            return seconds
+        except ValueError:
+            return None
+    seconds = 0.0
+    end = 0
+    for m in _DURATION_PART.finditer(t):
+        factor = _DURATION_UNITS.get(m.group(2))
+        if factor is None or m.start() != end:
             return None
+        seconds += float(m.group(1)) * factor
+        end = m.end()
+    return seconds if end and end == len(t) else None
+
+
+def _itxt(el: Optional[ET.Element]) -> Optional[str]:
+    # interned: tool versions, PUIDs, MIME types etc. repeat in every entry and are stored once
+    t = _txt(el)
+    return sys.intern(t) if t is not None else None
+
+
+def _intern(v: Optional[str]) -> Optional[str]:
+    return sys.intern(v) if v is not None else None
+
+
+def _plain(v: Optional[str]) -> Optional[str]:
+    return v
 
 
 def _attr(el: Optional[ET.Element], name: str) -> Optional[str]:
+    # the attributes are statuses, versions and dates of the tools, interned like _itxt
     if el is None:
         return None
-    return el.get(name)
+    return _intern(el.get(name))
+
+
+def _from_attrs(el: ET.Element, table: dict) -> dict:
+    """Convert the attributes of ``el``; ``table`` maps an attribute to ``(field name, converter)``."""
+    return {name: convert(el.get(attr)) for attr, (name, convert) in table.items()}
+
+
+def _slots_dataclass(cls):
+    """``@dataclass(slots=True)``, also on Python 3.9 where dataclass has no slots argument.
+
+    Without a per-instance ``__dict__`` an instance only holds its field values, which matters
+    when 100k parsed entries are kept in memory.
+    """
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    cls = dataclass(cls)
+    names = tuple(f.name for f in fields(cls))
+    ns = {k: v for k, v in cls.__dict__.items() if k not in names + ("__dict__", "__weakref__")}
+    ns["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, ns)
+
+
+def _int_value(v: Optional[str]) -> Optional[int]:
+    try:
+        return int(v) if v is not None else None
+    except ValueError:
+        return None
+
+
+def _from_children(el: ET.Element, table: dict) -> dict:
+    """Convert the children of ``el`` in a single pass.
+
+    ``table`` maps a child tag to ``(field name, converter)``. As with ``el.find`` the first child
+    with a tag wins; fields without a child keep their dataclass default.
+    """
+    values = {}
+    get = table.get
+    for child in el:
+        spec = get(child.tag)
+        if spec is not None:
+            name, convert = spec
+            if name not in values:
+                values[name] = convert(child)
+    return values
 
 
 # ============ Dataclasses ============
 
-@dataclass
+@_slots_dataclass
 class ByteCount:
     lf: Optional[int] = None
     cr: Optional[int] = None
@@ -63,37 +215,24 @@ class ByteCount:
     lowerC_t: Optional[int] = None
     zeichenformat: Optional[str] = None
 
+    # child tag -> (field, converter), see _from_children
+    _CHILDREN = {
+        **{tag: (tag, _int) for tag in (
+            "lf", "cr", "tab", "csvSemicolonFirstLine", "csvLF", "semicolon", "pipe", "comma", "colon",
+            "minus", "equal", "singleQuote", "doubleQuote", "null", "blank", "upperC_D", "upperC_O",
+            "upperC_T", "lowerC_d", "lowerC_o", "lowerC_t",
+        )},
+        "zeichenformat": ("zeichenformat", _itxt),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "ByteCount":
         if el is None:
             return cls()
-        return cls(
-            lf=_int(el.find("lf")),
-            cr=_int(el.find("cr")),
-            tab=_int(el.find("tab")),
-            csvSemicolonFirstLine=_int(el.find("csvSemicolonFirstLine")),
-            csvLF=_int(el.find("csvLF")),
-            semicolon=_int(el.find("semicolon")),
-            pipe=_int(el.find("pipe")),
-            comma=_int(el.find("comma")),
-            colon=_int(el.find("colon")),
-            minus=_int(el.find("minus")),
-            equal=_int(el.find("equal")),
-            singleQuote=_int(el.find("singleQuote")),
-            doubleQuote=_int(el.find("doubleQuote")),
-            null=_int(el.find("null")),
-            blank=_int(el.find("blank")),
-            upperC_D=_int(el.find("upperC_D")),
-            upperC_O=_int(el.find("upperC_O")),
-            upperC_T=_int(el.find("upperC_T")),
-            lowerC_d=_int(el.find("lowerC_d")),
-            lowerC_o=_int(el.find("lowerC_o")),
-            lowerC_t=_int(el.find("lowerC_t")),
-            zeichenformat=_txt(el.find("zeichenformat")),
-        )
+        return cls(**_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class Stats:
     status: Optional[str] = None
     md5: Optional[str] = None
@@ -103,22 +242,26 @@ class Stats:
     created: Optional[int] = None
     byte_count: ByteCount = field(default_factory=ByteCount)
 
+    _ATTRS = {
+        "status": ("status", _intern),
+    }
+    _CHILDREN = {
+        "md5": ("md5", _txt),
+        "filesize": ("filesize", _int),
+        "filename": ("filename", _txt),
+        "lastmod": ("lastmod", _int),
+        "created": ("created", _int),
+        "byte-count": ("byte_count", ByteCount.from_element),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "Stats":
         if el is None:
             return cls()
-        return cls(
-            status=_attr(el, "status"),
-            md5=_txt(el.find("md5")),
-            filesize=_int(el.find("filesize")),
-            filename=_txt(el.find("filename")),
-            lastmod=_int(el.find("lastmod")),
-            created=_int(el.find("created")),
-            byte_count=ByteCount.from_element(el.find("byte-count")),
-        )
+        return cls(**_from_attrs(el, cls._ATTRS), **_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class FileInfo:
     status: Optional[str] = None
     version: Optional[str] = None
@@ -128,22 +271,26 @@ class FileInfo:
     file_mime_type: Optional[str] = None
     file_mime_encoding: Optional[str] = None
 
+    _ATTRS = {
+        "status": ("status", _intern),
+        "version": ("version", _intern),
+    }
+    _CHILDREN = {
+        "file-filename": ("file_filename", _txt),
+        "file-version": ("file_version", _itxt),
+        "file-type": ("file_type", _itxt),
+        "file-mime-type": ("file_mime_type", _itxt),
+        "file-mime-encoding": ("file_mime_encoding", _itxt),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "FileInfo":
         if el is None:
             return cls()
-        return cls(
-            status=_attr(el, "status"),
-            version=_attr(el, "version"),
-            file_filename=_txt(el.find("file-filename")),
-            file_version=_txt(el.find("file-version")),
-            file_type=_txt(el.find("file-type")),
-            file_mime_type=_txt(el.find("file-mime-type")),
-            file_mime_encoding=_txt(el.find("file-mime-encoding")),
-        )
+        return cls(**_from_attrs(el, cls._ATTRS), **_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class SimpleMagic:
     status: Optional[str] = None
     version: Optional[str] = None
@@ -152,21 +299,25 @@ class SimpleMagic:
     message: Optional[str] = None
     simplename: Optional[str] = None
 
+    _ATTRS = {
+        "status": ("status", _intern),
+        "version": ("version", _intern),
+    }
+    _CHILDREN = {
+        "simplemagic-filename": ("filename", _itxt),
+        "simplemagic-mime-type": ("mime_type", _itxt),
+        "simplemagic-message": ("message", _itxt),
+        "simplemagic-simplename": ("simplename", _itxt),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "SimpleMagic":
         if el is None:
             return cls()
-        return cls(
-            status=_attr(el, "status"),
-            version=_attr(el, "version"),
-            filename=_txt(el.find("simplemagic-filename")),
-            mime_type=_txt(el.find("simplemagic-mime-type")),
-            message=_txt(el.find("simplemagic-message")),
-            simplename=_txt(el.find("simplemagic-simplename")),
-        )
+        return cls(**_from_attrs(el, cls._ATTRS), **_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class DroidResult:
     mimetype: Optional[str] = None
     typename: Optional[str] = None
@@ -174,20 +325,22 @@ class DroidResult:
     x_version: Optional[str] = None
     method: Optional[str] = None
 
+    _CHILDREN = {
+        "droid-mimetype": ("mimetype", _itxt),
+        "droid-typename": ("typename", _itxt),
+        "droid-puid": ("puid", _itxt),
+        "droid-x-version": ("x_version", _itxt),
+        "droid-method": ("method", _itxt),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "DroidResult":
         if el is None:
             return cls()
-        return cls(
-            mimetype=_txt(el.find("droid-mimetype")),
-            typename=_txt(el.find("droid-typename")),
-            puid=_txt(el.find("droid-puid")),
-            x_version=_txt(el.find("droid-x-version")),
-            method=_txt(el.find("droid-method")),
-        )
+        return cls(**_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class Droid:
     container_sigversion: Optional[str] = None
     sigdate: Optional[str] = None
@@ -196,21 +349,25 @@ class Droid:
     version: Optional[str] = None
     result: DroidResult = field(default_factory=DroidResult)
 
+    _ATTRS = {
+        "container-sigversion": ("container_sigversion", _intern),
+        "sigdate": ("sigdate", _intern),
+        "sigversion": ("sigversion", _intern),
+        "status": ("status", _intern),
+        "version": ("version", _intern),
+    }
+    _CHILDREN = {
+        "droid-result": ("result", DroidResult.from_element),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "Droid":
         if el is None:
             return cls()
-        return cls(
-            container_sigversion=_attr(el, "container-sigversion"),
-            sigdate=_attr(el, "sigdate"),
-            sigversion=_attr(el, "sigversion"),
-            status=_attr(el, "status"),
-            version=_attr(el, "version"),
-            result=DroidResult.from_element(el.find("droid-result")),
-        )
+        return cls(**_from_attrs(el, cls._ATTRS), **_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class Jhove:
     builddate: Optional[str] = None
     status: Optional[str] = None
@@ -238,169 +395,183 @@ class Jhove:
     cnt_chars: Optional[str] = None
     line_endings: Optional[str] = None
 
+    _ATTRS = {
+        "builddate": ("builddate", _intern),
+        "status": ("status", _intern),
+    }
+    _CHILDREN = {
+        "jhove-format": ("format", _itxt),
+        "jhove-version": ("version", _itxt),
+        "jhove-wellformed": ("wellformed", _itxt),
+        "jhove-valid": ("valid", _itxt),
+        "jhove-mime": ("mime", _itxt),
+        "jhove-compression": ("compression", _itxt),
+        "jhove-audio-numchannels": ("audio_numchannels", _txt),
+        "jhove-audio-codec": ("audio_codec", _txt),
+        "jhove-audio-abspieldauer": ("audio_abspieldauer", _txt),
+        "jhove-audio-abtastrate": ("audio_abtastrate", _txt),
+        "jhove-audio-bittiefe": ("audio_bittiefe", _txt),
+        "jhove-audio_name": ("audio_name", _txt),
+        "jhove-audio_comment": ("audio_comment", _txt),
+        "jhove-audio_creationdate": ("audio_creationdate", _txt),
+        "jhove-image-length": ("image_length", _txt),
+        "jhove-image-width": ("image_width", _txt),
+        "jhove-color": ("color", _itxt),
+        "jhove-bitspersample": ("bitspersample", _txt),
+        "jhove-pdf-profile": ("pdf_profile", _itxt),
+        "jhove-cnt-pages": ("cnt_pages", _txt),
+        "jhove-cnt-images": ("cnt_images", _txt),
+        "jhove-cnt-chars": ("cnt_chars", _txt),
+        "jhove-line-endings": ("line_endings", _itxt),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "Jhove":
         if el is None:
             return cls()
-        def g(name: str) -> Optional[str]:
-            return _txt(el.find(name))
-        return cls(
-            builddate=_attr(el, "builddate"),
-            status=_attr(el, "status"),
-            format=g("jhove-format"),
-            version=g("jhove-version"),
-            wellformed=g("jhove-wellformed"),
-            valid=g("jhove-valid"),
-            mime=g("jhove-mime"),
-            compression=g("jhove-compression"),
-            audio_numchannels=g("jhove-audio-numchannels"),
-            audio_codec=g("jhove-audio-codec"),
-            audio_abspieldauer=g("jhove-audio-abspieldauer"),
-            audio_abtastrate=g("jhove-audio-abtastrate"),
-            audio_bittiefe=g("jhove-audio-bittiefe"),
-            audio_name=g("jhove-audio_name"),
-            audio_comment=g("jhove-audio_comment"),
-            audio_creationdate=g("jhove-audio_creationdate"),
-            image_length=g("jhove-image-length"),
-            image_width=g("jhove-image-width"),
-            color=g("jhove-color"),
-            bitspersample=g("jhove-bitspersample"),
-            pdf_profile=g("jhove-pdf-profile"),
-            cnt_pages=g("jhove-cnt-pages"),
-            cnt_images=g("jhove-cnt-images"),
-            cnt_chars=g("jhove-cnt-chars"),
-            line_endings=g("jhove-line-endings"),
-        )
+        return cls(**_from_attrs(el, cls._ATTRS), **_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class Tika:
     status: Optional[str] = None
     version: Optional[str] = None
     type: Optional[str] = None
 
+    _ATTRS = {
+        "status": ("status", _intern),
+        "version": ("version", _intern),
+    }
+    _CHILDREN = {
+        "tika-type": ("type", _itxt),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "Tika":
         if el is None:
             return cls()
-        return cls(
-            status=_attr(el, "status"),
-            version=_attr(el, "version"),
-            type=_txt(el.find("tika-type")),
-        )
+        return cls(**_from_attrs(el, cls._ATTRS), **_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class MediaInfo:
+    # numbers in base units: bit rates in bit/s, durations in seconds, the sampling rate in Hz;
+    # None for a unit that is not recognised
     status: Optional[str] = None
     version: Optional[str] = None
     tool_version: Optional[str] = None
-    audio_bit_depth: Optional[str] = None
-    audio_bit_rate: Optional[str] = None
-    audio_channels: Optional[str] = None
-    audio_duration: Optional[str] = None
+    audio_bit_depth: Optional[int] = None
+    audio_bit_rate: Optional[int] = None
+    audio_channels: Optional[int] = None
+    audio_duration: Optional[float] = None
     audio_codec: Optional[str] = None
-    audio_sampling_rate: Optional[str] = None
+    audio_sampling_rate: Optional[float] = None
     general_album: Optional[str] = None
     general_performer: Optional[str] = None
     general_track_name: Optional[str] = None
-    general_duration: Optional[str] = None
+    general_duration: Optional[float] = None
     general_format: Optional[str] = None
-    general_overall_bit_rate: Optional[str] = None
-    video_bit_rate: Optional[str] = None
+    general_overall_bit_rate: Optional[int] = None
+    video_bit_rate: Optional[int] = None
     video_color_space: Optional[str] = None
     video_display_aspect_ratio: Optional[str] = None
-    video_duration: Optional[str] = None
+    video_duration: Optional[float] = None
     video_codec: Optional[str] = None
-    video_frame_rate: Optional[str] = None
-    video_height: Optional[str] = None
-    video_width: Optional[str] = None
+    video_frame_rate: Optional[float] = None
+    video_height: Optional[int] = None
+    video_width: Optional[int] = None
+
+    _ATTRS = {
+        "status": ("status", _intern),
+        "version": ("version", _intern),
+    }
+    _CHILDREN = {
+        "Mediainfo-tool-version": ("tool_version", _itxt),
+        "Audio-bit-depth": ("audio_bit_depth", _number),
+        "Audio-bit-rate": ("audio_bit_rate", _bit_rate),
+        "Audio-channels": ("audio_channels", _number),
+        "Audio-duration": ("audio_duration", _duration),
+        "Audio-codec": ("audio_codec", _itxt),
+        "Audio-sampling-rate": ("audio_sampling_rate", _frequency),
+        "General-album": ("general_album", _txt),
+        "General-performer": ("general_performer", _txt),
+        "General-track-name": ("general_track_name", _txt),
+        "General-duration": ("general_duration", _duration),
+        "General-format": ("general_format", _itxt),
+        "General-overall-bit-rate": ("general_overall_bit_rate", _bit_rate),
+        "Video-bit-rate": ("video_bit_rate", _bit_rate),
+        "Video-color-space": ("video_color_space", _txt),
+        "Video-display-aspect-ratio": ("video_display_aspect_ratio", _txt),
+        "Video-duration": ("video_duration", _duration),
+        "Video-codec": ("video_codec", _itxt),
+        "Video-frame-rate": ("video_frame_rate", _number),
+        "Video-height": ("video_height", _number),
+        "Video-width": ("video_width", _number),
+    }
 
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "MediaInfo":
         if el is None:
             return cls()
-        def g(name: str) -> Optional[str]:
-            return _txt(el.find(name))
-        return cls(
-            status=_attr(el, "status"),
-            version=_attr(el, "version"),
-            tool_version=g("Mediainfo-tool-version"),
-            audio_bit_depth=g("Audio-bit-depth"),
-            audio_bit_rate=g("Audio-bit-rate"),
-            audio_channels=g("Audio-channels"),
-            audio_duration=g("Audio-duration"),
-            audio_codec=g("Audio-codec"),
-            audio_sampling_rate=g("Audio-sampling-rate"),
-            general_album=g("General-album"),
-            general_performer=g("General-performer"),
-            general_track_name=g("General-track-name"),
-            general_duration=g("General-duration"),
-            general_format=g("General-format"),
-            general_overall_bit_rate=g("General-overall-bit-rate"),
-            video_bit_rate=g("Video-bit-rate"),
-            video_color_space=g("Video-color-space"),
-            video_display_aspect_ratio=g("Video-display-aspect-ratio"),
-            video_duration=g("Video-duration"),
-            video_codec=g("Video-codec"),
-            video_frame_rate=g("Video-frame-rate"),
-            video_height=g("Video-height"),
-            video_width=g("Video-width"),
-        )
+        return cls(**_from_attrs(el, cls._ATTRS), **_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class ExtractedTag:
     name: Optional[str] = None
     value: Optional[str] = None
 
+    _CHILDREN = {
+        "name": ("name", _itxt),
+        "value": ("value", _txt),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "ExtractedTag":
         if el is None:
             return cls()
-        return cls(
-            name=_txt(el.find("name")),
-            value=_txt(el.find("value")),
-        )
+        return cls(**_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class XPictoolMetaex:
     status: Optional[str] = None
     version: Optional[str] = None
     extracted_tags: List[ExtractedTag] = field(default_factory=list)
 
+    _ATTRS = {
+        "status": ("status", _intern),
+        "version": ("version", _intern),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "XPictoolMetaex":
         if el is None:
             return cls()
-        tags = [ExtractedTag.from_element(t) for t in el.findall("extracted-tag")] \
-            if el is not None else []
-        return cls(
-            status=_attr(el, "status"),
-            version=_attr(el, "version"),
-            extracted_tags=tags,
-        )
+        tags = [ExtractedTag.from_element(t) for t in el.findall("extracted-tag")]
+        return cls(**_from_attrs(el, cls._ATTRS), extracted_tags=tags)
 
 
-@dataclass
+@_slots_dataclass
 class LibDimagIdentify:
     guessed_mime_type: Optional[str] = None
     guessed_puid: Optional[str] = None
     guessed_title: Optional[str] = None
 
+    _CHILDREN = {
+        "guessed-mime-type": ("guessed_mime_type", _itxt),
+        "guessed-puid": ("guessed_puid", _itxt),
+        "guessed-title": ("guessed_title", _itxt),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "LibDimagIdentify":
         if el is None:
             return cls()
-        return cls(
-            guessed_mime_type=_txt(el.find("guessed-mime-type")),
-            guessed_puid=_txt(el.find("guessed-puid")),
-            guessed_title=_txt(el.find("guessed-title")),
-        )
+        return cls(**_from_children(el, cls._CHILDREN))
 
 
-@dataclass
+@_slots_dataclass
 class Datei:
     errors: Optional[int] = None
     filename: Optional[str] = None
@@ -415,55 +586,145 @@ class Datei:
     x_pictool_metaex: XPictoolMetaex = field(default_factory=XPictoolMetaex)
     libDimagIdentify: LibDimagIdentify = field(default_factory=LibDimagIdentify)
 
+    _ATTRS = {
+        "errors": ("errors", _int_value),
+        # unique per entry, not interned
+        "filename": ("filename", _plain),
+        "status": ("status", _intern),
+    }
+    _CHILDREN = {
+        "stats": ("stats", Stats.from_element),
+        "file": ("file", FileInfo.from_element),
+        "simplemagic": ("simplemagic", SimpleMagic.from_element),
+        "droid": ("droid", Droid.from_element),
+        "jhove": ("jhove", Jhove.from_element),
+        "tika": ("tika", Tika.from_element),
+        "mediainfo": ("mediainfo", MediaInfo.from_element),
+        "x-pictool-metaex": ("x_pictool_metaex", XPictoolMetaex.from_element),
+        "libDimagIdentify": ("libDimagIdentify", LibDimagIdentify.from_element),
+    }
+
     @classmethod
     def from_element(cls, el: Optional[ET.Element]) -> "Datei":
         if el is None:
             return cls()
-        return cls(
-            errors=_int_from_attr(el, "errors"),
-            filename=_attr(el, "filename"),
-            status=_attr(el, "status"),
-            stats=Stats.from_element(el.find("stats")),
-            file=FileInfo.from_element(el.find("file")),
-            simplemagic=SimpleMagic.from_element(el.find("simplemagic")),
-            droid=Droid.from_element(el.find("droid")),
-            jhove=Jhove.from_element(el.find("jhove")),
-            tika=Tika.from_element(el.find("tika")),
-            mediainfo=MediaInfo.from_element(el.find("mediainfo")),
-            x_pictool_metaex=XPictoolMetaex.from_element(el.find("x-pictool-metaex")),
-            libDimagIdentify=LibDimagIdentify.from_element(el.find("libDimagIdentify")),
-        )
+        return cls(**_from_attrs(el, cls._ATTRS), **_from_children(el, cls._CHILDREN))
+
 
+def _projection(cls, paths: FrozenSet[str]) -> Callable[[Optional[ET.Element]], object]:
+    """``cls.from_element`` restricted to the given field paths (relative to ``cls``).
+
+    Children of unrequested fields are skipped, their fields keep the dataclass defaults.
+    """
+    names = {f.name for f in fields(cls)}
+    heads = {path.split(".", 1)[0] for path in paths}
+    unknown = heads - names
+    if unknown:
+        raise ValueError(f"Unknown {cls.__name__} field(s): {', '.join(sorted(unknown))}")
 
-@dataclass
+    attrs = {attr: spec for attr, spec in getattr(cls, "_ATTRS", {}).items() if spec[0] in heads}
+    children = {}
+    table_fields = {name for name, _ in attrs.values()}
+    for tag, (name, convert) in getattr(cls, "_CHILDREN", {}).items():
+        table_fields.add(name)
+        if name in paths:
+            children[tag] = (name, convert)
+        elif name in heads:
+            nested = getattr(convert, "__self__", None)
+            if not isinstance(nested, type):
+                raise ValueError(f"{cls.__name__}.{name} has no fields")
+            selected = {path[len(name) + 1:] for path in paths if path.startswith(name + ".")}
+            children[tag] = (name, _projection(nested, frozenset(selected)))
+    if heads - table_fields - {name for name, _ in getattr(cls, "_ATTRS", {}).values()}:
+        # a field without a table entry (the extracted tags), converted as a whole
+        return cls.from_element
+
+    def from_element(el: Optional[ET.Element]):
+        if el is None:
+            return cls()
+        return cls(**_from_attrs(el, attrs), **_from_children(el, children))
+    return from_element
+
+
+@lru_cache(maxsize=64)
+def _datei_projection(paths: FrozenSet[str]) -> Callable[[Optional[ET.Element]], Datei]:
+    # the attributes of <datei> are always read, they identify the entry
+    return _projection(Datei, paths | {name for name, _ in Datei._ATTRS.values()})
+
+
+def _datei_converter(paths: Optional[FrozenSet[str]]) -> Callable[[Optional[ET.Element]], Datei]:
+    return Datei.from_element if paths is None else _datei_projection(paths)
+
+
+def _field_paths(fields: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    return frozenset(fields) if fields is not None else None
+
+
+@_slots_dataclass
 class DateiListe:
     dateien: List[Datei] = field(default_factory=list)
 
     @classmethod
-    def from_element(cls, el: Optional[ET.Element]) -> "DateiListe":
+    def from_element(cls, el: Optional[ET.Element], lazy: bool = False,
+                     fields: Optional[Iterable[str]] = None) -> "DateiListe":
+        """With ``lazy``, ``dateien`` is a LazyDateien that converts an entry on first access.
+        With ``fields`` only these Datei fields are converted, see parse_il_results."""
         if el is None:
             return cls()
-        files = [Datei.from_element(d) for d in el.findall("datei")]
-        # fix attributes not handled inside Datei.from_element
-        for i, d_el in enumerate(el.findall("datei")):
-            if i < len(files):
-                files[i].errors = _int_from_attr(d_el, "errors")
-                files[i].filename = files[i].filename or _attr(d_el, "filename")
-                files[i].status = files[i].status or _attr(d_el, "status")
-        return cls(dateien=files)
+        convert = _datei_converter(_field_paths(fields))
+        if lazy:
+            return cls(dateien=LazyDateien(el.findall("datei"), convert))  # type: ignore[arg-type]
+        return cls(dateien=[convert(d) for d in el.findall("datei")])
+
+    def to_columns(self, fields: Optional[Iterable[str]] = None) -> dict[str, Union[array, list]]:
+        """One column per Datei field (or per field under ``fields``), see IlResultTable."""
+        return _columns_from_dateien(self.dateien, _field_paths(fields))
+
+    def to_table(self, fields: Optional[Iterable[str]] = None) -> "IlResultTable":
+        return IlResultTable(self.to_columns(fields))
+
+
+class LazyDateien(Sequence):
+    """Read-only sequence of the ``<datei>`` elements of a list, each converted to a Datei when it is
+    first indexed or iterated and cached afterwards. Keeps the element tree alive until all entries
+    were converted.
+    """
+
+    def __init__(self, elements: List[ET.Element],
+                 convert: Optional[Callable[[Optional[ET.Element]], Datei]] = None):
+        self.__elements: List[Optional[ET.Element]] = elements
+        self.__dateien: List[Optional[Datei]] = [None] * len(elements)
+        self.__convert = convert or Datei.from_element
+
+    def __len__(self) -> int:
+        return len(self.__dateien)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        datei = self.__dateien[index]
+        if datei is None:
+            datei = self.__dateien[index] = self.__convert(self.__elements[index])
+            # the element is no longer needed once converted
+            self.__elements[index] = None
+        return datei
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyDateien)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyDateien({len(self)} entries)"
 
 
 def _int_from_attr(el: Optional[ET.Element], name: str) -> Optional[int]:
     if el is None:
         return None
-    v = el.get(name)
-    try:
-        return int(v) if v is not None else None
-    except Exception:
-        return None
+    return _int_value(el.get(name))
 
 
-@dataclass
+@_slots_dataclass
 class IdentifyResult:
     worker: Optional[str] = None
     version: Optional[str] = None
@@ -471,31 +732,506 @@ class IdentifyResult:
     datei_liste: DateiListe = field(default_factory=DateiListe)
 
     @classmethod
-    def from_element(cls, el: ET.Element) -> "IdentifyResult":
+    def from_element(cls, el: ET.Element, lazy: bool = False,
+                     fields: Optional[Iterable[str]] = None) -> "IdentifyResult":
         return cls(
             worker=_attr(el, "worker"),
             version=_attr(el, "version"),
             start=_attr(el, "start"),
-            datei_liste=DateiListe.from_element(el.find("datei-liste")),
+            datei_liste=DateiListe.from_element(el.find("datei-liste"), lazy=lazy, fields=fields),
         )
 
+    def to_columns(self, fields: Optional[Iterable[str]] = None) -> dict[str, Union[array, list]]:
+        return self.datei_liste.to_columns(fields)
+
+    def to_table(self, fields: Optional[Iterable[str]] = None) -> "IlResultTable":
+        return self.datei_liste.to_table(fields)
+
+
+# ============ Columns ============
+
+_NAN = float("nan")
+
+
+def _column_specs(cls, prefix: str = "") -> list[tuple[str, bool]]:
+    """``(dotted field path, numeric)`` of every scalar field of ``cls`` and its nested dataclasses.
+    List fields (the extracted tags) have no column."""
+    specs = []
+    hints = get_type_hints(cls)
+    for f in fields(cls):
+        t = hints[f.name]
+        if is_dataclass(t):
+            specs.extend(_column_specs(t, f"{prefix}{f.name}."))
+        elif t in (Optional[int], int, Optional[float], float):
+            specs.append((prefix + f.name, True))
+        elif t in (Optional[str], str):
+            specs.append((prefix + f.name, False))
+    return specs
+
+
+def _new_columns(paths: Optional[FrozenSet[str]] = None) -> dict[str, Union[array, list]]:
+    specs = _column_specs(Datei)
+    if paths is not None:
+        _projection(Datei, paths)  # unknown fields raise
+        keep = paths | {name for name, _ in Datei._ATTRS.values()}
+        specs = [(name, numeric) for name, numeric in specs
+                 if name in keep or any(name.startswith(path + ".") for path in keep)]
+    return {name: array("d") if numeric else [] for name, numeric in specs}
+
+
+def _appender(column: Union[array, list]):
+    if isinstance(column, array):
+        # missing numbers are NaN, like in Arrow/pandas float columns
+        append = column.append
+        return lambda v: append(_NAN if v is None else v)
+    return column.append
+
+
+def _columns_from_dateien(dateien: Iterable[Datei],
+                          paths: Optional[FrozenSet[str]] = None) -> dict[str, Union[array, list]]:
+    columns = _new_columns(paths)
+    getters = [(attrgetter(name), _appender(column)) for name, column in columns.items()]
+    for datei in dateien:
+        for get, append in getters:
+            append(get(datei))
+    return columns
+
+
+class _ElementColumns:
+    """Appends the values of an element straight to the columns, with the same ``_ATTRS`` and
+    ``_CHILDREN`` tables as ``from_element`` but without creating the dataclasses."""
+
+    def __init__(self, cls, prefix: str, columns: dict[str, Union[array, list]]):
+        # only the fields with a column, children of other fields are skipped
+        self.attrs = [(attr, convert, _appender(columns[prefix + name]))
+                      for attr, (name, convert) in getattr(cls, "_ATTRS", {}).items() if prefix + name in columns]
+        self.children = {}
+        self.appenders = [append for _, _, append in self.attrs]
+        for tag, (name, convert) in getattr(cls, "_CHILDREN", {}).items():
+            nested = getattr(convert, "__self__", None)
+            if isinstance(nested, type):
+                target = _ElementColumns(nested, f"{prefix}{name}.", columns)
+                if target.appenders:
+                    self.children[tag] = (None, target)
+                    self.appenders.extend(target.appenders)
+            elif prefix + name in columns:
+                append = _appender(columns[prefix + name])
+                self.children[tag] = (convert, append)
+                self.appenders.append(append)
+
+    def append(self, el: ET.Element):
+        for attr, convert, append in self.attrs:
+            append(convert(el.get(attr)))
+        seen = set()
+        get = self.children.get
+        for child in el:
+            tag = child.tag
+            spec = get(tag)
+            # the first child of a tag wins, as in _from_children
+            if spec is None or tag in seen:
+                continue
+            seen.add(tag)
+            convert, target = spec
+            if convert is None:
+                target.append(child)
+            else:
+                target(convert(child))
+        if len(seen) < len(self.children):
+            for tag, (convert, target) in self.children.items():
+                if tag not in seen:
+                    target.append_missing() if convert is None else target(None)
+
+    def append_missing(self):
+        for append in self.appenders:
+            append(None)
+
+
+class IlResultTable:
+    """IL results as one contiguous column per field, named by the dotted field path
+    (``stats.filesize``, ``droid.result.puid``, ``jhove.valid``, ...).
+
+    Numeric columns are ``array("d")`` with NaN for missing values (exact for integers up to 2**53),
+    they support the buffer protocol, so ``numpy.frombuffer(table["stats.filesize"])`` does not copy.
+    Text columns are lists of (interned) strings or None.
+    """
+
+    def __init__(self, columns: dict[str, Union[array, list]]):
+        self.columns = columns
+
+    @property
+    def num_rows(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __getitem__(self, name: str) -> Union[array, list]:
+        return self.columns[name]
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns)
+
+    def values(self, name: str) -> Iterator:
+        """The values of a column without the missing ones."""
+        return (v for v in self.columns[name] if v is not None and v == v)
+
+    def value_counts(self, name: str) -> Counter:
+        return Counter(self.values(name))
+
+    def to_pydict(self) -> dict[str, list]:
+        """Plain lists with None for missing values."""
+        return {name: [v if v == v else None for v in column] if isinstance(column, array) else list(column)
+                for name, column in self.columns.items()}
+
 
 # ============ Parser API ============
 
-def parse_il_results(source: str | bytes | os.PathLike | ET.ElementTree | ET.Element) -> IdentifyResult:
+def _lxml_parser(encoding: Optional[str] = None):
+    # comments and processing instructions are dropped like the stdlib parser does, so .text is the same
+    return LET.XMLParser(huge_tree=True, remove_blank_text=True, remove_comments=True, remove_pis=True,
+                         encoding=encoding)
+
+
+def parse_il_results(source: str | bytes | os.PathLike | ET.ElementTree | ET.Element,
+                     lazy: bool = False, use_lxml: Optional[bool] = None,
+                     fields: Optional[Iterable[str]] = None,
+                     cache: Optional["IlResultsCache"] = None) -> IdentifyResult:
     """Parse an IL results XML input into dataclasses.
 
-    Accepts file path, XML string/bytes, ElementTree, or root Element.
+    Accepts file path, XML string/bytes, ElementTree, or root Element (stdlib or lxml). With ``lazy``
+    the ``Datei`` entries are only converted when they are accessed (see LazyDateien).
+
+    ``fields`` restricts the conversion to these Datei fields, dotted paths select nested fields
+    (e.g. ``{"droid", "stats.md5", "jhove.valid"}``). The other fields keep their defaults, as if
+    their elements were missing.
+    The ``<datei>`` attributes are always read; an unknown field raises ValueError.
+
+    With a ``cache`` (see IlResultsCache) a file is only parsed if it changed since it was cached.
+    Cached results are fully converted, ``lazy`` has no effect on them.
+
+    XML strings and files are parsed with lxml when it is installed (``use_lxml=None``), its parser is
+    several times faster than the stdlib one. Both give the same dataclasses.
     """
-    if isinstance(source, ET.Element):
+    if cache is not None and isinstance(source, (str, os.PathLike)) \
+            and not (isinstance(source, str) and source.lstrip().startswith("<")):
+        return cache.parse(source, use_lxml=use_lxml, fields=fields)
+
+    if use_lxml is None:
+        use_lxml = LET is not None
+    elif use_lxml and LET is None:
+        raise ImportError("lxml is not installed")
+
+    if ET.iselement(source):
         root = source
-    elif isinstance(source, ET.ElementTree):
+    elif isinstance(source, ET.ElementTree) or LET is not None and isinstance(source, LET._ElementTree):
         root = source.getroot()
-    elif isinstance(source, (str, bytes)) and str(source).lstrip().startswith("<"):
+    elif isinstance(source, bytes) and source.lstrip().startswith(b"<") \
+            or isinstance(source, str) and source.lstrip().startswith("<"):
         # XML string
-        root = ET.fromstring(source)  # type: ignore[arg-type]
+        if use_lxml and isinstance(source, str):
+            # lxml refuses str with an encoding declaration, the encoded bytes override it
+            root = LET.fromstring(source.encode("utf-8"), _lxml_parser(encoding="utf-8"))
+        elif use_lxml:
+            root = LET.fromstring(source, _lxml_parser())
+        else:
+            root = ET.fromstring(source)  # type: ignore[arg-type]
     else:
         # assume path-like
-        tree = ET.parse(source)  # type: ignore[arg-type]
+        tree = LET.parse(source, _lxml_parser()) if use_lxml else ET.parse(source)  # type: ignore[arg-type]
         root = tree.getroot()
-    return IdentifyResult.from_element(root)
+    return IdentifyResult.from_element(root, lazy=lazy, fields=fields)
+
+
+class IdentifyResultReader:
+    """Reads an IL results document incrementally with ``iterparse``.
+
+    The root attributes are read on construction and available as ``result`` (an IdentifyResult
+    with an empty ``datei_liste``). Iterating yields one Datei per ``<datei>`` element; each element
+    is dropped from the tree once it is converted, so memory stays proportional to one entry. The
+    document is read once, a second iteration yields nothing. ``fields`` restricts the conversion
+    like in parse_il_results.
+    """
+
+    def __init__(self, source: str | bytes | os.PathLike | IO, fields: Optional[Iterable[str]] = None):
+        self.__fields = _field_paths(fields)
+        self.__convert = _datei_converter(self.__fields)  # unknown fields raise before reading
+        self.__own_file = False
+        if isinstance(source, bytes) and source.lstrip().startswith(b"<"):
+            self.__file = io.BytesIO(source)
+        elif isinstance(source, str) and source.lstrip().startswith("<"):
+            self.__file = io.StringIO(source)
+        elif hasattr(source, "read"):
+            self.__file = source
+        else:
+            self.__file = open(source, "rb")
+            self.__own_file = True
+
+        try:
+            self.__events = ET.iterparse(self.__file, events=("start", "end"))
+            _, root = next(self.__events)
+        except BaseException:
+            self.close()
+            raise
+        self.result = IdentifyResult(
+            worker=_attr(root, "worker"),
+            version=_attr(root, "version"),
+            start=_attr(root, "start"),
+        )
+
+    def __enter__(self) -> "IdentifyResultReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.__own_file:
+            self.__file.close()
+
+    def __iter__(self) -> Iterator[Datei]:
+        convert = self.__convert
+        for el in self.__elements():
+            yield convert(el)
+
+    def to_columns(self) -> dict[str, Union[array, list]]:
+        """Reads the remaining entries straight into columns, without creating Datei objects.
+        Only the columns under ``fields`` are filled, see IlResultTable."""
+        columns = _new_columns(self.__fields)
+        datei_columns = _ElementColumns(Datei, "", columns)
+        for el in self.__elements():
+            datei_columns.append(el)
+        return columns
+
+    def to_table(self) -> IlResultTable:
+        return IlResultTable(self.to_columns())
+
+    def __elements(self) -> Iterator[ET.Element]:
+        # depth 1 is the root, <datei-liste> is at depth 2 and its <datei> at depth 3
+        depth = 1
+        liste = None
+        try:
+            for event, el in self.__events:
+                if event == "start":
+                    depth += 1
+                    if depth == 2 and el.tag == "datei-liste":
+                        liste = el
+                    continue
+                depth -= 1
+                if depth == 2 and liste is not None and el.tag == "datei":
+                    yield el
+                    # converted by the consumer, no longer needed
+                    liste.remove(el)
+        finally:
+            self.close()
+
+
+def iter_il_results(source: str | bytes | os.PathLike | IO,
+                    fields: Optional[Iterable[str]] = None) -> IdentifyResultReader:
+    """Stream the ``Datei`` entries of an IL results XML input.
+
+    Accepts file path, XML string/bytes or a binary file object. The root attributes
+    (worker, version, start) are available as ``reader.result`` before the first entry.
+    ``fields`` restricts the conversion like in parse_il_results.
+    """
+    return IdentifyResultReader(source, fields=fields)
+
+
+# ============ Parallel parsing ============
+
+@lru_cache(maxsize=None)
+def _nested_fields(cls) -> list[tuple[int, type, bool]]:
+    """``(position, dataclass, is list)`` of the fields of ``cls`` that hold dataclasses."""
+    nested = []
+    hints = get_type_hints(cls)
+    for i, f in enumerate(fields(cls)):
+        t = hints[f.name]
+        if is_dataclass(t):
+            nested.append((i, t, False))
+        elif getattr(t, "__origin__", None) is list and is_dataclass(t.__args__[0]):
+            nested.append((i, t.__args__[0], True))
+    return nested
+
+
+@lru_cache(maxsize=None)
+def _field_getter(cls) -> Callable[[object], tuple]:
+    getter = attrgetter(*(f.name for f in fields(cls)))
+    # attrgetter of a single name returns the value, not a tuple
+    return getter if len(fields(cls)) > 1 else lambda value: (getter(value),)
+
+
+def _pack(value) -> tuple:
+    """The field values of a dataclass tree as nested tuples, in field order.
+
+    A tuple pickles without class references and slot names, several times smaller and faster
+    than the dataclasses themselves.
+    """
+    cls = type(value)
+    values = _field_getter(cls)(value)
+    nested = _nested_fields(cls)
+    if not nested:
+        return values
+    values = list(values)
+    for i, _, many in nested:
+        values[i] = [_pack(v) for v in values[i]] if many else _pack(values[i])
+    return tuple(values)
+
+
+def _unpack(cls, values: tuple):
+    """Inverse of _pack."""
+    nested = _nested_fields(cls)
+    if nested:
+        values = list(values)
+        for i, kls, many in nested:
+            values[i] = [_unpack(kls, v) for v in values[i]] if many else _unpack(kls, values[i])
+    return cls(*values)
+
+
+def _parse_packed(sources: list, use_lxml: Optional[bool], fields: Optional[FrozenSet[str]],
+                  cache: Optional["IlResultsCache"] = None) -> list[tuple]:
+    # runs in the worker process
+    return [_pack(parse_il_results(source, use_lxml=use_lxml, fields=fields, cache=cache)) for source in sources]
+
+
+def parse_il_results_many(sources: Iterable[str | os.PathLike], workers: Optional[int] = None,
+                          chunksize: int = 1, ordered: bool = True, use_lxml: Optional[bool] = None,
+                          fields: Optional[Iterable[str]] = None, cache: Optional["IlResultsCache"] = None
+                          ) -> Iterator[Tuple[str | os.PathLike, IdentifyResult]]:
+    """Parse many IL results files in a process pool.
+
+    Yields ``(source, IdentifyResult)`` in the order of ``sources``, or with ``ordered=False`` as the
+    files are parsed. ``workers`` defaults to the number of CPUs; each task parses ``chunksize`` files,
+    larger chunks cost less inter-process traffic for many small files. The results are sent back as
+    nested tuples (see _pack) and rebuilt here. ``use_lxml``, ``fields`` and ``cache`` as in
+    parse_il_results.
+
+    A parse error is raised when the result of its file is reached; closing the generator early
+    cancels the files not yet started.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    sources = list(sources)
+    paths = _field_paths(fields)
+    if paths is not None:
+        _datei_converter(paths)  # unknown fields raise here, not in the workers
+    parse = partial(_parse_packed, use_lxml=use_lxml, fields=paths, cache=cache)
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {}
+        for start in range(0, len(sources), chunksize):
+            chunk = sources[start:start + chunksize]
+            futures[executor.submit(parse, chunk)] = chunk
+        for future in futures if ordered else as_completed(futures):
+            for source, packed in zip(futures[future], future.result()):
+                yield source, _unpack(IdentifyResult, packed)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+# ============ On-disk cache ============
+
+_CACHE_MAGIC = b"ILRC"
+# magic, format version, schema digest, size and mtime (ns) of the source
+_CACHE_HEADER = struct.Struct("<4sH16sqq")
+_CACHE_FORMAT = 1
+
+
+@lru_cache(maxsize=None)
+def _schema_digest() -> bytes:
+    """Digest of the names and types of all fields below IdentifyResult; a changed dataclass gives
+    another digest and so invalidates the cached entries."""
+    def describe(kls) -> str:
+        hints = get_type_hints(kls)
+        nested = {i: (t, many) for i, t, many in _nested_fields(kls)}
+        parts = []
+        for i, f in enumerate(fields(kls)):
+            if i in nested:
+                t, many = nested[i]
+                parts.append(f"{f.name}:{'[' if many else ''}{describe(t)}")
+            else:
+                parts.append(f"{f.name}:{hints[f.name]}")
+        return f"{kls.__name__}({','.join(parts)})"
+    return hashlib.md5(describe(IdentifyResult).encode("utf-8")).digest()
+
+
+class IlResultsCache:
+    """Parsed IL results files in a compact binary form, valid as long as size and mtime of the file
+    are unchanged.
+
+    The entries are written to ``directory`` (named by a hash of the absolute path), or without a
+    directory next to the files (``<file>.ilc``). A result parsed with ``fields`` is cached separately
+    from the full result. An entry starts with a header (format, schema digest, size and mtime of the
+    file) followed by the result as nested tuples (see _pack) in ``marshal`` format, which only holds
+    plain values and is several times faster to load than the XML is to parse. Unreadable entries are
+    parsed again, entries that cannot be written are skipped.
+    """
+
+    SUFFIX = ".ilc"
+
+    def __init__(self, directory: Optional[str | os.PathLike] = None):
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, source: str | os.PathLike, fields: Optional[FrozenSet[str]] = None) -> str:
+        selection = ""
+        if fields is not None:
+            selection = "." + hashlib.md5(",".join(sorted(fields)).encode("utf-8")).hexdigest()[:12]
+        if self.directory is None:
+            return f"{os.fspath(source)}{selection}{self.SUFFIX}"
+        name = hashlib.md5(os.path.abspath(source).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}{selection}{self.SUFFIX}")
+
+    def parse(self, source: str | os.PathLike, use_lxml: Optional[bool] = None,
+              fields: Optional[Iterable[str]] = None) -> IdentifyResult:
+        """The cached result of ``source``, parsed (and cached) if there is none or the file changed."""
+        paths = _field_paths(fields)
+        # taken before parsing: a file changed meanwhile does not match the entry the next time
+        stat = os.stat(source)
+        entry = self.entry_path(source, paths)
+        result = self.load(entry, stat)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = parse_il_results(source, use_lxml=use_lxml, fields=paths)
+        self.store(entry, stat, result)
+        return result
+
+    def load(self, entry: str, stat: os.stat_result) -> Optional[IdentifyResult]:
+        try:
+            with open(entry, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < _CACHE_HEADER.size:
+            return None
+        header = _CACHE_HEADER.unpack_from(data)
+        if header != (_CACHE_MAGIC, _CACHE_FORMAT, _schema_digest(), stat.st_size, stat.st_mtime_ns):
+            return None
+        try:
+            return _unpack(IdentifyResult, marshal.loads(memoryview(data)[_CACHE_HEADER.size:]))
+        except (ValueError, EOFError, TypeError, IndexError):
+            # truncated or not written by this version
+            return None
+
+    def store(self, entry: str, stat: os.stat_result, result: IdentifyResult):
+        header = _CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_FORMAT, _schema_digest(), stat.st_size, stat.st_mtime_ns)
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(header)
+                f.write(marshal.dumps(_pack(result), 4))
+            # readers never see a partly written entry
+            os.replace(tmp, entry)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
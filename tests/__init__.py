@@ -1,3 +1,19 @@
+import copy
 import os
+import xml.etree.ElementTree as ET
 
 TESTDATA_PATH = os.path.join(os.path.dirname(__file__), 'data')
+IL_RESULTS_FNAME = os.path.join(TESTDATA_PATH, 'il_results.xml')
+
+
+def make_il_results(count: int) -> bytes:
+    """The <datei> of tests/data/il_results.xml repeated `count` times, with distinct file names."""
+    root = ET.parse(IL_RESULTS_FNAME).getroot()
+    liste = root.find('datei-liste')
+    datei = liste.find('datei')
+    liste.remove(datei)
+    for i in range(count):
+        d = copy.deepcopy(datei)
+        d.set('filename', f'file{i}.xlsx')
+        liste.append(d)
+    return ET.tostring(root, encoding='utf-8', xml_declaration=True)
@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock
+
+from design_pattern.identify import IngestListIdentifierConfig
+
+
+def make_cfg(**kwargs) -> IngestListIdentifierConfig:
+    """Config of the fake IngestList server, kwargs set further fields (e.g. result_cache)."""
+    return IngestListIdentifierConfig(
+        base_url="http://example.com/",
+        username="user",
+        password="pass",
+        proxies=None,
+        **kwargs,
+    )
+
+
+def make_resp(payload: dict, status_code: int = 200):
+    """An httpx-like response of the async identifier with `payload` as JSON."""
+    return SimpleNamespace(status_code=status_code, content=b"ok", json=lambda: payload, headers={})
+
+
+def make_session(*created: dict) -> MagicMock:
+    """
+    Stand-in for RemoteSessionAsync: post logs in, then answers with the `created` payloads in turn;
+    get reports job 1 as Completed.
+    """
+    session = MagicMock()
+    login = make_resp({"token": "abc123"})
+    if created:
+        session.post = AsyncMock(side_effect=[login] + [make_resp(payload) for payload in created])
+    else:
+        session.post = AsyncMock(return_value=login)
+    session.get = AsyncMock(return_value=make_resp({"id": 1, "status": "Completed"}))
+    session.aclose = AsyncMock()
+    return session
@@ -0,0 +1,66 @@
+import asyncio
+from unittest.mock import patch, AsyncMock
+
+import httpx
+import pytest
+
+from design_pattern.identify import IngestListIdentifierAsync, IngestListTaskState, IngestListJobType
+from tests.ilwrapper import make_cfg, make_resp, make_session
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared_and_closed():
+    session = make_session()
+    with patch("design_pattern.identify.ingestlist_identifier_async.RemoteSessionAsync",
+               return_value=session) as remote:
+        async with IngestListIdentifierAsync(make_cfg(max_connections=8, max_keepalive_connections=4)) as identifier:
+            for _ in range(3):
+                status = await identifier.check_task_status("1")
+                assert status.status == IngestListTaskState.Completed
+
+        remote.assert_called_once()
+        limits: httpx.Limits = remote.call_args.kwargs["limits"]
+        assert limits.max_connections == 8
+        assert limits.max_keepalive_connections == 4
+        assert remote.call_args.kwargs["http2"] is False
+        assert session.get.await_count == 3
+        session.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_client_reopened_after_aclose():
+    first, second = make_session(), make_session()
+    with patch("design_pattern.identify.ingestlist_identifier_async.RemoteSessionAsync",
+               side_effect=[first, second]):
+        identifier = await IngestListIdentifierAsync(make_cfg()).initialize()
+        await identifier.aclose()
+        await identifier.check_task_status("1")
+        await identifier.aclose()
+
+    first.aclose.assert_awaited_once()
+    second.get.assert_awaited_once()
+    second.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_identify_waits_through_poll_scheduler():
+    session = make_session(*({"id": i, "status": "Running"} for i in range(1, 4)))
+    polls: dict[str, int] = {}
+
+    async def get(url, **kwargs):
+        job_id = url.rsplit("/", 1)[-1]
+        polls[job_id] = polls.get(job_id, 0) + 1
+        return make_resp({"id": int(job_id), "status": "Completed" if polls[job_id] > 1 else "Running"})
+
+    session.get = AsyncMock(side_effect=get)
+    with patch("design_pattern.identify.ingestlist_identifier_async.RemoteSessionAsync", return_value=session):
+        async with IngestListIdentifierAsync(make_cfg()) as identifier:
+            identifier.poll_interval = 0.01
+            results = await asyncio.gather(
+                *[identifier.identify(f"remote-{i}.pdf", IngestListJobType.REMOTE) for i in range(3)]
+            )
+
+    assert sorted(r.id for r in results) == [1, 2, 3]
+    assert all(r.status == IngestListTaskState.Completed for r in results)
+    assert polls == {"1": 2, "2": 2, "3": 2}
+    assert {job_id: m.polls for job_id, m in identifier.poll_metrics.items()} == polls
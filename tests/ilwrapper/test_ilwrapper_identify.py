@@ -16,12 +16,10 @@ class TestILWrapperIdentify(unittest.TestCase):
             proxies=None,
         )
 
-    def make_context_session(self, response):
-        """Create a MagicMock that behaves like ILWrapperSession in a context manager returning given response on post."""
+    def make_session(self, *responses):
+        """Create a MagicMock for the identifier's pooled session returning the given responses on post, in order."""
         sess = MagicMock()
-        sess.__enter__.return_value = sess
-        sess.__exit__.return_value = False
-        sess.post.return_value = response
+        sess.post.side_effect = list(responses)
         return sess
 
     def test_identify_remote_success_sets_response(self):
@@ -33,12 +31,11 @@ class TestILWrapperIdentify(unittest.TestCase):
         identify_payload = {"status": "queued", "jobId": "j123"}
         identify_resp = SimpleNamespace(status_code=200, content=json.dumps(identify_payload))
 
-        session_login = self.make_context_session(login_resp)
-        session_create = self.make_context_session(identify_resp)
+        session = self.make_session(login_resp, identify_resp)
 
-        with patch("design_pattern.identify.ingestlist_identifier.RemoteSession", side_effect=[session_login, session_create]):
-            il = IngestListIdentifier(cfg)  # will consume session_login
-            il.identify("/path/to/file.pdf", IngestListJobType.REMOTE)  # will consume session_create
+        with patch("design_pattern.identify.ingestlist_identifier.RemoteSession", return_value=session):
+            il = IngestListIdentifier(cfg)  # first post: login
+            il.identify("/path/to/file.pdf", IngestListJobType.REMOTE)  # second post: create
 
         # Access the private response via name mangling
         self.assertEqual(getattr(il, "_IngestListIdentifier__response"), identify_payload)
@@ -49,10 +46,9 @@ class TestILWrapperIdentify(unittest.TestCase):
         login_resp = SimpleNamespace(status_code=200, content=b"ok", text='{"token":"tkn"}')
         error_resp = SimpleNamespace(status_code=400, content=b"bad request")
 
-        session_login = self.make_context_session(login_resp)
-        session_create = self.make_context_session(error_resp)
+        session = self.make_session(login_resp, error_resp)
 
-        with patch("design_pattern.identify.ingestlist_identifier.RemoteSession", side_effect=[session_login, session_create]):
+        with patch("design_pattern.identify.ingestlist_identifier.RemoteSession", return_value=session):
             il = IngestListIdentifier(cfg)
             with self.assertRaises(Exception) as ctx:
                 il.identify("/path/to/file.pdf", IngestListJobType.REMOTE)
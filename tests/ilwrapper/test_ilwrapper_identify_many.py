@@ -0,0 +1,100 @@
+import asyncio
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import pytest
+
+from design_pattern.identify import IngestListIdentifierAsync, IngestListTaskState, IngestListJobType
+from tests.ilwrapper import make_cfg, make_resp
+
+
+class FakeServer:
+    """
+    Answers /api/create with a new job id (500 for file names starting with "bad") and reports
+    every job as Completed. Tracks how many creates are in flight at once.
+    """
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.inflight = 0
+        self.max_inflight = 0
+        self.created = 0
+        self.session = MagicMock()
+        self.session.post = AsyncMock(side_effect=self.post)
+        self.session.get = AsyncMock(side_effect=self.get)
+        self.session.aclose = AsyncMock()
+
+    async def post(self, url, headers=None, json=None, **kwargs):
+        if url == "/api/login":
+            return make_resp({"token": "abc123"})
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.inflight -= 1
+        if json["filename"].startswith("bad"):
+            return make_resp({}, status_code=500)
+        self.created += 1
+        return make_resp({"id": self.created, "status": "Running", "filename": json["filename"]})
+
+    async def get(self, url, headers=None, **kwargs):
+        job_id = int(url.rsplit("/", 1)[-1])
+        return make_resp({"id": job_id, "status": "Completed"})
+
+
+@pytest.mark.asyncio
+async def test_identify_many_records_failures_per_file():
+    server = FakeServer()
+    paths = ["a.pdf", "bad.pdf", "b.pdf", "c.pdf"]
+    with patch("design_pattern.identify.ingestlist_identifier_async.RemoteSessionAsync",
+               return_value=server.session):
+        async with IngestListIdentifierAsync(make_cfg()) as identifier:
+            results = [r async for r in identifier.identify_many(paths, IngestListJobType.REMOTE,
+                                                                 max_concurrency=2)]
+
+    assert sorted(r.file_path for r in results) == sorted(paths)
+    by_path = {r.file_path: r for r in results}
+    assert not by_path["bad.pdf"].success
+    assert "500" in str(by_path["bad.pdf"].error)
+    for path in ("a.pdf", "b.pdf", "c.pdf"):
+        assert by_path[path].success
+        assert by_path[path].response.status == IngestListTaskState.Completed
+
+
+@pytest.mark.asyncio
+async def test_identify_many_bounds_concurrency():
+    server = FakeServer()
+    paths = [f"file{i}.pdf" for i in range(20)]
+    with patch("design_pattern.identify.ingestlist_identifier_async.RemoteSessionAsync",
+               return_value=server.session):
+        async with IngestListIdentifierAsync(make_cfg()) as identifier:
+            results = [r async for r in identifier.validate_many(paths, IngestListJobType.REMOTE,
+                                                                 max_concurrency=3,
+                                                                 wait_for_completion=False)]
+
+    assert len(results) == 20
+    assert all(r.success for r in results)
+    assert server.max_inflight == 3
+
+
+@pytest.mark.asyncio
+async def test_identify_many_reads_paths_lazily():
+    server = FakeServer(delay=0)
+    pulled = 0
+
+    async def paths():
+        nonlocal pulled
+        for i in range(1000):
+            pulled += 1
+            yield f"file{i}.pdf"
+
+    with patch("design_pattern.identify.ingestlist_identifier_async.RemoteSessionAsync",
+               return_value=server.session):
+        async with IngestListIdentifierAsync(make_cfg()) as identifier:
+            results = identifier.identify_many(paths(), IngestListJobType.REMOTE, max_concurrency=4)
+            first = await anext(results)
+            assert first.success
+            await results.aclose()
+
+    # workers stop pulling while the consumer is behind, and are cancelled when it stops
+    assert pulled < 20
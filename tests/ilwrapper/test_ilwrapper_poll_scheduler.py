@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+from design_pattern.identify import IngestListTaskResponse, IngestListTaskState, FixedPollStrategy, \
+    ExponentialPollStrategy
+from design_pattern.identify.ingestlist.poll_scheduler import IngestListPollScheduler
+from design_pattern.identify.ingestlist.poll_strategy import parse_retry_after
+
+
+class FakeStatus:
+    """Reports every job as Running for `polls_until_done` requests, then with `final` status."""
+
+    def __init__(self, polls_until_done: int = 2, final: IngestListTaskState = IngestListTaskState.Completed,
+                 retry_after: float | None = None):
+        self.polls_until_done = polls_until_done
+        self.final = final
+        self.retry_after = retry_after
+        self.polls: dict[str, int] = {}
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def __call__(self, job_id: str) -> tuple[IngestListTaskResponse, float | None]:
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        await asyncio.sleep(0.001)
+        self.inflight -= 1
+        self.polls[job_id] = self.polls.get(job_id, 0) + 1
+        done = self.polls[job_id] > self.polls_until_done
+        status = self.final if done else IngestListTaskState.Running
+        return IngestListTaskResponse(id=int(job_id), status=status), self.retry_after
+
+
+@pytest.mark.asyncio
+async def test_jobs_resolve_with_bounded_inflight():
+    status = FakeStatus(polls_until_done=2)
+    scheduler = IngestListPollScheduler(status, strategy=FixedPollStrategy(0.01), max_inflight=5)
+
+    futures = [scheduler.watch(str(i), timeout=5) for i in range(1, 51)]
+    results = await asyncio.gather(*futures)
+
+    assert [r.id for r in results] == list(range(1, 51))
+    assert all(r.status == IngestListTaskState.Completed for r in results)
+    assert status.max_inflight <= 5
+    assert all(count == 3 for count in status.polls.values())
+    assert scheduler.pending == 0
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_jobs_share_one_cadence():
+    status = FakeStatus(polls_until_done=3)
+    scheduler = IngestListPollScheduler(status, strategy=FixedPollStrategy(0.05), max_inflight=10)
+
+    first = scheduler.watch("1", timeout=5)
+    await asyncio.sleep(0.02)
+    # joins the next tick of job 1 instead of starting an own poll loop
+    second = scheduler.watch("2", timeout=5)
+    assert status.polls == {"1": 1}
+
+    await asyncio.gather(first, second)
+    assert status.polls == {"1": 4, "2": 4}
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failed_job_raises():
+    scheduler = IngestListPollScheduler(FakeStatus(polls_until_done=0, final=IngestListTaskState.Failed),
+                                        strategy=FixedPollStrategy(0.01))
+    with pytest.raises(Exception, match="Task 7 failed"):
+        await scheduler.watch("7", timeout=5)
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_timeout():
+    scheduler = IngestListPollScheduler(FakeStatus(polls_until_done=1000), strategy=FixedPollStrategy(0.01))
+    with pytest.raises(TimeoutError):
+        await scheduler.watch("1", timeout=0.03)
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_watch_twice_and_unwatch():
+    status = FakeStatus(polls_until_done=1000)
+    scheduler = IngestListPollScheduler(status, strategy=FixedPollStrategy(0.01))
+
+    future = scheduler.watch("1", timeout=5)
+    assert scheduler.watch("1", timeout=5) is future
+    scheduler.unwatch("1")
+    assert scheduler.pending == 1
+    scheduler.unwatch("1")
+    assert scheduler.pending == 0
+    assert future.cancelled()
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_metrics_and_retry_after():
+    status = FakeStatus(polls_until_done=2, retry_after=0.01)
+    # without the Retry-After hint the second poll would be 10s later
+    scheduler = IngestListPollScheduler(status, strategy=FixedPollStrategy(10))
+
+    await asyncio.wait_for(scheduler.watch("1", timeout=5), 1)
+
+    metrics = scheduler.metrics["1"]
+    assert metrics.polls == 3
+    assert metrics.retry_after_hints == 2
+    assert 0.02 <= metrics.total_wait < 1
+
+
+@pytest.mark.asyncio
+async def test_exponential_strategy_polls_less():
+    polls = []
+    for strategy in (FixedPollStrategy(0.01), ExponentialPollStrategy(initial=0.001, max_interval=0.05, jitter=0)):
+        scheduler = IngestListPollScheduler(FakeStatus(polls_until_done=1000), strategy=strategy)
+        future = scheduler.watch("1", timeout=0.2)
+        with pytest.raises(TimeoutError):
+            await future
+        polls.append(scheduler.metrics["1"].polls)
+        await scheduler.aclose()
+
+    fixed, adaptive = polls
+    assert adaptive < fixed
+
+
+def test_exponential_strategy_intervals():
+    strategy = ExponentialPollStrategy(initial=0.1, factor=2, max_interval=1.0, jitter=0)
+    assert [strategy.next_interval(p) for p in range(0, 7)] == [0.1, 0.1, 0.2, 0.4, 0.8, 1.0, 1.0]
+    assert strategy.next_interval(3, retry_after=5.0) == 5.0
+
+    jittered = ExponentialPollStrategy(initial=1.0, factor=1, max_interval=10, jitter=0.5)
+    assert all(0.5 <= jittered.next_interval(3) <= 1.5 for _ in range(100))
+
+
+def test_fixed_strategy_intervals():
+    strategy = FixedPollStrategy(2.0)
+    assert strategy.next_interval(0) == 0.0
+    assert strategy.next_interval(1) == 2.0
+    assert strategy.next_interval(1, retry_after=0.5) == 0.5
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
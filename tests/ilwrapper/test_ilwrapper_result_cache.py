@@ -0,0 +1,146 @@
+import dataclasses
+import json
+import os
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from design_pattern.identify import BorgIdentifier, IngestListIdentifier, IngestListIdentifierAsync, IngestListTaskState
+from design_pattern.utils import MemoryResultCache
+from tests import TESTDATA_PATH
+from tests.ilwrapper import make_cfg, make_resp, make_session
+
+TEST_FILE = os.path.join(TESTDATA_PATH, 'droid_results.csv')
+OTHER_FILE = os.path.join(TESTDATA_PATH, 'il_results.xml')
+
+
+class TestILWrapperResultCache(unittest.TestCase):
+    def test_cached_identify_skips_upload(self):
+        login_resp = SimpleNamespace(status_code=200, content=b"ok", text='{"token":"abc123"}')
+        create_resp = SimpleNamespace(status_code=200, content=json.dumps({"id": 7, "status": "Running"}))
+        done_resp = SimpleNamespace(status_code=200, content=json.dumps({"id": 7, "status": "Completed"}))
+
+        session = MagicMock()
+        session.post.side_effect = [login_resp, create_resp, login_resp]
+        session.get.return_value = done_resp
+        cache = MemoryResultCache()
+
+        with patch("design_pattern.identify.ingestlist_identifier.RemoteSession", return_value=session):
+            il = IngestListIdentifier(make_cfg(result_cache=cache))
+            first = il.identify(TEST_FILE)
+            self.assertEqual(first.status, IngestListTaskState.Running)
+
+            # a running job is not cached, it is stored once polling sees it completed
+            self.assertEqual(len(cache), 0)
+            il.check_task_status("7")
+            self.assertEqual(il.identify(TEST_FILE).status, IngestListTaskState.Completed)
+
+            # another instance (e.g. after a restart) gets the completed result
+            self.assertEqual(IngestListIdentifier(make_cfg(result_cache=cache)).identify(TEST_FILE).status,
+                             IngestListTaskState.Completed)
+
+        # the file was uploaded once
+        self.assertEqual([c.args[0] for c in session.post.call_args_list], ["/api/login", "/api/create", "/api/login"])
+        self.assertEqual(cache.stats(), {'hits': 2, 'misses': 1, 'size': 1})
+
+    def test_pending_jobs_are_bounded(self):
+        login_resp = SimpleNamespace(status_code=200, content=b"ok", text='{"token":"abc123"}')
+        session = MagicMock()
+        session.post.side_effect = [login_resp] + [
+            SimpleNamespace(status_code=200, content=json.dumps({"id": i, "status": "Running"})) for i in (1, 2)
+        ]
+        session.get.side_effect = [
+            SimpleNamespace(status_code=200, content=json.dumps({"id": i, "status": "Completed"})) for i in (1, 2)
+        ]
+        cache = MemoryResultCache()
+
+        with patch("design_pattern.identify.ingestlist_identifier.RemoteSession", return_value=session):
+            il = IngestListIdentifier(dataclasses.replace(make_cfg(result_cache=cache), cache_max_pending_jobs=1))
+            il.identify(TEST_FILE)
+            il.identify(OTHER_FILE)
+
+            # job 1 was dropped when job 2 became pending, only job 2 is stored once completed
+            il.check_task_status("1")
+            self.assertEqual(len(cache), 0)
+            il.check_task_status("2")
+            self.assertEqual(il.identify(OTHER_FILE).id, 2)
+            self.assertEqual(len(cache), 1)
+
+    def test_cached_borg_identify(self):
+        result = {"summary": {"puid": "x-fmt/18"}}
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.post.return_value = SimpleNamespace(status_code=200, content=json.dumps(result))
+        cache = MemoryResultCache()
+
+        with patch("design_pattern.identify.borg_identifier.RemoteSession", return_value=session):
+            identifier = BorgIdentifier(base_url="http://borg", result_cache=cache, cache_version="1.0")
+            self.assertEqual(identifier.identify(TEST_FILE), result)
+            self.assertEqual(identifier.identify(TEST_FILE), result)
+
+            # another tool version does not reuse the result
+            BorgIdentifier(base_url="http://borg", result_cache=cache, cache_version="2.0").identify(TEST_FILE)
+
+        self.assertEqual(session.post.call_count, 2)
+        self.assertEqual(cache.hits, 1)
+
+
+@pytest.mark.asyncio
+async def test_cached_identify_async_skips_upload_and_polling():
+    session = make_session({"id": 3, "status": "Running"})
+    session.get.return_value = make_resp({"id": 3, "status": "Completed"})
+    cache = MemoryResultCache()
+
+    with patch("design_pattern.identify.ingestlist_identifier_async.RemoteSessionAsync", return_value=session):
+        async with IngestListIdentifierAsync(make_cfg(result_cache=cache)) as identifier:
+            identifier.poll_interval = 0.01
+            running = await identifier.identify(TEST_FILE, wait_for_completion=False)
+            assert running.status == IngestListTaskState.Running
+            assert len(cache) == 0
+            first = await identifier.check_task_status(str(running.id))
+            second = await identifier.identify(TEST_FILE)
+
+    assert first.status == second.status == IngestListTaskState.Completed
+    assert session.post.await_count == 2
+    assert session.get.await_count == 1
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_identify_many_uses_result_cache():
+    session = make_session({"id": 5, "status": "Running"})
+    session.get.return_value = make_resp({"id": 5, "status": "Completed"})
+    cache = MemoryResultCache()
+
+    with patch("design_pattern.identify.ingestlist_identifier_async.RemoteSessionAsync", return_value=session):
+        async with IngestListIdentifierAsync(make_cfg(result_cache=cache)) as identifier:
+            identifier.poll_interval = 0.01
+            results = [r async for r in identifier.identify_many([TEST_FILE], max_concurrency=2)]
+            results += [r async for r in identifier.identify_many([TEST_FILE] * 3, max_concurrency=2)]
+
+    assert all(r.success and r.response.status == IngestListTaskState.Completed for r in results)
+    assert session.post.await_count == 2
+    assert cache.stats() == {'hits': 3, 'misses': 1, 'size': 1}
+
+
+@pytest.mark.asyncio
+async def test_timed_out_job_is_not_cached_later():
+    statuses = iter(["Running"] * 1000)
+    session = make_session({"id": 4, "status": "Running"})
+    session.get.side_effect = lambda url, **kwargs: make_resp({"id": 4, "status": next(statuses)})
+    cache = MemoryResultCache()
+
+    with patch("design_pattern.identify.ingestlist_identifier_async.RemoteSessionAsync", return_value=session):
+        async with IngestListIdentifierAsync(make_cfg(result_cache=cache)) as identifier:
+            identifier.poll_interval = 0.01
+            identifier.max_poll_time = 0.05
+            with pytest.raises(Exception, match="did not complete"):
+                await identifier.identify(TEST_FILE)
+
+            # the job finishes after the caller gave up: it is no longer tied to the file
+            statuses = iter(["Completed"])
+            await identifier.check_task_status("4")
+
+    assert len(cache) == 0
@@ -0,0 +1,57 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from design_pattern.identify.ingestlist_identifier import IngestListIdentifier
+from design_pattern.identify.ingestlist import IngestListIdentifierConfig, IngestListJobType
+
+
+class TestILWrapperSession(unittest.TestCase):
+    def make_cfg(self):
+        return IngestListIdentifierConfig(
+            base_url="http://example.com/",
+            username="user",
+            password="pass",
+            proxies=None,
+            pool_maxsize=4,
+            keep_alive=False,
+        )
+
+    def test_session_is_reused(self):
+        login_resp = SimpleNamespace(status_code=200, content=b"ok", text='{"token":"abc123"}')
+        job_resp = SimpleNamespace(status_code=200, content=json.dumps({"id": 1, "status": "Running"}))
+
+        session = MagicMock()
+        session.post.side_effect = [login_resp, job_resp]
+        session.get.return_value = job_resp
+
+        with patch("design_pattern.identify.ingestlist_identifier.RemoteSession", return_value=session) as remote:
+            il = IngestListIdentifier(self.make_cfg())
+            il.identify("remote-file.pdf", IngestListJobType.REMOTE)
+            il.check_task_status("1")
+            il.check_task_status("1")
+
+        remote.assert_called_once_with(base_url="http://example.com/", pool_connections=1, pool_maxsize=4,
+                                       keep_alive=False)
+        self.assertEqual(session.get.call_count, 2)
+        session.close.assert_not_called()
+
+    def test_close_and_context_manager(self):
+        login_resp = SimpleNamespace(status_code=200, content=b"ok", text='{"token":"abc123"}')
+        first, second = MagicMock(), MagicMock()
+        first.post.return_value = login_resp
+
+        with patch("design_pattern.identify.ingestlist_identifier.RemoteSession", side_effect=[first, second]):
+            with IngestListIdentifier(self.make_cfg()) as il:
+                pass
+            first.close.assert_called_once()
+
+            # a closed identifier opens a new session on the next request
+            second.get.return_value = SimpleNamespace(status_code=200, content=json.dumps({"id": 1}))
+            il.check_task_status("1")
+            second.get.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
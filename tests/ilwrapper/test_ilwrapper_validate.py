@@ -16,12 +16,10 @@ class TestILWrapperValidate(unittest.TestCase):
             proxies=None,
         )
 
-    def make_context_session(self, response):
-        """Create a MagicMock that behaves like ILWrapperSession in a context manager returning given response on post."""
+    def make_session(self, *responses):
+        """Create a MagicMock for the identifier's pooled session returning the given responses on post, in order."""
         sess = MagicMock()
-        sess.__enter__.return_value = sess
-        sess.__exit__.return_value = False
-        sess.post.return_value = response
+        sess.post.side_effect = list(responses)
         return sess
 
     def mock_open_binary(self, data: bytes = b"DATA"):
@@ -40,16 +38,15 @@ class TestILWrapperValidate(unittest.TestCase):
         payload = {"status": "ok", "jobId": "v123"}
         validate_resp = SimpleNamespace(status_code=200, content=json.dumps(payload))
 
-        session_login = self.make_context_session(login_resp)
-        session_create = self.make_context_session(validate_resp)
+        session = self.make_session(login_resp, validate_resp)
 
         with patch("builtins.open", self.mock_open_binary(b"file-bytes")):
             with patch(
                 "design_pattern.identify.ingestlist_identifier.RemoteSession",
-                side_effect=[session_login, session_create],
+                return_value=session,
             ):
-                il = IngestListIdentifier(cfg)  # consumes login session
-                il.validate("/path/to/file.pdf", IngestListJobType.LOCAL)  # consumes create session
+                il = IngestListIdentifier(cfg)  # first post: login
+                il.validate("/path/to/file.pdf", IngestListJobType.LOCAL)  # second post: create
 
         self.assertEqual(getattr(il, "_IngestListIdentifier__response"), payload)
 
@@ -59,13 +56,12 @@ class TestILWrapperValidate(unittest.TestCase):
         login_resp = SimpleNamespace(status_code=200, content=b"ok", text='{"token":"tkn"}')
         error_resp = SimpleNamespace(status_code=422, content=b"unprocessable")
 
-        session_login = self.make_context_session(login_resp)
-        session_create = self.make_context_session(error_resp)
+        session = self.make_session(login_resp, error_resp)
 
         with patch("builtins.open", self.mock_open_binary(b"file-bytes")):
             with patch(
                 "design_pattern.identify.ingestlist_identifier.RemoteSession",
-                side_effect=[session_login, session_create],
+                return_value=session,
             ):
                 il = IngestListIdentifier(cfg)
                 with self.assertRaises(Exception) as ctx:
@@ -81,12 +77,11 @@ class TestILWrapperValidate(unittest.TestCase):
         payload = {"status": "queued", "jobId": "r789"}
         validate_resp = SimpleNamespace(status_code=200, content=json.dumps(payload))
 
-        session_login = self.make_context_session(login_resp)
-        session_create = self.make_context_session(validate_resp)
+        session = self.make_session(login_resp, validate_resp)
 
         with patch(
             "design_pattern.identify.ingestlist_identifier.RemoteSession",
-            side_effect=[session_login, session_create],
+            return_value=session,
         ):
             il = IngestListIdentifier(cfg)
             il.validate("remote-file.pdf", IngestListJobType.REMOTE)
@@ -99,12 +94,11 @@ class TestILWrapperValidate(unittest.TestCase):
         login_resp = SimpleNamespace(status_code=200, content=b"ok", text='{"token":"abc"}')
         error_resp = SimpleNamespace(status_code=500, content=b"server error")
 
-        session_login = self.make_context_session(login_resp)
-        session_create = self.make_context_session(error_resp)
+        session = self.make_session(login_resp, error_resp)
 
         with patch(
             "design_pattern.identify.ingestlist_identifier.RemoteSession",
-            side_effect=[session_login, session_create],
+            return_value=session,
         ):
             il = IngestListIdentifier(cfg)
             with self.assertRaises(Exception) as ctx:
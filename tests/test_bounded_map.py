@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+
+from design_pattern.utils import bounded_map
+
+
+class TestBoundedMap(unittest.TestCase):
+    def test_bounded_and_in_completion_order(self):
+        running = 0
+        max_running = 0
+
+        async def run(delay: float) -> float:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(delay)
+            running -= 1
+            return delay
+
+        async def items():
+            for delay in (0.05, 0.01, 0.03, 0.0, 0.02):
+                yield delay
+
+        async def collect(source):
+            return [result async for result in bounded_map(run, source, max_concurrency=2)]
+
+        self.assertEqual(sorted(asyncio.run(collect(items()))), [0.0, 0.01, 0.02, 0.03, 0.05])
+        self.assertEqual(max_running, 2)
+        # the first (slowest) item finishes after the ones the other worker ran meanwhile
+        self.assertEqual(asyncio.run(collect([0.05, 0.01, 0.01]))[-1], 0.05)
+
+    def test_closed_early_cancels_and_stops_reading(self):
+        pulled = 0
+        cancelled = 0
+
+        def items():
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield i
+
+        async def run(i: int) -> int:
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(0.01 if i == 0 else 1)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return i
+
+        async def first():
+            results = bounded_map(run, items(), max_concurrency=3)
+            value = await anext(results)
+            await results.aclose()
+            return value
+
+        self.assertEqual(asyncio.run(first()), 0)
+        self.assertEqual(cancelled, 3)
+        self.assertEqual(pulled, 4)
+
+    def test_errors_are_raised_after_the_others(self):
+        def items():
+            yield 1
+            yield 2
+            raise ValueError("unreadable")
+
+        async def run(i: int) -> int:
+            return i
+
+        async def collect():
+            results = []
+            with self.assertRaises(ValueError):
+                async for result in bounded_map(run, items(), max_concurrency=2):
+                    results.append(result)
+            return results
+
+        self.assertEqual(sorted(asyncio.run(collect())), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
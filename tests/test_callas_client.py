@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from xml.sax.saxutils import escape
+
+import httpx
+import pytest
+from lxml import etree as LET
+
+from design_pattern.models.callas_soap import AsyncCallasClient, SoapEnvelope, ExtExecuteRequestBuilder, \
+    ExtExecuteResultStreamReader
+from design_pattern.models.callas_soap._utils import _parse_console_out
+from design_pattern.models.callas_soap.envelope import SoapFault
+
+RESULT = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/" '
+    'xmlns:ns="http://callassoftware.com/cws.xsd"><SOAP-ENV:Body><ns:extExecuteResult>'
+    '<consoleOut>{console}</consoleOut><returnCode>{code}</returnCode>'
+    '</ns:extExecuteResult></SOAP-ENV:Body></SOAP-ENV:Envelope>'
+)
+FAULT = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"><SOAP-ENV:Body>'
+    '<SOAP-ENV:Fault><faultcode>SOAP-ENV:Server</faultcode><faultstring>{message}</faultstring>'
+    '</SOAP-ENV:Fault></SOAP-ENV:Body></SOAP-ENV:Envelope>'
+)
+
+
+class CallasHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server: CallasServer = self.server
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        server.requests.append(body)
+        args = [a.text or "" for a in LET.fromstring(body).iterfind(".//args/args")]
+        with server.lock:
+            server.inflight += 1
+            server.max_inflight = max(server.max_inflight, server.inflight)
+        try:
+            time.sleep(server.delay)
+        finally:
+            with server.lock:
+                server.inflight -= 1
+
+        if args[-1].startswith("fault"):
+            status, xml = 500, FAULT.format(message=escape(args[-1]))
+        elif args[-1].startswith("busy"):
+            status, xml = 503, ""
+        else:
+            console = "\n".join(f"Arg\t{a}" for a in args) + f"\nHits\t{server.hits}" * server.hits
+            status, xml = 200, RESULT.format(console=escape(console).replace("\n", "&#xA;"), code=0)
+        data = xml.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class CallasServer(ThreadingHTTPServer):
+    """
+    Stand-in für den callas SOAP-Server: antwortet mit den Argumenten als consoleOut, mit einem
+    Fault für Eingaben "fault..." und mit 503 für "busy...". Zählt gleichzeitige Aufrufe.
+    """
+    daemon_threads = True
+
+    def __init__(self, delay: float = 0.02):
+        super().__init__(("127.0.0.1", 0), CallasHandler)
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.inflight = 0
+        self.max_inflight = 0
+        self.requests = []
+        self.hits = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+
+@pytest.fixture
+def server():
+    server = CallasServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+FIXED = ["--noprogress", "--nosummary", "--nohits", "--outputfolder=/mnt/ingest/output"]
+
+
+@pytest.mark.asyncio
+async def test_execute(server):
+    async with AsyncCallasClient(server.url, fixed_args=FIXED) as client:
+        result = await client.execute("/mnt/ingest/a & b.pdf")
+
+    assert result.return_code == 0
+    assert result.console_out.splitlines() == [f"Arg\t{a}" for a in FIXED + ["/mnt/ingest/a & b.pdf"]]
+    expected = ExtExecuteRequestBuilder().add_args(*FIXED, "/mnt/ingest/a & b.pdf").build_xml(pretty=False)
+    assert server.requests == [expected.encode("utf-8")]
+
+
+@pytest.mark.asyncio
+async def test_execute_raises_fault(server):
+    async with AsyncCallasClient(server.url, fixed_args=FIXED) as client:
+        with pytest.raises(SoapFault) as fault:
+            await client.execute("fault.pdf")
+        assert fault.value.message == "fault.pdf"
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.execute("busy.pdf")
+
+
+@pytest.mark.asyncio
+async def test_execute_many_bounded(server):
+    inputs = [[f"/mnt/ingest/{i}.pdf"] for i in range(12)] + [["fault.pdf"], ["busy.pdf"]]
+
+    async def arg_lists():
+        for args in inputs:
+            yield args
+
+    async with AsyncCallasClient(server.url, max_concurrency=3, fixed_args=FIXED) as client:
+        results = [r async for r in client.execute_many(arg_lists())]
+
+    assert sorted(r.args[0] for r in results) == sorted(args[0] for args in inputs)
+    by_input = {r.args[0]: r for r in results}
+    assert all(by_input[f"/mnt/ingest/{i}.pdf"].result.console_out.endswith(f"/{i}.pdf") for i in range(12))
+    assert isinstance(by_input["fault.pdf"].error, SoapFault)
+    assert isinstance(by_input["busy.pdf"].error, httpx.HTTPStatusError)
+    assert sum(r.success for r in results) == 12
+    assert 1 < server.max_inflight <= 3
+
+
+@pytest.mark.asyncio
+async def test_execute_many_closed_early(server):
+    async with AsyncCallasClient(server.url, max_concurrency=2, fixed_args=FIXED) as client:
+        results = client.execute_many([f"/mnt/ingest/{i}.pdf"] for i in range(100))
+        first = await anext(results)
+        await results.aclose()
+        assert first.success
+        # die abgebrochenen Aufrufe belegen keinen Slot mehr
+        assert (await client.execute("/mnt/ingest/last.pdf")).return_code == 0
+    await asyncio.sleep(0.05)
+    assert len(server.requests) < 10
+
+
+@pytest.mark.asyncio
+async def test_execute_streaming(server):
+    server.hits = 1000
+    lines = []
+    async with AsyncCallasClient(server.url, fixed_args=FIXED) as client:
+        reader = await client.execute_streaming("/mnt/ingest/a.pdf", sink=lines.append)
+        assert reader.payload.return_code == 0
+        assert lines[:2] == ["Arg\t--noprogress", "Arg\t--nosummary"]
+        assert len(lines) == len(FIXED) + 1 + 1000
+
+        reader = await client.execute_streaming("/mnt/ingest/a.pdf")
+        expected = (await client.execute("/mnt/ingest/a.pdf")).console_out
+        assert reader.console_map == _parse_console_out(expected)
+        assert len(reader.console_map["Hits"]) == 1000
+
+        with pytest.raises(SoapFault):
+            await client.execute_streaming("fault.pdf")
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.execute_streaming("busy.pdf")
+
+
+def test_stream_reader_memory():
+    head = RESULT.split("{console}")[0].encode("utf-8")
+    tail = RESULT.split("{console}")[1].format(code=3).encode("utf-8")
+    line = b"Hit\t" + b"x" * 90 + b"&#xA;"
+
+    def chunks():
+        yield head
+        for _ in range(200):
+            yield line * 1000  # 200 x ~100 KB
+        yield tail
+
+    count = 0
+
+    def sink(text):
+        nonlocal count
+        count += 1
+
+    tracemalloc.start()
+    reader = ExtExecuteResultStreamReader.read(chunks(), sink=sink)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert reader.payload.return_code == 3
+    assert count == 200 * 1000
+    # die ~20 MB consoleOut liegen nie ganz im Speicher
+    assert peak < 2_000_000
+
+
+def test_stream_reader_fault_early():
+    fault = FAULT.format(message="kaputt").encode("utf-8")
+    # ohne das Ende des Envelopes: der Fault wird geworfen, sobald er vollständig ist
+    with pytest.raises(SoapFault) as e:
+        ExtExecuteResultStreamReader.read([fault[:fault.index(b"</SOAP-ENV:Body>")]])
+    assert e.value.message == "kaputt"
+
+
+def test_stream_reader_field_after_return_code():
+    xml = RESULT.format(console="Pages\t3", code=5).replace(
+        "</returnCode>", "</returnCode><hint>7</hint><hint><detail>8</detail></hint>")
+    reader = ExtExecuteResultStreamReader.read(xml.encode("utf-8"))
+    assert reader.payload.return_code == 5
+    assert reader.console_map == {"Pages": "3"}
@@ -2,7 +2,8 @@ import unittest
 from textwrap import dedent
 from lxml import etree as LET
 
-from design_pattern.models.callas_soap import ExtExecuteRequestBuilder
+from design_pattern.models.callas_soap import ExtExecuteRequestBuilder, ExtExecuteArgsPayload, SoapEnvelope, \
+    ExtExecuteRequestTemplate
 
 
 class CallasSOAPBuilder(unittest.TestCase):
@@ -49,6 +50,34 @@ class CallasSOAPBuilder(unittest.TestCase):
             LET.tostring(exp, method="c14n"),
         )
 
+    def test_envelope_without_round_trip(self):
+        payload = ExtExecuteArgsPayload(user_id=None, args=["--nohits", "", "/mnt/in/ä & <b>.pdf"])
+
+        class ElementOnlyPayload:
+            # Payload, das nur das stdlib-Element liefert
+            def to_element(self):
+                return payload.to_element()
+
+        for pretty in (False, True):
+            xml = SoapEnvelope(payload=payload).to_xml(pretty=pretty)
+            self.assertEqual(xml, SoapEnvelope(payload=ElementOnlyPayload()).to_xml(pretty=pretty))
+            self.assertTrue(xml.startswith('<?xml version="1.0" encoding="UTF-8"?>\n<SOAP-ENV:Envelope'))
+            self.assertIn("<userID></userID>", xml)
+            self.assertIn("<args>/mnt/in/ä &amp; &lt;b&gt;.pdf</args>", xml)
+
+    def test_template(self):
+        fixed = ["--noprogress", "--nosummary", "--nohits", "--outputfolder=/mnt/ingest/out & <b>"]
+        template = ExtExecuteRequestBuilder().with_user(None).add_args(*fixed).build_template()
+
+        for args in (("/mnt/ingest/a.pdf",), ("/mnt/ä & <b> \"q\" 'z'\r\n\t.pdf", ""), ()):
+            expected = ExtExecuteRequestBuilder().with_user(None).add_args(*fixed, *args).build_xml(pretty=False)
+            self.assertEqual(template.build_xml(*args), expected)
+            self.assertEqual(template.build_bytes(*args), expected.encode("utf-8"))
+
+        with self.assertRaises(ValueError):
+            template.build_xml("/mnt/\x01.pdf")
+        with self.assertRaises(ValueError):
+            ExtExecuteRequestTemplate(user_id="u1").build_bytes()
 
 
 if __name__ == '__main__':
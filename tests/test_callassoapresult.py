@@ -0,0 +1,56 @@
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+
+from design_pattern.models.callas_soap import ExtExecuteResultReader, ExtExecuteResultStreamReader, \
+    ExtExecuteResultPayload
+from design_pattern.models.callas_soap import payloads
+
+RESPONSE = (
+    '<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/" '
+    'xmlns:ns="http://callassoftware.com/cws.xsd"><SOAP-ENV:Body><ns:extExecuteResult><consoleOut>'
+    '&#xA;ProcessID\t4711&#xA;Input\t/mnt/ingest/a.pdf&#xA;Output\t/mnt/ingest/output/a.pdf&#xA;'
+    'Output\t/mnt/ingest/output/a.xml&#xA;PDFA\tPDF/A-2b&#xA;pages\t12&#xA;Duration\t01:02:03&#xA;'
+    '</consoleOut><returnCode>0</returnCode></ns:extExecuteResult></SOAP-ENV:Body></SOAP-ENV:Envelope>'
+)
+
+
+class CallasSOAPResult(unittest.TestCase):
+    def test_typed_properties(self):
+        reader = ExtExecuteResultReader.from_xml(RESPONSE)
+
+        self.assertTrue(reader.success)
+        self.assertEqual(reader.process_id, 4711)
+        self.assertEqual(reader.pages, 12)
+        self.assertEqual(reader.input_path, "/mnt/ingest/a.pdf")
+        # wiederholte Schlüssel: der erste Wert, console_map hat alle
+        self.assertEqual(reader.output_path, "/mnt/ingest/output/a.pdf")
+        self.assertEqual(reader.console_map["Output"], ["/mnt/ingest/output/a.pdf", "/mnt/ingest/output/a.xml"])
+        self.assertEqual(reader.pdfa, "PDF/A-2b")
+        self.assertEqual(reader.duration, timedelta(hours=1, minutes=2, seconds=3))
+
+        # aus dem Streaming-Reader, ohne console_out
+        streamed = ExtExecuteResultStreamReader.read(RESPONSE.encode("utf-8")).payload
+        self.assertIsNone(streamed.console_out)
+        self.assertEqual((streamed.pages, streamed.duration), (reader.pages, reader.duration))
+
+    def test_console_parsed_once(self):
+        payload = ExtExecuteResultReader.from_xml(RESPONSE).payload
+        with patch.object(payloads, "_parse_console_out", wraps=payloads._parse_console_out) as parse:
+            for _ in range(3):
+                self.assertEqual(payload.pages, 12)
+                self.assertEqual(payload.input_path, "/mnt/ingest/a.pdf")
+                self.assertEqual(len(payload.console_map), 6)
+            parse.assert_called_once()
+
+    def test_missing_values(self):
+        payload = ExtExecuteResultPayload(console_out="Pages\tviele", return_code=1)
+        self.assertFalse(payload.success)
+        self.assertIsNone(payload.pages)
+        self.assertIsNone(payload.duration)
+        self.assertIsNone(ExtExecuteResultPayload().process_id)
+        self.assertEqual(ExtExecuteResultPayload().console_map, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
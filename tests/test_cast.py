@@ -0,0 +1,116 @@
+import csv
+import os
+import unittest
+from dataclasses import dataclass, fields
+
+from design_pattern.identify import IngestListTaskResponse, IngestListTaskState
+from design_pattern.models import DroidCsvModel
+from design_pattern.utils import Cast
+from tests import TESTDATA_PATH
+
+
+@dataclass
+class Point:
+    x: int
+    y: int = 0
+
+
+@dataclass
+class Shape:
+    name: str = ''
+    closed: bool = False
+    scale: float = 1.0
+    state: IngestListTaskState = IngestListTaskState.Pending
+    points: list = None
+    size: tuple = None
+    origin: Point = None
+
+
+class TestCast(unittest.TestCase):
+    def setUp(self):
+        Cast.clear_cache()
+
+    def testPlanIsCached(self):
+        plan = Cast.plan(DroidCsvModel)
+        self.assertIs(plan, Cast.plan(DroidCsvModel))
+        self.assertEqual(plan['puid'][0], 'puid')
+
+        Cast.clear_cache()
+        self.assertIsNot(plan, Cast.plan(DroidCsvModel))
+
+    def testCaseInsensitiveKeys(self):
+        csv_fname = os.path.join(TESTDATA_PATH, 'droid_results.csv')
+        with open(csv_fname, newline="") as f:
+            row = next(csv.DictReader(f))
+        mod = Cast(row, DroidCsvModel)
+        self.assertEqual(mod.Id, '2')
+        self.assertEqual(mod.status, 'Done')
+        self.assertIsNone(mod.puid)
+
+    def testFieldTypesAreConverted(self):
+        res = IngestListTaskResponse.from_dict({'ID': '7', 'Status': 3, 'filename': b'a.pdf', 'error': None})
+        self.assertEqual(res.id, 7)
+        self.assertEqual(res.status, IngestListTaskState.Completed)
+        self.assertEqual(res.filename, 'a.pdf')
+        self.assertEqual(res.error, '')
+
+    def testManyMatchesSingleCast(self):
+        csv_fname = os.path.join(TESTDATA_PATH, 'droid_results.csv')
+        with open(csv_fname, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(Cast.many(rows, DroidCsvModel), [Cast(row, DroidCsvModel) for row in rows])
+
+    def testManyColumns(self):
+        csv_fname = os.path.join(TESTDATA_PATH, 'droid_results.csv')
+        with open(csv_fname, newline="") as f:
+            cols = Cast.many(csv.DictReader(f), DroidCsvModel, columns=True)
+        self.assertEqual(list(cols), [f.name for f in fields(DroidCsvModel)])
+        self.assertEqual(len(cols['puid']), 12)
+        self.assertEqual(cols['puid'][:2], [None, 'fmt/116'])
+        self.assertEqual(cols['size'][1], '4977654')
+
+    def testManyConvertsAndFillsDefaults(self):
+        rows = [{'id': '1', 'status': 'Completed', 'error': 'null'}, {'id': 2, 'status': 4, 'error': 'boom'}]
+        res = Cast.many(rows, IngestListTaskResponse)
+        self.assertEqual(res, [IngestListTaskResponse.from_dict(row) for row in rows])
+
+        cols = Cast.many(rows, IngestListTaskResponse, columns=True)
+        self.assertEqual(cols['id'], [1, 2])
+        self.assertEqual(cols['status'], [IngestListTaskState.Completed, IngestListTaskState.Failed])
+        self.assertEqual(cols['error'], ['', 'boom'])
+        self.assertEqual(cols['filename'], ['', ''])
+
+    def testManyEmpty(self):
+        self.assertEqual(Cast.many([], DroidCsvModel), [])
+        self.assertEqual(Cast.many(iter([]), DroidCsvModel, columns=True)['puid'], [])
+
+    def testUnknownKeyRaises(self):
+        with self.assertRaises(ValueError):
+            Cast({'unknown': '1'}, DroidCsvModel)
+        with self.assertRaises(ValueError):
+            Cast.many([{'unknown': '1'}], DroidCsvModel)
+
+    def testPlanConvertsEveryKindOfField(self):
+        dto = {'name': b'tri', 'closed': 'True', 'scale': 'null', 'state': 'Running', 'points': '[1, 2]',
+               'size': '(3, 4)', 'origin': '{"x": "5"}'}
+        shape = Cast(dto, Shape)
+        self.assertEqual(shape, Shape('tri', True, 1.0, IngestListTaskState.Running, [1, 2], (3, 4), Point(5)))
+        self.assertEqual(Cast.many([dto], Shape), [shape])
+        with self.assertRaises(ValueError):
+            Cast({'scale': 'wide'}, Shape)
+
+    def testManyMissingRequiredFieldRaises(self):
+        rows = [{'x': '1', 'y': '2'}, {'y': '3'}, {'x': 'null'}]
+        for row in rows[1:]:
+            with self.assertRaises(ValueError):
+                Cast(row, Point)
+        for part in (rows[1:2], rows[2:]):
+            with self.assertRaises(ValueError):
+                Cast.many(rows[:1] + part, Point)
+            with self.assertRaises(ValueError):
+                Cast.many(rows[:1] + part, Point, columns=True)
+        self.assertEqual(Cast.many(rows[:1], Point), [Point(1, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
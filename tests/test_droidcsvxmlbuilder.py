@@ -1,5 +1,6 @@
 import csv
 import os
+import tempfile
 import unittest
 
 from design_pattern.xmlformats import DroidCsvXmlBuilder
@@ -23,3 +24,31 @@ class TestXmlBuilder(unittest.TestCase):
         # creat an object and the csv_fname is read by processing the constructor
         xml_builder = DroidCsvXmlBuilder(self.__CSV_FNAME, self.__RESULT_FNAME)
         xml_builder.build()
+
+    def testXmlBuilderStreamingMatchesDom(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            dom_fname = os.path.join(tmp, 'dom.xml')
+            stream_fname = os.path.join(tmp, 'stream.xml')
+
+            DroidCsvXmlBuilder(self.__CSV_FNAME, dom_fname).build()
+            stream_builder = DroidCsvXmlBuilder(self.__CSV_FNAME, stream_fname, streaming=True)
+            stream_builder.build()
+
+            with open(dom_fname, 'rb') as f_dom, open(stream_fname, 'rb') as f_stream:
+                self.assertEqual(f_dom.read(), f_stream.read())
+            # rows are not kept in streaming mode
+            self.assertEqual(stream_builder.get_data(), [])
+
+    def testXmlBuilderStreamingEmptyCsv(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_fname = os.path.join(tmp, 'empty.csv')
+            with open(self.__CSV_FNAME, newline="") as f_in, open(csv_fname, 'w', newline="") as f_out:
+                f_out.write(f_in.readline())
+
+            dom_fname = os.path.join(tmp, 'dom.xml')
+            stream_fname = os.path.join(tmp, 'stream.xml')
+            DroidCsvXmlBuilder(csv_fname, dom_fname).build()
+            DroidCsvXmlBuilder(csv_fname, stream_fname, streaming=True).build()
+
+            with open(dom_fname, 'rb') as f_dom, open(stream_fname, 'rb') as f_stream:
+                self.assertEqual(f_dom.read(), f_stream.read())
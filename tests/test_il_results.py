@@ -0,0 +1,250 @@
+import io
+import os
+import pickle
+import tempfile
+import tracemalloc
+import unittest
+from unittest.mock import patch
+import xml.etree.ElementTree as ET
+
+from design_pattern.xmlformats import il_results
+from design_pattern.xmlformats import parse_il_results, iter_il_results, parse_il_results_many, IlResultsCache, \
+    ByteCount, Stats, Datei, LazyDateien, \
+    FileInfo, Jhove, MediaInfo
+from tests import IL_RESULTS_FNAME, make_il_results
+
+
+class TestIlResults(unittest.TestCase):
+    def test_iter_matches_parse(self):
+        expected = parse_il_results(IL_RESULTS_FNAME)
+        with iter_il_results(IL_RESULTS_FNAME) as reader:
+            self.assertEqual(reader.result.worker, 'identify')
+            self.assertEqual(reader.result.version, '7.2.0')
+            self.assertEqual(reader.result.start, expected.start)
+            dateien = list(reader)
+
+        self.assertEqual(dateien, expected.datei_liste.dateien)
+        self.assertEqual(dateien[0].droid.result.puid, 'fmt/214')
+
+    def test_children_in_any_order(self):
+        el = ET.fromstring('<byte-count><cr>2</cr><unknown>9</unknown><lf>1</lf><cr>3</cr>'
+                           '<zeichenformat> utf-8 </zeichenformat></byte-count>')
+        bc = ByteCount.from_element(el)
+        # the first child of a tag wins, like el.find()
+        self.assertEqual((bc.lf, bc.cr, bc.tab, bc.zeichenformat), (1, 2, None, 'utf-8'))
+
+        stats = Stats.from_element(ET.fromstring('<stats status="finished"><md5>abc</md5></stats>'))
+        self.assertEqual(stats, Stats(status='finished', md5='abc'))
+
+    def test_numbers_with_units(self):
+        el = ET.fromstring('<mediainfo><Audio-bit-rate>1 411 kb/s</Audio-bit-rate><Audio-channels>2 channels'
+                           '</Audio-channels><Audio-duration>3 min 25 s</Audio-duration><Audio-sampling-rate>'
+                           '44.1 kHz</Audio-sampling-rate><General-duration>00:03:25.120</General-duration>'
+                           '<General-overall-bit-rate>1411200</General-overall-bit-rate><Video-bit-rate>5 parsecs'
+                           '</Video-bit-rate><Video-duration>205.000</Video-duration><Video-frame-rate>29.970 '
+                           '(30000/1001) FPS</Video-frame-rate><Video-height>1 080 pixels</Video-height>'
+                           '<Video-width></Video-width></mediainfo>')
+        self.assertEqual(MediaInfo.from_element(el), MediaInfo(
+            audio_bit_rate=1411000, audio_channels=2, audio_duration=205.0, audio_sampling_rate=44100.0,
+            general_duration=205.12, general_overall_bit_rate=1411200, video_duration=205.0,
+            video_frame_rate=29.97, video_height=1080))
+
+        stats = Stats.from_element(ET.fromstring('<stats><filesize>-3</filesize><lastmod>26 210 ms</lastmod>'
+                                                 '<created>NaN</created></stats>'))
+        self.assertEqual((stats.filesize, stats.lastmod, stats.created), (-3, 26210, None))
+        self.assertEqual(il_results._number_unit('1 920 pixels'), (1920, 'pixels'))
+        self.assertIsNone(il_results._number_unit('abc12'))
+
+    def test_lazy_converts_on_access(self):
+        data = make_il_results(5)
+        expected = parse_il_results(data)
+
+        with patch.object(Datei, 'from_element', wraps=Datei.from_element) as from_element:
+            result = parse_il_results(data, lazy=True)
+            self.assertIsInstance(result.datei_liste.dateien, LazyDateien)
+            self.assertEqual(len(result.datei_liste.dateien), 5)
+            self.assertEqual(from_element.call_count, 0)
+
+            self.assertEqual(result.datei_liste.dateien[3].filename, 'file3.xlsx')
+            self.assertIs(result.datei_liste.dateien[3], result.datei_liste.dateien[-2])
+            self.assertEqual(from_element.call_count, 1)
+
+            self.assertEqual(result, expected)
+            self.assertEqual(from_element.call_count, 5)
+
+    @unittest.skipIf(il_results.LET is None, 'lxml is not installed')
+    def test_lxml_parity(self):
+        expected = parse_il_results(IL_RESULTS_FNAME, use_lxml=False)
+        self.assertEqual(parse_il_results(IL_RESULTS_FNAME, use_lxml=True), expected)
+        with open(IL_RESULTS_FNAME, 'rb') as f:
+            data = f.read()
+        self.assertEqual(parse_il_results(data, use_lxml=True), expected)
+        self.assertEqual(parse_il_results(data.decode('utf-8'), use_lxml=True), expected)
+
+    def test_fallback_without_lxml(self):
+        expected = parse_il_results(IL_RESULTS_FNAME)
+        with patch.object(il_results, 'LET', None):
+            self.assertEqual(parse_il_results(IL_RESULTS_FNAME), expected)
+            with self.assertRaises(ImportError):
+                parse_il_results(IL_RESULTS_FNAME, use_lxml=True)
+
+    def test_compact_entries(self):
+        dateien = parse_il_results(make_il_results(2)).datei_liste.dateien
+        self.assertFalse(hasattr(dateien[0], '__dict__'))
+        self.assertFalse(hasattr(dateien[0].stats.byte_count, '__dict__'))
+        # repeated values are one string object
+        self.assertIs(dateien[0].droid.result.puid, dateien[1].droid.result.puid)
+        self.assertIs(dateien[0].file.version, dateien[1].file.version)
+
+    def test_columns(self):
+        data = make_il_results(3)
+        # one entry without <stats> and an empty <droid>
+        data = data.replace(b'<datei errors="0" filename="file1.xlsx" status="finished">',
+                            b'<datei errors="2" filename="file1.xlsx" status="failed"><droid status="failed"/>', 1)
+        root = ET.fromstring(data)
+        entry = root.find('datei-liste')[1]
+        entry.remove(entry.find('stats'))
+        entry.remove(entry.findall('droid')[1])
+        data = ET.tostring(root)
+
+        table = parse_il_results(data).to_table()
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(list(table['errors']), [0, 2, 0])
+        self.assertEqual(table['droid.status'], ['finished', 'failed', 'finished'])
+        self.assertEqual(table['droid.result.puid'], ['fmt/214', None, 'fmt/214'])
+        self.assertEqual(table.to_pydict()['stats.filesize'], [26210, None, 26210])
+        self.assertEqual(sum(table.values('stats.filesize')), 2 * 26210)
+        self.assertEqual(table.value_counts('status'), {'finished': 2, 'failed': 1})
+        self.assertNotIn('x_pictool_metaex.extracted_tags', table.column_names)
+
+        # straight from the streaming parser, without Datei objects
+        with patch.object(Datei, 'from_element') as from_element:
+            streamed = iter_il_results(data).to_table()
+            from_element.assert_not_called()
+        self.assertEqual(streamed.to_pydict(), table.to_pydict())
+
+    def test_fields(self):
+        data = make_il_results(3)
+        full = parse_il_results(data).datei_liste.dateien
+        selected = {'droid', 'stats.md5', 'jhove.valid'}
+
+        dateien = parse_il_results(data, fields=selected).datei_liste.dateien
+        self.assertEqual(list(iter_il_results(data, fields=selected)), dateien)
+        self.assertEqual(parse_il_results(data, lazy=True, fields=selected).datei_liste.dateien, dateien)
+        for datei, expected in zip(dateien, full):
+            # the <datei> attributes are always read
+            self.assertEqual((datei.errors, datei.filename, datei.status),
+                             (expected.errors, expected.filename, expected.status))
+            self.assertEqual(datei.droid, expected.droid)
+            self.assertEqual(datei.stats, Stats(md5=expected.stats.md5))
+            self.assertEqual(datei.jhove, Jhove(valid=expected.jhove.valid))
+            self.assertEqual(datei.file, FileInfo())
+
+        # a field without a child table is converted as a whole
+        metaex = parse_il_results(data, fields={'x_pictool_metaex.extracted_tags'}).datei_liste.dateien[0]
+        self.assertEqual(metaex.x_pictool_metaex, full[0].x_pictool_metaex)
+
+        for unknown in ({'nope'}, {'stats.nope'}, {'stats.md5.nope'}):
+            with self.assertRaises(ValueError):
+                parse_il_results(data, fields=unknown)
+            with self.assertRaises(ValueError):
+                iter_il_results(data, fields=unknown)
+
+    def test_fields_columns(self):
+        data = make_il_results(3)
+        selected = {'stats.md5', 'droid.result'}
+        table = parse_il_results(data).to_table(fields=selected)
+        self.assertEqual(table.column_names,
+                         ['errors', 'filename', 'status', 'stats.md5', 'droid.result.mimetype',
+                          'droid.result.typename', 'droid.result.puid', 'droid.result.x_version',
+                          'droid.result.method'])
+        self.assertEqual(table['droid.result.puid'], ['fmt/214'] * 3)
+        self.assertEqual(iter_il_results(data, fields=selected).to_table().to_pydict(), table.to_pydict())
+
+    def test_iter_sources(self):
+        data = make_il_results(3)
+        expected = parse_il_results(data).datei_liste.dateien
+        self.assertEqual(len(expected), 3)
+        self.assertEqual(list(iter_il_results(data)), expected)
+        self.assertEqual(list(iter_il_results(data.decode('utf-8'))), expected)
+        self.assertEqual(list(iter_il_results(io.BytesIO(data))), expected)
+
+    def test_iter_memory_stays_flat(self):
+        data = make_il_results(300)
+
+        tracemalloc.start()
+        count = sum(1 for _ in iter_il_results(data))
+        _, streaming_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        # lxml allocates outside of the Python heap, tracemalloc would not see its tree
+        parse_il_results(data, use_lxml=False)
+        _, parse_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(count, 300)
+        # the input was allocated before tracing, only the tree and the dataclasses count
+        self.assertLess(streaming_peak, parse_peak / 10)
+
+    def test_parse_many(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(5):
+                paths.append(os.path.join(tmp, f'il_results{i}.xml'))
+                with open(paths[-1], 'wb') as f:
+                    f.write(make_il_results(i + 1))
+            expected = [(path, parse_il_results(path)) for path in paths]
+
+            self.assertEqual(list(parse_il_results_many(paths, workers=2, chunksize=2)), expected)
+            unordered = parse_il_results_many(paths, workers=2, ordered=False)
+            self.assertCountEqual(unordered, expected)
+            selected = list(parse_il_results_many(paths, workers=2, fields={'stats.md5'}))
+            self.assertEqual(selected[4][1], parse_il_results(paths[4], fields={'stats.md5'}))
+
+            with self.assertRaises(ValueError):
+                list(parse_il_results_many(paths, fields={'nope'}))
+            with self.assertRaises(OSError):
+                list(parse_il_results_many([os.path.join(tmp, 'missing.xml')], workers=1))
+
+    def test_packed_results(self):
+        result = parse_il_results(make_il_results(3))
+        packed = il_results._pack(result)
+        self.assertEqual(il_results._unpack(il_results.IdentifyResult, packed), result)
+        self.assertLess(len(pickle.dumps(packed)), len(pickle.dumps(result)))
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'il_results.xml')
+            with open(path, 'wb') as f:
+                f.write(make_il_results(3))
+            expected = parse_il_results(path)
+
+            for cache in (IlResultsCache(), IlResultsCache(os.path.join(tmp, 'cache'))):
+                self.assertEqual(parse_il_results(path, cache=cache), expected)
+                self.assertTrue(os.path.exists(cache.entry_path(path)))
+                with patch.object(il_results.IdentifyResult, 'from_element') as from_element:
+                    self.assertEqual(parse_il_results(path, cache=cache), expected)
+                    from_element.assert_not_called()
+                self.assertEqual(parse_il_results(path, cache=cache, fields={'stats.md5'}),
+                                 parse_il_results(path, fields={'stats.md5'}))
+                self.assertEqual(cache.stats(), {'hits': 1, 'misses': 2})
+
+            cache = IlResultsCache()
+            # a changed file is parsed again
+            with open(path, 'wb') as f:
+                f.write(make_il_results(4))
+            self.assertEqual(len(parse_il_results(path, cache=cache).datei_liste.dateien), 4)
+            # as is a corrupt entry or one of another schema
+            with open(cache.entry_path(path), 'r+b') as f:
+                f.truncate(il_results._CACHE_HEADER.size + 10)
+            self.assertEqual(len(parse_il_results(path, cache=cache).datei_liste.dateien), 4)
+            with patch.object(il_results, '_schema_digest', return_value=b'0' * 16):
+                self.assertEqual(len(parse_il_results(path, cache=cache).datei_liste.dateien), 4)
+            self.assertEqual(cache.stats(), {'hits': 0, 'misses': 3})
+            # written again with the current schema
+            parse_il_results(path, cache=cache)
+            self.assertEqual(len(parse_il_results(path, cache=cache).datei_liste.dateien), 4)
+            self.assertEqual(cache.stats(), {'hits': 1, 'misses': 4})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import asyncio
+import os
+import unittest
+
+import httpx
+from urllib3 import encode_multipart_formdata
+
+from design_pattern.utils import MultipartFileStream, AsyncMultipartFileStream
+from tests import TESTDATA_PATH
+
+
+class TestMultipartFileStream(unittest.TestCase):
+    __FNAME = os.path.join(TESTDATA_PATH, 'il_results.xml')
+
+    def expected(self, boundary: str) -> bytes:
+        with open(self.__FNAME, 'rb') as f:
+            data = f.read()
+        # what requests sends for data={'type': 'Identify'}, files={'file': (name, data, ...)}
+        body, _ = encode_multipart_formdata(
+            [('type', 'Identify'), ('file', (self.__FNAME, data, "multipart/form-data"))], boundary=boundary)
+        return body
+
+    def testSameBytesAsRequests(self):
+        with open(self.__FNAME, 'rb') as f:
+            body = MultipartFileStream(f, filename=self.__FNAME, fields={'type': 'Identify'}, chunk_size=1024)
+            chunks = list(body)
+
+            self.assertEqual(b''.join(chunks), self.expected(body.boundary))
+            self.assertEqual(len(body), len(self.expected(body.boundary)))
+            self.assertTrue(all(len(c) <= 1024 for c in chunks[1:-1]))
+            self.assertEqual(body.content_type, f'multipart/form-data; boundary={body.boundary}')
+            # a second iteration (e.g. a retry) sends the whole body again
+            self.assertEqual(b''.join(body), b''.join(chunks))
+
+    def testAsyncSameBytes(self):
+        async def collect(body):
+            return [c async for c in body]
+
+        with open(self.__FNAME, 'rb') as f:
+            body = AsyncMultipartFileStream(f, filename=self.__FNAME, fields={'type': 'Identify'}, chunk_size=1024)
+            chunks = asyncio.run(collect(body))
+
+        self.assertEqual(b''.join(chunks), self.expected(body.boundary))
+        self.assertTrue(all(len(c) <= 1024 for c in chunks[1:-1]))
+
+    def testHttpxSendsAsyncStreamWithLength(self):
+        received = {}
+
+        async def handler(request: httpx.Request):
+            received['headers'] = request.headers
+            received['body'] = b''.join([c async for c in request.stream])
+            return httpx.Response(200, json={'id': 1})
+
+        async def send(body):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                headers = {'Content-Type': body.content_type, 'Content-Length': str(len(body))}
+                return await client.post('http://example.com/api/create', headers=headers, content=body)
+
+        with open(self.__FNAME, 'rb') as f:
+            body = AsyncMultipartFileStream(f, filename=self.__FNAME, fields={'type': 'Identify'})
+            resp = asyncio.run(send(body))
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(received['body'], self.expected(body.boundary))
+        self.assertEqual(received['headers']['Content-Length'], str(len(received['body'])))
+        self.assertNotIn('Transfer-Encoding', received['headers'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import os
 import unittest
 
 from design_pattern.models import DroidCsvModel
+from design_pattern.utils import Cast
 from tests import TESTDATA_PATH
 
 class TestReadCSVFile(unittest.TestCase):
@@ -15,4 +16,11 @@ class TestReadCSVFile(unittest.TestCase):
             reader = csv.DictReader(f)
             for row in reader:
                 mod =  DroidCsvModel.from_dict(row)
-                print(mod)
\ No newline at end of file
+                print(mod)
+
+    def testReadCSVFileMany(self):
+        csv_fname = os.path.join(TESTDATA_PATH, 'droid_results.csv')
+        with open(csv_fname, newline="") as f:
+            mods = Cast.many(csv.DictReader(f), DroidCsvModel)
+        self.assertEqual(len(mods), 12)
+        self.assertEqual(mods[1].puid, 'fmt/116')
@@ -0,0 +1,73 @@
+import hashlib
+import os
+import tempfile
+import unittest
+
+from design_pattern.utils import MemoryResultCache, SqliteResultCache, file_digest, result_cache_key
+from tests import TESTDATA_PATH
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResultCache(unittest.TestCase):
+    def test_file_digest_is_md5_of_content(self):
+        path = os.path.join(TESTDATA_PATH, 'droid_results.csv')
+        with open(path, 'rb') as f:
+            expected = hashlib.md5(f.read()).hexdigest()
+        self.assertEqual(file_digest(path, chunk_size=100), expected)
+        self.assertNotEqual(result_cache_key(expected, 'identify', '1'), result_cache_key(expected, 'identify', '2'))
+
+    def test_memory_lru_eviction_and_stats(self):
+        cache = MemoryResultCache(max_entries=2)
+        cache.put('a', {'v': 1})
+        cache.put('b', {'v': 2})
+        self.assertEqual(cache.get('a'), {'v': 1})
+        cache.put('c', {'v': 3})
+
+        # b was the least recently used
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), {'v': 3})
+        self.assertEqual(cache.stats(), {'hits': 2, 'misses': 1, 'size': 2})
+
+    def test_memory_ttl(self):
+        clock = FakeClock()
+        cache = MemoryResultCache(ttl=10, clock=clock)
+        cache.put('a', {'v': 1})
+        clock.now += 5
+        self.assertEqual(cache.get('a'), {'v': 1})
+        clock.now += 6
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
+    def test_sqlite_persists_evicts_and_expires(self):
+        clock = FakeClock()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.db')
+            with SqliteResultCache(path, max_entries=2, ttl=100, clock=clock) as cache:
+                cache.put('a', {'status': 'Completed', 'id': 1})
+                clock.now += 1
+                cache.put('b', {'id': 2})
+                clock.now += 1
+                self.assertEqual(cache.get('a'), {'status': 'Completed', 'id': 1})
+                clock.now += 1
+                cache.put('c', {'id': 3})
+                self.assertIsNone(cache.get('b'))
+                self.assertEqual(len(cache), 2)
+
+            with SqliteResultCache(path, max_entries=2, ttl=100, clock=clock) as cache:
+                self.assertEqual(cache.get('c'), {'id': 3})
+                clock.now += 200
+                self.assertIsNone(cache.get('a'))
+                self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'size': 1})
+                cache.clear()
+                self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()